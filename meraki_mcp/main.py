@@ -1,8 +1,12 @@
+import contextlib
 import logging
 
 from mcp.server.fastmcp import FastMCP
 
-from meraki_mcp.services.meraki_client import MerakiClient
+from meraki_mcp.services.cache_warmup import start_cache_warmup
+from meraki_mcp.services.client_registry import MerakiClientRegistry
+from meraki_mcp.services.performance_stats import start_stats_logging
+from meraki_mcp.services.sdk_catalog import preload_catalog
 from meraki_mcp.settings import ApiSettings
 from meraki_mcp.tools.commonly_used_api_tools import CommonlyUsedMerakiApiTools
 from meraki_mcp.tools.meraki_api_tools import MerakiApiTools
@@ -12,32 +16,43 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 env = ApiSettings()
-mcp: FastMCP = FastMCP("Meraki MCP")
+meraki_client = MerakiClientRegistry(default_api_key=env.MERAKI_API_KEY, settings=env)
 
-meraki_client = MerakiClient(api_key=env.MERAKI_API_KEY)
+
+@contextlib.asynccontextmanager
+async def lifespan(_server: FastMCP):
+    # Runs once the server's event loop is up (per session on HTTP transports;
+    # the background tasks themselves only ever start once)
+    if env.MERAKI_API_KEY:
+        start_cache_warmup(meraki_client, env)
+    start_stats_logging(meraki_client, env)
+    if meraki_api_tools.enabled:
+        meraki_api_tools.start_index_build()
+    yield {}
+
+
+mcp: FastMCP = FastMCP("Meraki MCP", lifespan=lifespan)
+
+tools_enabled = bool(env.MERAKI_API_KEY) or env.MULTI_TENANT
 
 meraki_api_tools = MerakiApiTools(
-    mcp, meraki_client, enabled=bool(env.MERAKI_API_KEY), settings=env
+    mcp, meraki_client, enabled=tools_enabled, settings=env
 )
 meraki_complex_api_tools = MerakiComplexApiTools(
-    mcp, meraki_client, enabled=bool(env.MERAKI_API_KEY)
+    mcp, meraki_client, enabled=tools_enabled
 )
 commonly_used_meraki_api_tools = CommonlyUsedMerakiApiTools(
-    mcp, meraki_client, enabled=bool(env.MERAKI_API_KEY)
+    mcp, meraki_client, enabled=tools_enabled
 )
 
 
-def main():
-    # Log Meraki SDK version and available top-level sections for visibility
+def _log_sdk_sections():
+    """Log the SDK version and top-level sections (opt-in; builds the SDK client)"""
     try:
         dashboard = meraki_client.get_dashboard()
-        try:
-            import meraki as _meraki
-
-            logger.info(f"Meraki SDK version: {_meraki.__version__}")
-        except Exception:
-            pass
+        import meraki as _meraki
 
+        logger.info(f"Meraki SDK version: {_meraki.__version__}")
         sections = [
             attr
             for attr in dir(dashboard)
@@ -48,6 +63,16 @@ def main():
         logger.info(f"Meraki API sections discovered: {sorted(sections)[:20]}")
     except Exception as e:
         logger.warning(f"Unable to enumerate Meraki API sections at startup: {e}")
+
+
+def main():
+    # Startup stays free of SDK construction and network calls; the dashboard
+    # is built lazily on the first tool call
+    if env.MCP_LOG_SECTIONS:
+        _log_sdk_sections()
+    # Reading a persisted SDK catalog is cheap and does not import the SDK
+    if preload_catalog(env.SDK_CATALOG_DIR):
+        logger.info("Loaded persisted Meraki SDK catalog")
     mcp.run()
 
 
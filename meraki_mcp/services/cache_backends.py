@@ -0,0 +1,485 @@
+"""Shared tiers that sit behind the in-memory ResponseCache.
+
+A backend stores serialized responses with a TTL and may be shared by
+several processes: a SQLite file (survives restarts), the same SQLite
+store on /dev/shm (workers on one host), or a Redis server (replicas on
+different hosts). Backend failures are logged and treated as misses so a
+cache outage never fails a tool call.
+
+Entries are raw SDK responses (secrets included, before any redaction), so
+the SQLite files are created readable by their owner only.
+
+Backends also index entries by tag, so a write in one process (or before a
+restart) invalidates the shared copies of every read it affects.
+"""
+
+import abc
+import getpass
+import logging
+import os
+import socket
+import sqlite3
+import stat
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, TypeVar
+from urllib.parse import unquote, urlparse
+
+from meraki_mcp.settings import ApiSettings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_SQLITE_PATH = "~/.cache/meraki-mcp/responses.sqlite3"
+SHM_DIR = "/dev/shm"
+SHM_FILENAME = "cache.sqlite3"
+RETRY_SECONDS = 5.0
+
+
+class CacheBackend(abc.ABC):
+    """Key/value store for serialized responses with per-entry TTL and tags"""
+
+    name = "backend"
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """Return the value and its remaining TTL in seconds, if still fresh"""
+
+    @abc.abstractmethod
+    def set(self, key: str, value: str, ttl: float, tags: Iterable[str] = ()): ...
+
+    @abc.abstractmethod
+    def delete(self, key: str): ...
+
+    @abc.abstractmethod
+    def invalidate(self, tags: Iterable[str]) -> Set[str]:
+        """Delete every entry stored with any of the tags; returns their keys"""
+
+    @abc.abstractmethod
+    def clear(self): ...
+
+    def sweep(self) -> int:
+        """Remove expired entries; backends that expire on their own return 0"""
+        return 0
+
+    def stats(self) -> Dict:
+        return {"backend": self.name}
+
+    def close(self):
+        pass
+
+
+def _check_owner(path: Path, st: os.stat_result):
+    """Refuse symlinks and paths another user could have planted"""
+    foreign = hasattr(os, "getuid") and st.st_uid != os.getuid()
+    if stat.S_ISLNK(st.st_mode) or foreign:
+        raise PermissionError(f"Refusing cache path {path}: not owned by this user")
+
+
+def _private_dir(path: Path):
+    """Create (or adopt) a directory only its owner can enter"""
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = os.lstat(path)
+    _check_owner(path, st)
+    if st.st_mode & 0o077:
+        os.chmod(path, 0o700)
+
+
+def _private_file(path: Path):
+    """Create the file 0600, or adopt an existing one this user owns"""
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    except FileExistsError:
+        st = os.lstat(path)
+        _check_owner(path, st)
+        if st.st_mode & 0o077:
+            os.chmod(path, 0o600)
+    else:
+        os.close(fd)
+
+
+class SqliteCacheBackend(CacheBackend):
+    """Cache tier kept in a SQLite file so it survives restarts.
+
+    Expiry uses wall-clock time because monotonic clocks restart with the
+    process. Expired rows are ignored on read and removed by sweep(). The
+    file is created 0600 (SQLite gives its -wal and -shm files the same mode)
+    and an existing file owned by another user is refused.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        _private_file(self.path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, timeout=1.0
+        )
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS response_tags ("
+                "tag TEXT NOT NULL, key TEXT NOT NULL, PRIMARY KEY (tag, key))"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS response_tags_key ON response_tags (key)"
+            )
+        self.hits = 0
+        self.errors = 0
+
+    def _run(self, operation: Callable[[], T], default: T) -> T:
+        """Run a statement under the lock; SQLite errors are logged as misses"""
+        with self._lock:
+            try:
+                return operation()
+            except sqlite3.Error as e:
+                self.errors += 1
+                logger.warning(f"Cache file {self.path} unavailable: {e}")
+                return default
+
+    def _write(self, *statements: Tuple[str, Tuple]) -> int:
+        """Run statements in one transaction; returns the last one's row count"""
+        rowcount = 0
+        with self._conn:
+            for sql, params in statements:
+                rowcount = self._conn.execute(sql, params).rowcount
+        return rowcount
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        row = self._run(
+            lambda: self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone(),
+            None,
+        )
+        if row is None:
+            return None
+        remaining = row[1] - time.time()
+        if remaining <= 0:
+            return None
+        self.hits += 1
+        return row[0], remaining
+
+    def set(self, key: str, value: str, ttl: float, tags: Iterable[str] = ()):
+        self._run(
+            lambda: self._write(
+                (
+                    "INSERT OR REPLACE INTO responses (key, value, expires_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, value, time.time() + ttl),
+                ),
+                ("DELETE FROM response_tags WHERE key = ?", (key,)),
+                *(
+                    ("INSERT INTO response_tags (tag, key) VALUES (?, ?)", (tag, key))
+                    for tag in set(tags)
+                ),
+            ),
+            0,
+        )
+
+    def delete(self, key: str):
+        self._run(
+            lambda: self._write(
+                ("DELETE FROM responses WHERE key = ?", (key,)),
+                ("DELETE FROM response_tags WHERE key = ?", (key,)),
+            ),
+            0,
+        )
+
+    def invalidate(self, tags: Iterable[str]) -> Set[str]:
+        tags = list(tags)
+        if not tags:
+            return set()
+        selected = (
+            "SELECT key FROM response_tags "
+            f"WHERE tag IN ({', '.join('?' * len(tags))})"
+        )
+
+        def delete_tagged() -> Set[str]:
+            with self._conn:
+                keys = {key for (key,) in self._conn.execute(selected, tags)}
+                self._conn.execute(
+                    f"DELETE FROM responses WHERE key IN ({selected})", tags
+                )
+                self._conn.execute(
+                    f"DELETE FROM response_tags WHERE key IN ({selected})", tags
+                )
+            return keys
+
+        return self._run(delete_tagged, set())
+
+    def clear(self):
+        self._run(
+            lambda: self._write(
+                ("DELETE FROM responses", ()), ("DELETE FROM response_tags", ())
+            ),
+            0,
+        )
+
+    def sweep(self) -> int:
+        now = time.time()
+        return self._run(
+            lambda: self._write(
+                (
+                    "DELETE FROM response_tags WHERE key IN "
+                    "(SELECT key FROM responses WHERE expires_at <= ?)",
+                    (now,),
+                ),
+                ("DELETE FROM responses WHERE expires_at <= ?", (now,)),
+            ),
+            0,
+        )
+
+    def stats(self) -> Dict:
+        row = self._run(
+            lambda: self._conn.execute("SELECT COUNT(*) FROM responses").fetchone(),
+            None,
+        )
+        return {
+            "backend": self.name,
+            "path": str(self.path),
+            "entries": row[0] if row else None,
+            "hits": self.hits,
+            "errors": self.errors,
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class SharedMemoryCacheBackend(SqliteCacheBackend):
+    """SQLite store on tmpfs, shared by the host's worker processes of one user.
+
+    The default location is a per-user 0700 directory, so other local users
+    can neither read the responses nor pre-create the file.
+    """
+
+    name = "shm"
+
+    def __init__(self, path: str = ""):
+        if not path:
+            root = SHM_DIR if Path(SHM_DIR).is_dir() else tempfile.gettempdir()
+            owner = os.getuid() if hasattr(os, "getuid") else getpass.getuser()
+            directory = Path(root) / f"meraki-mcp-{owner}"
+            _private_dir(directory)
+            path = str(directory / SHM_FILENAME)
+        super().__init__(path)
+
+
+class RespError(Exception):
+    """Error reply from a Redis-protocol server"""
+
+
+class RespConnection:
+    """Minimal blocking RESP2 client: enough for strings, sorted sets and SCAN"""
+
+    def __init__(self, host: str, port: int, timeout: float):
+        self._sock = socket.create_connection((host, port), timeout=timeout)
+        self._reader = self._sock.makefile("rb")
+
+    @staticmethod
+    def _encode(args) -> bytes:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        return b"".join(parts)
+
+    def _read_reply(self):
+        line = self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection closed by cache server")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload.decode("utf-8")
+        if kind == b"-":
+            return RespError(payload.decode("utf-8"))
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if kind == b"*":
+            count = int(payload)
+            if count < 0:
+                return None
+            return [self._read_reply() for _ in range(count)]
+        raise ConnectionError(f"Unexpected reply from cache server: {line!r}")
+
+    def pipeline(self, *commands) -> List:
+        """Send several commands in one round trip and return their replies"""
+        self._sock.sendall(b"".join(self._encode(c) for c in commands))
+        replies = [self._read_reply() for _ in commands]
+        for reply in replies:
+            if isinstance(reply, RespError):
+                raise reply
+        return replies
+
+    def execute(self, *args):
+        return self.pipeline(args)[0]
+
+    def close(self):
+        try:
+            self._reader.close()
+            self._sock.close()
+        except OSError:
+            pass
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache tier on any server speaking the Redis protocol (Redis, Valkey, ...)
+
+    Each tag is a sorted set of the keys stored with it, scored by their
+    expiry time in epoch milliseconds; members past it are trimmed whenever
+    the tag gains a key.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, timeout: float = 0.5, prefix: str = "meraki-mcp:"):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self.prefix = prefix
+        self._conn: RespConnection | None = None
+        self._lock = threading.Lock()
+        # After a failure the server is skipped for a while instead of paying
+        # a connect timeout on every lookup
+        self._retry_at = 0.0
+        self.hits = 0
+        self.errors = 0
+
+    def _connection(self) -> RespConnection:
+        if self._conn is None:
+            conn = RespConnection(self.host, self.port, self.timeout)
+            try:
+                if self.password:
+                    conn.execute("AUTH", self.password)
+                if self.db:
+                    conn.execute("SELECT", self.db)
+            except Exception:
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
+
+    def _run(self, *commands) -> Optional[List]:
+        with self._lock:
+            if time.monotonic() < self._retry_at:
+                return None
+            try:
+                return self._connection().pipeline(*commands)
+            except (OSError, RespError, ValueError) as e:
+                self.errors += 1
+                self._retry_at = time.monotonic() + RETRY_SECONDS
+                logger.warning(f"Cache server {self.host}:{self.port} unavailable: {e}")
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+                return None
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        key = self.prefix + key
+        replies = self._run(("GET", key), ("PTTL", key))
+        if not replies or replies[0] is None or replies[1] <= 0:
+            return None
+        self.hits += 1
+        return replies[0].decode("utf-8"), replies[1] / 1000
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def set(self, key: str, value: str, ttl: float, tags: Iterable[str] = ()):
+        ttl_ms = max(1, int(ttl * 1000))
+        now_ms = int(time.time() * 1000)
+        commands: List[Tuple] = [("SET", self.prefix + key, value, "PX", ttl_ms)]
+        for tag in set(tags):
+            commands.append(("ZREMRANGEBYSCORE", self._tag_key(tag), "-inf", now_ms))
+            commands.append(("ZADD", self._tag_key(tag), now_ms + ttl_ms, key))
+        self._run(*commands)
+
+    def delete(self, key: str):
+        self._run(("DEL", self.prefix + key))
+
+    def invalidate(self, tags: Iterable[str]) -> Set[str]:
+        tag_keys = [self._tag_key(tag) for tag in set(tags)]
+        if not tag_keys:
+            return set()
+        now_ms = int(time.time() * 1000)
+        replies = self._run(
+            *(("ZRANGEBYSCORE", tag_key, now_ms, "+inf") for tag_key in tag_keys)
+        )
+        if not replies:
+            return set()
+        keys = {member.decode("utf-8") for members in replies for member in members}
+        self._run(("DEL", *tag_keys, *(self.prefix + key for key in keys)))
+        return keys
+
+    def clear(self):
+        cursor = "0"
+        while True:
+            replies = self._run(
+                ("SCAN", cursor, "MATCH", f"{self.prefix}*", "COUNT", 500)
+            )
+            if not replies:
+                return
+            cursor, keys = replies[0]
+            if keys:
+                self._run(("DEL", *keys))
+            cursor = cursor.decode("utf-8")
+            if cursor == "0":
+                return
+
+    def stats(self) -> Dict:
+        return {
+            "backend": self.name,
+            "server": f"{self.host}:{self.port}/{self.db}",
+            "hits": self.hits,
+            "errors": self.errors,
+        }
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def open_cache_backend(settings: ApiSettings) -> Optional[CacheBackend]:
+    """Build the backend selected by CACHE_BACKEND, or None for memory only"""
+    kind = settings.CACHE_BACKEND.lower()
+    if not kind and settings.CACHE_PERSIST_PATH:
+        kind = "sqlite"
+    try:
+        if kind == "sqlite":
+            return SqliteCacheBackend(
+                settings.CACHE_PERSIST_PATH or DEFAULT_SQLITE_PATH
+            )
+        if kind == "shm":
+            return SharedMemoryCacheBackend(settings.CACHE_PERSIST_PATH)
+        if kind == "redis":
+            return RedisCacheBackend(
+                settings.CACHE_REDIS_URL, timeout=settings.CACHE_REDIS_TIMEOUT
+            )
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Cache backend {kind!r} disabled: {e}")
+        return None
+    if kind:
+        logger.warning(f"Unknown CACHE_BACKEND {kind!r}; using memory only")
+    return None
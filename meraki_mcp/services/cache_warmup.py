@@ -0,0 +1,95 @@
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
+
+from meraki_mcp.services.executor import BACKGROUND
+from meraki_mcp.settings import ApiSettings
+
+if TYPE_CHECKING:
+    from meraki_mcp.services.client_registry import MerakiClientRegistry
+    from meraki_mcp.services.meraki_client import MerakiClient
+
+logger = logging.getLogger(__name__)
+
+_warmup_task: Optional[asyncio.Task] = None
+
+
+def warmup_calls(
+    org_ids: Iterable[str], endpoints: Iterable[str]
+) -> List[Tuple[str, str, Dict]]:
+    """Expand "section.method" specs into (section, method, params) calls.
+
+    Organization-level endpoints take just organizationId, which is also how
+    the tools call them, so the warmed entries are the ones later reads hit.
+    getOrganizations takes no parameters and is fetched once.
+    """
+    org_ids = list(org_ids)
+    calls: List[Tuple[str, str, Dict]] = []
+    for spec in endpoints:
+        section, _, method = spec.rpartition(".")
+        if not section or not method:
+            logger.warning(
+                f"Ignoring cache warm-up endpoint {spec!r}; expected section.method"
+            )
+            continue
+        if method == "getOrganizations":
+            calls.append((section, method, {}))
+        else:
+            calls += [
+                (section, method, {"organizationId": org_id}) for org_id in org_ids
+            ]
+    return calls
+
+
+async def warm_cache(
+    client: Union["MerakiClient", "MerakiClientRegistry"],
+    org_ids: Iterable[str],
+    endpoints: Iterable[str],
+) -> Dict:
+    """Fetch the calls into the client's response cache on the background pool.
+
+    Each call waits for its organization's rate-limit token like any other,
+    at background priority, so interactive tool calls made meanwhile go first.
+    Failures are logged and counted but never raised.
+    """
+    calls = warmup_calls(org_ids, endpoints)
+    started = time.monotonic()
+    results = await asyncio.gather(
+        *(
+            client.call(section, method, pool=BACKGROUND, **params)
+            for section, method, params in calls
+        ),
+        return_exceptions=True,
+    )
+    failed = 0
+    for (section, method, params), result in zip(calls, results):
+        if isinstance(result, Exception):
+            failed += 1
+            logger.warning(
+                f"Cache warm-up of {section}.{method} {params} failed: {result}"
+            )
+    summary = {
+        "calls": len(calls),
+        "failed": failed,
+        "seconds": round(time.monotonic() - started, 3),
+    }
+    logger.info(f"Cache warm-up finished: {summary}")
+    return summary
+
+
+def start_cache_warmup(
+    client: Union["MerakiClient", "MerakiClientRegistry"], settings: ApiSettings
+) -> Optional[asyncio.Task]:
+    """Start warm_cache() once per process on the running loop, if configured"""
+    global _warmup_task
+    if _warmup_task is not None:
+        return _warmup_task
+    if not settings.CACHE_WARMUP_ORG_IDS or settings.DISABLE_RESPONSE_CACHE:
+        return None
+    _warmup_task = asyncio.get_running_loop().create_task(
+        warm_cache(
+            client, settings.CACHE_WARMUP_ORG_IDS, settings.CACHE_WARMUP_ENDPOINTS
+        )
+    )
+    return _warmup_task
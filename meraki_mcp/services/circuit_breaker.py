@@ -0,0 +1,188 @@
+import logging
+import time
+from typing import Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an endpoint or org whose circuit is open"""
+
+    def __init__(self, key: str, retry_after: float):
+        self.key = key
+        self.retry_after = retry_after
+        super().__init__(
+            f"Circuit open for {key}; failing fast (retry in {retry_after:.0f}s)"
+        )
+
+
+def error_status(exc: BaseException):
+    status = getattr(exc, "status", None) or getattr(exc, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_breaker_failure(exc: BaseException) -> bool:
+    """Only server-side trouble trips a breaker; 4xx and caller errors do not"""
+    status = error_status(exc)
+    if status is not None:
+        return status >= 500
+    return isinstance(exc, (TimeoutError, OSError))
+
+
+class CircuitBreaker:
+    """Closed -> open after consecutive failures -> half-open probe after a cool-down
+
+    With min_sources above 1 the breaker only opens once the consecutive
+    failures came from that many distinct sources (e.g. endpoints of an org).
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        half_open_max_calls: int = 1,
+        min_sources: int = 1,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.min_sources = min_sources
+        self._sources: Set[str] = set()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self.failures = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        elapsed = time.monotonic() - self._opened_at
+        if self._state == OPEN and elapsed >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    def retry_after(self) -> float:
+        return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self._probes < self.half_open_max_calls:
+            self._probes += 1
+            return True
+        return False
+
+    def release(self):
+        """Give back a half-open probe slot when the call's outcome says nothing"""
+        if self._state == HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def record_success(self):
+        self.failures = 0
+        self._sources.clear()
+        self._probes = 0
+        self._state = CLOSED
+
+    def record_failure(self, source: Optional[str] = None):
+        self.failures += 1
+        if source is not None:
+            self._sources.add(source)
+        tripped = self.failures >= self.failure_threshold and (
+            self.min_sources <= 1 or len(self._sources) >= self.min_sources
+        )
+        if self._state == HALF_OPEN or tripped:
+            self._state = OPEN
+            self._opened_at = time.monotonic()
+            self._probes = 0
+            self.times_opened += 1
+
+    def stats(self) -> Dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "times_opened": self.times_opened,
+            "retry_after_seconds": round(self.retry_after(), 1)
+            if self._state == OPEN
+            else 0.0,
+        }
+
+
+class CircuitBreakerRegistry:
+    """Breakers created on demand per key (e.g. "org:123" or "wireless.getX")
+
+    An org breaker counts which endpoints its failures came from and needs
+    org_min_endpoints distinct ones to open, so a single broken endpoint
+    trips its own breaker without cutting off the rest of the org.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        org_min_endpoints: int = 1,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.org_min_endpoints = org_min_endpoints
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.failure_threshold > 0
+
+    def _get(self, key: str) -> CircuitBreaker:
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                self.failure_threshold,
+                self.reset_timeout,
+                min_sources=self.org_min_endpoints if key.startswith("org:") else 1,
+            )
+            self._breakers[key] = breaker
+        return breaker
+
+    def check(self, keys: Iterable[str]) -> List[str]:
+        """Admit a call through every key's breaker or raise CircuitOpenError"""
+        if not self.enabled:
+            return []
+        admitted: List[str] = []
+        for key in keys:
+            breaker = self._get(key)
+            if not breaker.allow():
+                for admitted_key in admitted:
+                    self._breakers[admitted_key].release()
+                raise CircuitOpenError(key, breaker.retry_after())
+            admitted.append(key)
+        return admitted
+
+    def record(self, keys: Iterable[str], exc: BaseException | None = None):
+        keys = list(keys)
+        endpoint = next((key for key in keys if not key.startswith("org:")), None)
+        for key in keys:
+            breaker = self._get(key)
+            if exc is not None and is_breaker_failure(exc):
+                breaker.record_failure(endpoint)
+                if breaker.state == OPEN:
+                    logger.warning(
+                        f"Circuit open for {key} after {breaker.failures} failures"
+                    )
+            elif exc is None or error_status(exc) is not None:
+                # The upstream answered (possibly with a 4xx), so it is alive
+                breaker.record_success()
+            else:
+                # Cancelled or rejected locally; the call says nothing either way
+                breaker.release()
+
+    def stats(self) -> Dict[str, Dict]:
+        """State of every breaker that is not cleanly closed"""
+        return {
+            key: breaker.stats()
+            for key, breaker in self._breakers.items()
+            if breaker.state != CLOSED or breaker.failures or breaker.times_opened
+        }
@@ -0,0 +1,215 @@
+import asyncio
+import contextlib
+import contextvars
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Dict, Optional, Set, TypeVar
+
+from mcp.server.lowlevel.server import request_ctx
+
+from meraki_mcp.services.meraki_client import (
+    CallResult,
+    MerakiClient,
+    build_call_pools,
+    build_response_cache,
+)
+from meraki_mcp.services.sdk_catalog import SdkCatalog, get_catalog
+from meraki_mcp.settings import ApiSettings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Explicit tenant override, e.g. for background jobs or embedding callers
+current_api_key: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "meraki_api_key", default=None
+)
+
+
+@contextlib.contextmanager
+def use_api_key(api_key: str):
+    """Route MerakiClientRegistry calls made in this context to api_key's tenant"""
+    token = current_api_key.set(api_key)
+    try:
+        yield
+    finally:
+        current_api_key.reset(token)
+
+
+class MerakiClientRegistry:
+    """Multi-tenant front for MerakiClient, keyed by API key.
+
+    Each tenant gets its own lazily built MerakiClient (and with it its own
+    dashboards, rate-limit buckets and cache namespace). Worker pools are
+    shared so the thread count does not grow with the number of tenants.
+    Clients are evicted least-recently-used beyond MAX_TENANT_CLIENTS and
+    after TENANT_IDLE_SECONDS without use; an evicted client that still has
+    calls in flight is closed when the last of them finishes.
+
+    The tenant for a call is taken from use_api_key(), then (with
+    MULTI_TENANT enabled) from the HTTP header TENANT_API_KEY_HEADER of the
+    current MCP request, which multi-tenant HTTP requests must send. Only
+    calls made outside an HTTP request fall back to the default API key.
+    """
+
+    def __init__(self, default_api_key: str = "", settings: ApiSettings | None = None):
+        self.default_api_key = default_api_key
+        self.settings = settings or ApiSettings()
+        self.max_clients = max(1, self.settings.MAX_TENANT_CLIENTS)
+        self.idle_seconds = self.settings.TENANT_IDLE_SECONDS
+        self._pools = build_call_pools(self.settings)
+        self._clients: OrderedDict[str, MerakiClient] = OrderedDict()
+        self._cache = build_response_cache(self.settings)
+        self._last_used: Dict[str, float] = {}
+        # Calls running per client, and evicted clients waiting for theirs
+        self._in_flight: Dict[MerakiClient, int] = {}
+        self._retired: Set[MerakiClient] = set()
+        self.evictions = 0
+
+    def _request_api_key(self) -> Optional[str]:
+        """The tenant header of the current HTTP request.
+
+        Returns None outside an HTTP request (startup, warm-up, stdio) and
+        raises LookupError for an HTTP request that does not send it, so a
+        tenant never falls through to the default key's organizations.
+        """
+        ctx = request_ctx.get(None)
+        headers = getattr(getattr(ctx, "request", None), "headers", None)
+        if headers is None:
+            return None
+        header = self.settings.TENANT_API_KEY_HEADER
+        api_key = headers.get(header) if header else None
+        if not api_key:
+            raise LookupError(f"Multi-tenant requests must send the {header} header")
+        return api_key
+
+    def resolve_api_key(self) -> str:
+        api_key = current_api_key.get()
+        if not api_key and self.settings.MULTI_TENANT:
+            api_key = self._request_api_key()
+        api_key = api_key or self.default_api_key
+        if not api_key:
+            raise LookupError("No Meraki API key available for this request")
+        return api_key
+
+    def get(self, api_key: str) -> MerakiClient:
+        """Return the tenant's client, building it on first use"""
+        now = time.monotonic()
+        self._evict_idle(now)
+        client = self._clients.get(api_key)
+        if client is None:
+            client = MerakiClient(
+                api_key, settings=self.settings, pools=self._pools, cache=self._cache
+            )
+            self._clients[api_key] = client
+            logger.info(f"Registered Meraki tenant {client.cache_namespace}")
+        self._clients.move_to_end(api_key)
+        self._last_used[api_key] = now
+        while len(self._clients) > self.max_clients:
+            oldest = next(iter(self._clients))
+            self._evict(oldest)
+        return client
+
+    def current(self) -> MerakiClient:
+        return self.get(self.resolve_api_key())
+
+    def _evict_idle(self, now: float):
+        if self.idle_seconds <= 0:
+            return
+        for api_key in list(self._clients):
+            if now - self._last_used[api_key] > self.idle_seconds:
+                self._evict(api_key)
+
+    def _evict(self, api_key: str):
+        client = self._clients.pop(api_key)
+        self._last_used.pop(api_key, None)
+        self.evictions += 1
+        logger.info(f"Evicted idle Meraki tenant {client.cache_namespace}")
+        if self._in_flight.get(client):
+            self._retired.add(client)
+        else:
+            self._close(client)
+
+    @staticmethod
+    def _close(client: MerakiClient):
+        try:
+            asyncio.get_running_loop().create_task(client.aclose())
+        except RuntimeError:
+            client.close()
+
+    async def _run(self, client: MerakiClient, call: Awaitable[T]) -> T:
+        """Await one of client's calls, keeping it open until the call is done"""
+        self._in_flight[client] = self._in_flight.get(client, 0) + 1
+        try:
+            return await call
+        finally:
+            remaining = self._in_flight.pop(client) - 1
+            if remaining:
+                self._in_flight[client] = remaining
+            elif client in self._retired:
+                self._retired.discard(client)
+                self._close(client)
+
+    # ----- MerakiClient-compatible surface, routed to the current tenant -----
+    @property
+    def api_key(self) -> str:
+        return self.current().api_key
+
+    @property
+    def cache_namespace(self) -> str:
+        return self.current().cache_namespace
+
+    def get_dashboard(self):
+        return self.current().get_dashboard()
+
+    def get_async_dashboard(self):
+        return self.current().get_async_dashboard()
+
+    def get_catalog(self) -> SdkCatalog:
+        # The SDK surface is the same for every tenant, so no API key is needed
+        return get_catalog(self.settings.SDK_CATALOG_DIR)
+
+    def has_method(self, section: str, method: str) -> bool:
+        return self.current().has_method(section, method)
+
+    async def call(self, section: str, method: str, /, **kwargs):
+        client = self.current()
+        return await self._run(client, client.call(section, method, **kwargs))
+
+    async def fetch(self, section: str, method: str, /, **kwargs) -> CallResult:
+        client = self.current()
+        return await self._run(client, client.fetch(section, method, **kwargs))
+
+    def stats(self, tenant_only: bool = False) -> Dict:
+        """Per-tenant client stats plus the shared pools and cache.
+
+        With tenant_only, only the calling tenant's client is included, so
+        one tenant cannot see another's org ids, queues or breakers.
+        """
+        shared = {
+            "pools": {name: p.stats() for name, p in self._pools.items()},
+            "cache": self._cache.stats(),
+        }
+        if tenant_only:
+            client = self.current()
+            return {"tenants": {client.cache_namespace: client.stats()}, **shared}
+        return {
+            "tenants": {
+                client.cache_namespace: client.stats()
+                for client in self._clients.values()
+            },
+            "tenant_count": len(self._clients),
+            "tenant_evictions": self.evictions,
+            **shared,
+        }
+
+    async def aclose(self):
+        for api_key in list(self._clients):
+            await self._clients.pop(api_key).aclose()
+        while self._retired:
+            await self._retired.pop().aclose()
+        self._last_used.clear()
+        for call_pool in self._pools.values():
+            call_pool.shutdown()
+        self._cache.close()
@@ -0,0 +1,36 @@
+import contextvars
+import time
+from typing import List, Optional
+
+# Deadline of the tool call currently running, if it has one
+current_deadline: contextvars.ContextVar[Optional["Deadline"]] = contextvars.ContextVar(
+    "meraki_deadline", default=None
+)
+
+
+class DeadlineExceeded(Exception):
+    """Raised for a sub-call that could not finish before the tool's deadline"""
+
+    def __init__(self, label: str):
+        self.label = label
+        super().__init__(f"Deadline exceeded before {label} completed")
+
+
+class Deadline:
+    """Overall time budget for one tool call and a record of what it had to skip"""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+        self.skipped: List[str] = []
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def skip(self, label: str) -> DeadlineExceeded:
+        self.skipped.append(label)
+        return DeadlineExceeded(label)
@@ -0,0 +1,144 @@
+import bisect
+import heapq
+import math
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+_WORD_RE = re.compile(r"\b\w+\b")
+
+# BM25 term-frequency saturation and document-length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def query_terms(query: str) -> Set[str]:
+    return set(_WORD_RE.findall(query.lower()))
+
+
+class EndpointIndex:
+    """Inverted index from search keyword to the endpoints generated with it.
+
+    Patterns are stored column-wise (parallel tuples indexed by position)
+    instead of one dict each, and a query only scores the endpoints that
+    share at least one keyword with it, so a search costs time in proportion
+    to the matching postings rather than to the size of the SDK.
+
+    Each posting also carries the keyword's precomputed BM25 weight in that
+    endpoint, so top() ranks the candidates by summing sparse weights. An
+    endpoint's text is its keywords plus its description words, and the
+    description words count again, so name words outweigh synonyms.
+    """
+
+    def __init__(self, patterns: Iterable[Dict]):
+        sections, methods, descriptions, weights, sizes = [], [], [], [], []
+        postings: Dict[str, List[int]] = {}
+        term_counts: List[Dict[str, int]] = []
+        for i, pattern in enumerate(patterns):
+            keywords = set(pattern["keywords"])
+            sections.append(pattern["section"])
+            methods.append(pattern["method"])
+            descriptions.append(pattern["description"])
+            weights.append(pattern["weight"])
+            sizes.append(len(keywords))
+            for keyword in keywords:
+                postings.setdefault(keyword, []).append(i)
+            counts = dict.fromkeys(keywords, 1)
+            for word in pattern["description"].split():
+                counts[word] = counts.get(word, 0) + 1
+            term_counts.append(counts)
+        self.sections: Tuple[str, ...] = tuple(sections)
+        self.methods: Tuple[str, ...] = tuple(methods)
+        self.descriptions: Tuple[str, ...] = tuple(descriptions)
+        self.weights: Tuple[float, ...] = tuple(weights)
+        self.keyword_counts: Tuple[int, ...] = tuple(sizes)
+        self.postings: Dict[str, Tuple[int, ...]] = {
+            keyword: tuple(ids) for keyword, ids in postings.items()
+        }
+        self.bm25: Dict[str, Tuple[float, ...]] = self._bm25_weights(term_counts)
+
+    def _bm25_weights(
+        self, term_counts: List[Dict[str, int]]
+    ) -> Dict[str, Tuple[float, ...]]:
+        """BM25 weight of each posting, aligned with self.postings"""
+        lengths = [sum(counts.values()) for counts in term_counts]
+        average = sum(lengths) / len(lengths) if lengths else 1.0
+        total = len(term_counts)
+        weights = {}
+        for term, ids in self.postings.items():
+            idf = math.log(1 + (total - len(ids) + 0.5) / (len(ids) + 0.5))
+            weights[term] = tuple(
+                idf
+                * term_counts[i][term]
+                * (BM25_K1 + 1)
+                / (
+                    term_counts[i][term]
+                    + BM25_K1 * (1 - BM25_B + BM25_B * lengths[i] / average)
+                )
+                for i in ids
+            )
+        return weights
+
+    def __len__(self) -> int:
+        return len(self.methods)
+
+    def pattern(self, i: int) -> Dict:
+        return {
+            "section": self.sections[i],
+            "method": self.methods[i],
+            "description": self.descriptions[i],
+            "weight": self.weights[i],
+        }
+
+    def _overlaps(self, terms: Set[str]) -> Dict[int, int]:
+        """Number of query terms each candidate endpoint has as keywords"""
+        counts: Dict[int, int] = {}
+        for term in terms:
+            for i in self.postings.get(term, ()):
+                counts[i] = counts.get(i, 0) + 1
+        return counts
+
+    def _score(self, i: int, overlap: int, query_size: int) -> float:
+        """Weighted Jaccard similarity plus a bonus per matching keyword"""
+        union = query_size + self.keyword_counts[i] - overlap
+        jaccard = overlap / union if union else 0.0
+        return min(jaccard * self.weights[i] + min(overlap * 0.1, 0.3), 1.0)
+
+    def confidence(self, i: int, query: str) -> float:
+        """How well endpoint i matches query, on the scale best_match() uses"""
+        terms = query_terms(query)
+        overlap = 0
+        for term in terms:
+            ids = self.postings.get(term, ())
+            at = bisect.bisect_left(ids, i)
+            overlap += at < len(ids) and ids[at] == i
+        return self._score(i, overlap, len(terms))
+
+    def best_match(
+        self, query: str, threshold: float = 0.3
+    ) -> Optional[Tuple[int, float]]:
+        """Position and score of the best endpoint scoring above threshold.
+
+        Ties go to the endpoint generated first, as with a linear scan.
+        """
+        terms = query_terms(query)
+        best: Optional[Tuple[int, float]] = None
+        for i, overlap in sorted(self._overlaps(terms).items()):
+            score = self._score(i, overlap, len(terms))
+            if score > threshold and (best is None or score > best[1]):
+                best = (i, score)
+        return best
+
+    def top(self, query: str, k: int = 5) -> List[Tuple[int, float]]:
+        """The k best (position, score) pairs by BM25, scaled by endpoint weight"""
+        scores: Dict[int, float] = {}
+        for term in query_terms(query):
+            ids = self.postings.get(term)
+            if ids is None:
+                continue
+            for i, weight in zip(ids, self.bm25[term]):
+                scores[i] = scores.get(i, 0.0) + weight
+        return heapq.nlargest(
+            k,
+            ((i, score * self.weights[i]) for i, score in scores.items()),
+            key=lambda item: (item[1], -item[0]),
+        )
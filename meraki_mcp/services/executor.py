@@ -0,0 +1,84 @@
+import asyncio
+import contextlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+# Single-endpoint tools a user is actively waiting on
+INTERACTIVE = "interactive"
+# Sub-calls fanned out by the complex analysis tools
+BULK = "bulk"
+# Cache refreshes and warm-up nobody is waiting on yet
+BACKGROUND = "background"
+
+
+class CallPool:
+    """Bounded concurrency pool for SDK calls with its own worker threads.
+
+    A slot must be held for the whole call; blocking SDK calls then run on the
+    pool's dedicated threads so one workload cannot exhaust another's workers.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self._executor: ThreadPoolExecutor | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
+        self.pending = 0
+        self.active = 0
+        self.completed = 0
+        self.peak_queued = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=f"meraki-{self.name}",
+            )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    @contextlib.asynccontextmanager
+    async def slot(self):
+        """Hold one of the pool's concurrency slots"""
+        self.pending += 1
+        self.peak_queued = max(self.peak_queued, self.pending - self.active)
+        try:
+            async with self._get_semaphore():
+                self.active += 1
+                try:
+                    yield
+                finally:
+                    self.active -= 1
+                    self.completed += 1
+        finally:
+            self.pending -= 1
+
+    async def run_blocking(self, func: Callable):
+        """Run a blocking callable on the pool's dedicated threads"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), func)
+
+    def stats(self) -> Dict:
+        return {
+            "max_workers": self.max_workers,
+            "active": self.active,
+            "queued": self.pending - self.active,
+            "peak_queued": self.peak_queued,
+            "completed": self.completed,
+            "saturation": round(self.active / self.max_workers, 2),
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
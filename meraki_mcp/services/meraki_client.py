@@ -1,19 +1,127 @@
+import asyncio
+import functools
+import hashlib
 import logging
+from typing import TYPE_CHECKING, Any, Dict, NamedTuple, Optional
 
-import meraki
+from meraki_mcp.services.cache_backends import open_cache_backend
+from meraki_mcp.services.circuit_breaker import CircuitBreakerRegistry, error_status
+from meraki_mcp.services.executor import BACKGROUND, BULK, INTERACTIVE, CallPool
+from meraki_mcp.services.rate_limiter import OrgRateLimiter
+from meraki_mcp.services.response_cache import (
+    ResponseCache,
+    invalidation_tags,
+    make_cache_key,
+    resource_tags,
+)
+from meraki_mcp.services.scheduler import PRIORITIES
+from meraki_mcp.services.sdk_catalog import SdkCatalog, get_catalog
+from meraki_mcp.services.singleflight import SingleFlight
+from meraki_mcp.services.ttl_policy import TtlPolicy
+from meraki_mcp.settings import ApiSettings
+
+if TYPE_CHECKING:
+    import meraki
+    import meraki.aio
 
 logger = logging.getLogger(__name__)
 
 
+def build_call_pools(settings: ApiSettings) -> Dict[str, CallPool]:
+    return {
+        INTERACTIVE: CallPool(INTERACTIVE, settings.INTERACTIVE_POOL_SIZE),
+        BULK: CallPool(BULK, settings.BULK_POOL_SIZE),
+        BACKGROUND: CallPool(BACKGROUND, settings.BACKGROUND_POOL_SIZE),
+    }
+
+
+def build_response_cache(settings: ApiSettings) -> ResponseCache:
+    return ResponseCache(
+        max_bytes=settings.CACHE_MAX_BYTES,
+        default_ttl=settings.CACHE_TTL_SECONDS,
+        sweep_interval=settings.CACHE_SWEEP_SECONDS,
+        backend=open_cache_backend(settings),
+        stale_window=settings.CACHE_STALE_SECONDS,
+        compress_min_bytes=settings.CACHE_COMPRESS_MIN_BYTES,
+        memory_ttl=settings.CACHE_MEMORY_TTL_SECONDS,
+    )
+
+
+# Read failures that will fail the same way until something changes: bad
+# parameters, no access, unknown IDs, or a feature the network does not have
+NEGATIVE_STATUSES = (400, 403, 404)
+# Key marking a cached read failure, which no API response contains
+_NEGATIVE_KEY = "__meraki_mcp_error__"
+
+
+class CallResult(NamedTuple):
+    value: Any
+    stale: bool = False
+    age: float = 0.0
+
+
+class CachedAPIError(Exception):
+    """A read failure replayed from the negative cache instead of re-sent"""
+
+    def __init__(self, status: int, reason: Optional[str], message: Any, text: str):
+        self.status = status
+        self.reason = reason
+        self.message = message
+        super().__init__(text)
+
+
 class MerakiClient:
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        settings: ApiSettings | None = None,
+        pools: Dict[str, CallPool] | None = None,
+        cache: ResponseCache | None = None,
+    ):
         self.api_key = api_key
+        self.settings = settings or ApiSettings()
+        self.use_async = self.settings.USE_ASYNC_CLIENT
+        self.rate_limiter = OrgRateLimiter(
+            rate_per_second=self.settings.RATE_LIMIT_PER_ORG,
+            burst=self.settings.RATE_LIMIT_BURST,
+            aging_seconds=self.settings.SCHEDULER_AGING_SECONDS,
+        )
+        # Pools may be shared (e.g. by a multi-tenant registry); only owned ones
+        # are shut down on close
+        self._owns_pools = pools is None
+        self.pools: Dict[str, CallPool] = pools or build_call_pools(self.settings)
+        # Parsed read responses shared by every tool class (and, when passed
+        # in, by every tenant); keys are namespaced per API key
+        self._owns_cache = cache is None
+        self.cache = cache or build_response_cache(self.settings)
+        self.ttl_policy = TtlPolicy.from_settings(self.settings)
+        self._refreshing: Dict[str, asyncio.Future] = {}
+        self.negative_hits = 0
+        self.singleflight = SingleFlight()
+        self.breakers = CircuitBreakerRegistry(
+            failure_threshold=self.settings.CIRCUIT_FAILURE_THRESHOLD,
+            reset_timeout=self.settings.CIRCUIT_RESET_SECONDS,
+            org_min_endpoints=self.settings.CIRCUIT_ORG_MIN_ENDPOINTS,
+        )
         self._dashboard = None
+        self._async_dashboard = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        # Learned from responses so network/device scoped calls hit the right bucket
+        self._network_orgs: Dict[str, str] = {}
+        self._device_networks: Dict[str, str] = {}
+
+    @property
+    def cache_namespace(self) -> str:
+        """Stable, non-reversible tenant prefix for cache keys"""
+        return hashlib.sha256(self.api_key.encode()).hexdigest()[:12]
 
-    def get_dashboard(self) -> meraki.DashboardAPI:
+    def get_dashboard(self) -> "meraki.DashboardAPI":
         """Get or create dashboard API instance with connection reuse"""
         if self._dashboard is None:
             try:
+                # Imported on first use to keep server startup free of SDK cost
+                import meraki
+
                 self._dashboard = meraki.DashboardAPI(
                     api_key=self.api_key,
                     suppress_logging=True,
@@ -25,3 +133,269 @@ class MerakiClient:
                 logger.error(f"Failed to initialize Meraki Dashboard API: {e}")
                 raise
         return self._dashboard
+
+    def get_async_dashboard(self) -> "meraki.aio.AsyncDashboardAPI":
+        """Get or create the asyncio dashboard bound to the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._async_dashboard is None or self._async_loop is not loop:
+            try:
+                import meraki.aio
+
+                self._async_dashboard = meraki.aio.AsyncDashboardAPI(
+                    api_key=self.api_key,
+                    suppress_logging=True,
+                    maximum_retries=3,
+                    wait_on_rate_limit=True,
+                    maximum_concurrent_requests=self.settings.ASYNC_MAX_CONCURRENT_REQUESTS,
+                )
+                self._async_loop = loop
+                logger.info("Meraki async Dashboard API client initialized")
+            except Exception as e:
+                logger.error(f"Failed to initialize Meraki async Dashboard API: {e}")
+                raise
+        return self._async_dashboard
+
+    def get_catalog(self) -> SdkCatalog:
+        """Snapshot of the SDK surface, loaded from disk when available"""
+        return get_catalog(self.settings.SDK_CATALOG_DIR)
+
+    def has_method(self, section: str, method: str) -> bool:
+        """Check whether the installed SDK exposes section.method"""
+        return hasattr(getattr(self.get_dashboard(), section, None), method)
+
+    def resolve_org_id(self, params: Dict) -> Optional[str]:
+        """Best-effort organization lookup used to pick a rate-limit bucket"""
+        if params.get("organizationId"):
+            return str(params["organizationId"])
+        network_id = params.get("networkId")
+        if not network_id and params.get("serial"):
+            network_id = self._device_networks.get(params["serial"])
+        if network_id:
+            return self._network_orgs.get(network_id)
+        return None
+
+    def _learn_org_ids(self, result, params: Dict):
+        """Record network->org and device->network ids seen in a response"""
+        org_id = params.get("organizationId")
+        items = result if isinstance(result, list) else [result]
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            if item.get("organizationId") and "productTypes" in item:
+                self._network_orgs[item["id"]] = item["organizationId"]
+            if item.get("serial") and item.get("networkId"):
+                self._device_networks[item["serial"]] = item["networkId"]
+                # e.g. getOrganizationDevices: the device's network is in the org
+                if org_id:
+                    self._network_orgs.setdefault(item["networkId"], org_id)
+
+    async def call(
+        self, section: str, method: str, /, *, pool: str = INTERACTIVE, **params
+    ):
+        """Invoke section.method without blocking the event loop.
+
+        The call holds a slot in the named pool (interactive, bulk or
+        background) and takes a token from its organization's bucket before it
+        is sent; the pool also sets its priority for that token. In async mode
+        the coroutine from the SDK's asyncio dashboard is awaited directly;
+        otherwise the synchronous SDK call runs on the pool's own threads.
+        Calls to an org or endpoint whose circuit is open fail fast with
+        CircuitOpenError.
+
+        Reads are answered from the shared response cache when possible
+        (callers must not mutate the returned objects), and concurrent
+        identical reads share a single upstream request. Successful writes
+        invalidate the cached reads they affect. Expired entries are never
+        returned here; fetch() serves them, flagged as stale.
+        """
+        result = await self._fetch(section, method, pool, params, allow_stale=False)
+        return result.value
+
+    async def fetch(
+        self, section: str, method: str, /, *, pool: str = INTERACTIVE, **params
+    ) -> CallResult:
+        """Like call(), but may answer from a stale cache entry and says so.
+
+        Within CACHE_STALE_SECONDS after expiry, a cached read is returned as
+        stale and refreshed once in the background. A read that failed with a
+        NEGATIVE_STATUSES error raises CachedAPIError for
+        CACHE_NEGATIVE_TTL_SECONDS afterwards instead of being sent again.
+        """
+        return await self._fetch(section, method, pool, params, allow_stale=True)
+
+    async def _fetch(
+        self, section: str, method: str, pool: str, params: Dict, allow_stale: bool
+    ) -> CallResult:
+        dashboard = (
+            self.get_async_dashboard() if self.use_async else self.get_dashboard()
+        )
+        func = getattr(getattr(dashboard, section), method)
+
+        if not method.startswith("get"):
+            result = await self._invoke(func, section, method, pool, params)
+            await self._invalidate_for_write(section, params)
+            return CallResult(result)
+
+        key = make_cache_key(self.cache_namespace, section, method, params)
+        if self.settings.DISABLE_RESPONSE_CACHE:
+            return CallResult(
+                await self._read(key, func, section, method, pool, params, False)
+            )
+        hit = await self.cache.alookup(key)
+        if (
+            hit is not None
+            and isinstance(hit.value, dict)
+            and _NEGATIVE_KEY in hit.value
+        ):
+            if not hit.stale:
+                self.negative_hits += 1
+                raise CachedAPIError(**hit.value[_NEGATIVE_KEY])
+            hit = None
+        if hit is not None and hit.stale and not allow_stale:
+            # Callers that cannot flag stale data wait for a fresh read
+            hit = None
+        if hit is not None:
+            if hit.stale:
+                self._schedule_refresh(key, func, section, method, params)
+            return CallResult(hit.value, hit.stale, hit.age)
+        return CallResult(
+            await self._read(key, func, section, method, pool, params, True)
+        )
+
+    async def _read(
+        self,
+        key: str,
+        func,
+        section: str,
+        method: str,
+        pool: str,
+        params: Dict,
+        cache: bool,
+    ):
+        """Upstream read, coalesced with identical in-flight reads"""
+
+        async def load():
+            try:
+                result = await self._invoke(func, section, method, pool, params)
+            except Exception as e:
+                if cache:
+                    await self._cache_failure(key, e, section, params)
+                raise
+            if cache:
+                await self.cache.aset(
+                    key,
+                    result,
+                    ttl=self.ttl_policy.ttl_for(section, method),
+                    tags=resource_tags(params, section),
+                )
+            return result
+
+        if self.settings.COALESCE_READS:
+            return await self.singleflight.do(key, load)
+        return await load()
+
+    async def _cache_failure(
+        self, key: str, exc: Exception, section: str, params: Dict
+    ):
+        """Remember a read failure that retrying would only repeat"""
+        status = error_status(exc)
+        ttl = self.settings.CACHE_NEGATIVE_TTL_SECONDS
+        if status not in NEGATIVE_STATUSES or ttl <= 0:
+            return
+        error = {
+            "status": status,
+            "reason": getattr(exc, "reason", None),
+            "message": getattr(exc, "message", None),
+            "text": str(exc),
+        }
+        # Tagged like the read itself, so a write that could fix it clears it
+        await self.cache.aset(
+            key, {_NEGATIVE_KEY: error}, ttl=ttl, tags=resource_tags(params, section)
+        )
+
+    def _schedule_refresh(
+        self, key: str, func, section: str, method: str, params: Dict
+    ):
+        """Refresh a stale entry in the background, at most once per key at a time"""
+        if key in self._refreshing:
+            return
+        task = asyncio.ensure_future(
+            self._read(key, func, section, method, BACKGROUND, params, True)
+        )
+        self._refreshing[key] = task
+        task.add_done_callback(lambda t: self._refresh_done(key, t))
+
+    def _refresh_done(self, key: str, task: asyncio.Future):
+        self._refreshing.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Background refresh failed for {key}: {task.exception()}")
+
+    async def _invalidate_for_write(self, section: str, params: Dict):
+        """Drop cached reads made stale by a successful write"""
+        network_id = params.get("networkId") or self._device_networks.get(
+            params.get("serial", "")
+        )
+        tags = invalidation_tags(
+            params,
+            org_id=self._network_orgs.get(network_id or ""),
+            network_id=network_id,
+            section=section,
+        )
+        removed = await self.cache.ainvalidate(tags)
+        if removed:
+            logger.info(f"Invalidated {removed} cached responses for {', '.join(tags)}")
+
+    async def _invoke(self, func, section: str, method: str, pool: str, params: Dict):
+        call_pool = self.pools[pool]
+        org_id = self.resolve_org_id(params)
+        breaker_keys = [f"{section}.{method}"]
+        if org_id:
+            breaker_keys.append(f"org:{org_id}")
+        admitted = self.breakers.check(breaker_keys)
+
+        try:
+            async with call_pool.slot():
+                await self.rate_limiter.acquire(org_id, PRIORITIES.get(pool, 0))
+                if self.use_async:
+                    result = await func(**params)
+                else:
+                    result = await call_pool.run_blocking(
+                        functools.partial(func, **params)
+                    )
+        except BaseException as e:
+            self.breakers.record(admitted, e)
+            raise
+        self.breakers.record(admitted)
+
+        self._learn_org_ids(result, params)
+        return result
+
+    def stats(self, tenant_only: bool = False) -> Dict:  # noqa: ARG002
+        """Snapshot of client-side scheduling and caching state.
+
+        A client serves a single tenant, so tenant_only changes nothing here.
+        """
+        return {
+            "rate_limiter": self.rate_limiter.stats(),
+            "pools": {name: p.stats() for name, p in self.pools.items()},
+            "singleflight": self.singleflight.stats(),
+            "circuit_breakers": self.breakers.stats(),
+            "negative_cache_hits": self.negative_hits,
+            **({"cache": self.cache.stats()} if self._owns_cache else {}),
+        }
+
+    def close(self):
+        """Release worker threads owned by this client"""
+        if self._owns_pools:
+            for call_pool in self.pools.values():
+                call_pool.shutdown()
+        if self._owns_cache:
+            self.cache.close()
+
+    async def aclose(self):
+        """Release worker threads and the async dashboard's aiohttp session"""
+        self.close()
+        if self._async_dashboard is not None:
+            await self._async_dashboard._session.close()
+            self._async_dashboard = None
+            self._async_loop = None
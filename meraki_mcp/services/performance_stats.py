@@ -0,0 +1,54 @@
+import asyncio
+import json
+import logging
+import time
+from typing import TYPE_CHECKING, Dict, Optional, Union
+
+from meraki_mcp.settings import ApiSettings
+
+if TYPE_CHECKING:
+    from meraki_mcp.services.client_registry import MerakiClientRegistry
+    from meraki_mcp.services.meraki_client import MerakiClient
+
+logger = logging.getLogger(__name__)
+
+# Prefix of the one-line JSON log record, for log pipelines to match on
+LOG_EVENT = "server_performance_stats"
+
+_log_task: Optional[asyncio.Task] = None
+
+
+def collect_performance_stats(
+    client: Union["MerakiClient", "MerakiClientRegistry"], tenant_only: bool = False
+) -> Dict:
+    """Cache, rate-limiter, pool and breaker state, with a capture timestamp.
+
+    Tenants appear under their cache namespace (a hash), never their API key.
+    With tenant_only, a multi-tenant server reports just the calling tenant
+    alongside the shared pool and cache totals.
+    """
+    return {"timestamp": round(time.time(), 3), **client.stats(tenant_only)}
+
+
+def log_performance_stats(stats: Dict):
+    logger.info(f"{LOG_EVENT} {json.dumps(stats, separators=(',', ':'), default=str)}")
+
+
+async def _log_periodically(
+    client: Union["MerakiClient", "MerakiClientRegistry"], interval: float
+):
+    while True:
+        await asyncio.sleep(interval)
+        log_performance_stats(collect_performance_stats(client))
+
+
+def start_stats_logging(
+    client: Union["MerakiClient", "MerakiClientRegistry"], settings: ApiSettings
+) -> Optional[asyncio.Task]:
+    """Log the stats every STATS_LOG_SECONDS on the running loop, once per process"""
+    global _log_task
+    if _log_task is None and settings.STATS_LOG_SECONDS > 0:
+        _log_task = asyncio.get_running_loop().create_task(
+            _log_periodically(client, settings.STATS_LOG_SECONDS)
+        )
+    return _log_task
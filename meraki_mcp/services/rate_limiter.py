@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+
+from meraki_mcp.services.scheduler import PriorityGate
+
+logger = logging.getLogger(__name__)
+
+# Calls that cannot be attributed to an organization share this bucket
+SHARED_BUCKET = "_shared"
+
+
+class TokenBucket:
+    """Async token bucket that grants tokens to the most urgent waiter first"""
+
+    def __init__(self, rate: float, burst: int, aging_seconds: float = 5.0):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._gate = PriorityGate(aging_seconds)
+        self.waiting = 0
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self, priority: int = 0) -> float:
+        """Wait for a token and return the time spent waiting in seconds"""
+        start = time.monotonic()
+        self.waiting += 1
+        try:
+            await self._gate.acquire(priority)
+            try:
+                self._refill()
+                while self._tokens < 1:
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+                    self._refill()
+                self._tokens -= 1
+            finally:
+                self._gate.release()
+        finally:
+            self.waiting -= 1
+
+        waited = time.monotonic() - start
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        return waited
+
+    def stats(self) -> Dict:
+        return {
+            "queue_depth": self.waiting,
+            "acquired": self.acquired,
+            "total_wait_seconds": round(self.total_wait, 3),
+            "avg_wait_ms": round(self.total_wait / self.acquired * 1000, 2)
+            if self.acquired
+            else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 2),
+            **self._gate.stats(),
+        }
+
+
+class OrgRateLimiter:
+    """Per-organization token buckets shared by every call made through a client"""
+
+    def __init__(
+        self, rate_per_second: float = 10.0, burst: int = 10, aging_seconds: float = 5.0
+    ):
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.aging_seconds = aging_seconds
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate_per_second > 0
+
+    def bucket(self, org_id: Optional[str]) -> TokenBucket:
+        key = org_id or SHARED_BUCKET
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.rate_per_second, self.burst, self.aging_seconds)
+            self._buckets[key] = bucket
+        return bucket
+
+    async def acquire(self, org_id: Optional[str], priority: int = 0) -> float:
+        """Block until the organization's budget allows another request.
+
+        When calls queue up, lower priority values are served first (see
+        PriorityGate for how waiting promotes bulk and background calls).
+        """
+        if not self.enabled:
+            return 0.0
+        waited = await self.bucket(org_id).acquire(priority)
+        if waited > 1.0:
+            bucket = org_id or SHARED_BUCKET
+            logger.info(f"Rate limiter delayed call for org {bucket} by {waited:.2f}s")
+        return waited
+
+    def stats(self) -> Dict[str, Dict]:
+        return {org_id: bucket.stats() for org_id, bucket in self._buckets.items()}
@@ -0,0 +1,582 @@
+import asyncio
+import hashlib
+import json
+import logging
+import sys
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from meraki_mcp.services.cache_backends import CacheBackend
+
+try:  # Python 3.14+: zstd is several times faster than zlib at a similar ratio
+    from compression import zstd as _zstd
+except ImportError:
+    _zstd = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_CODEC = "zstd" if _zstd else "zlib"
+
+
+def make_cache_key(namespace: str, section: str, method: str, params: Dict) -> str:
+    """Process-independent key: the endpoint plus a sha256 of the canonical params"""
+    canonical = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return f"{namespace}:{section}.{method}:{digest}"
+
+
+def key_section(key: str) -> str:
+    """The API section of a make_cache_key() key ("" for any other key)"""
+    parts = key.split(":", 2)
+    return parts[1].split(".", 1)[0] if len(parts) == 3 else ""
+
+
+def resource_tags(params: Dict, section: str = "") -> List[str]:
+    """Tags naming the resources a read depends on, for later invalidation.
+
+    Besides the plain org/network/device tags, reads scoped to a whole org or
+    network (not one device or SSID within it) get an extra "/*" tag, and
+    per-SSID reads a "/ssid:<number>" tag, so writes can target them. Reads
+    with none of those ids (e.g. the caller's own API keys) are tagged with
+    their section instead.
+    """
+    org_id = params.get("organizationId")
+    network_id = params.get("networkId")
+    serial = params.get("serial")
+    number = params.get("number")
+    tags = []
+    if org_id:
+        tags.append(f"org:{org_id}")
+        if not network_id and not serial:
+            tags.append(f"org:{org_id}/*")
+    if network_id:
+        tags.append(f"net:{network_id}")
+        if number is not None:
+            tags.append(f"net:{network_id}/ssid:{number}")
+        elif not serial:
+            tags.append(f"net:{network_id}/*")
+    if serial:
+        tags.append(f"dev:{serial}")
+    if not tags and section:
+        tags.append(f"section:{section}")
+    return tags
+
+
+def invalidation_tags(
+    params: Dict,
+    org_id: Optional[str] = None,
+    network_id: Optional[str] = None,
+    section: str = "",
+) -> List[str]:
+    """Tags of the cached reads a successful write makes stale.
+
+    A device write also invalidates its network's and organization's list
+    reads, and a network write its organization's list reads; org_id and
+    network_id supply those parents when the write's own params do not. A
+    write with no ids invalidates the id-less reads of its section, and one
+    naming several networks in networkIds invalidates each of them.
+    """
+    serial = params.get("serial")
+    network_id = params.get("networkId") or network_id
+    number = params.get("number")
+    tags = []
+    if serial:
+        tags.append(f"dev:{serial}")
+        if network_id:
+            tags.append(f"net:{network_id}/*")
+        if org_id:
+            tags.append(f"org:{org_id}/*")
+    elif network_id:
+        if number is not None:
+            tags += [f"net:{network_id}/ssid:{number}", f"net:{network_id}/*"]
+        else:
+            tags.append(f"net:{network_id}")
+        if org_id:
+            tags.append(f"org:{org_id}/*")
+    elif params.get("organizationId"):
+        tags.append(f"org:{params['organizationId']}")
+    elif section:
+        tags.append(f"section:{section}")
+    tags += [f"net:{net_id}" for net_id in params.get("networkIds") or ()]
+    return tags
+
+
+class CacheEntry:
+    __slots__ = (
+        "value",
+        "stored_at",
+        "expires_at",
+        "stale_until",
+        "recheck_at",
+        "size",
+    )
+
+    def __init__(
+        self,
+        value: Any,
+        stored_at: float,
+        expires_at: float,
+        stale_until: float,
+        recheck_at: float,
+        size: int,
+    ):
+        self.value = value
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+        self.recheck_at = recheck_at
+        self.size = size
+
+
+def object_size(value: Any) -> int:
+    """Memory held by a parsed response: every container, key and leaf object.
+
+    Objects referenced more than once (e.g. interned strings) count once.
+    """
+    size = 0
+    seen: Set[int] = set()
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+    return size
+
+
+class Packed(NamedTuple):
+    """A large value held compressed in memory until it is hit"""
+
+    codec: str
+    data: bytes
+    raw_size: int
+
+
+def _compress(encoded: str) -> Packed:
+    raw = encoded.encode("utf-8")
+    if _zstd is not None:
+        return Packed("zstd", _zstd.compress(raw), len(raw))
+    return Packed("zlib", zlib.compress(raw, 1), len(raw))
+
+
+def _decompress(packed: Packed) -> Any:
+    if packed.codec == "zstd":
+        raw = _zstd.decompress(packed.data)
+    else:
+        raw = zlib.decompress(packed.data)
+    return json.loads(raw)
+
+
+class CacheHit(NamedTuple):
+    value: Any
+    age: float
+    stale: bool
+
+
+class ResponseCache:
+    """In-memory cache of parsed API responses bounded by a byte budget.
+
+    Values are kept as the Python objects the SDK returned and are shared by
+    every caller, so they must be treated as read-only. An entry's size is
+    the memory its parsed objects take (see object_size), several times the
+    length of the compact JSON encoding a backend stores.
+
+    Entries are fresh for their TTL and, with a stale_window, may still be
+    served as stale for that long afterwards (see lookup()). They are evicted
+    least-recently-used once the total size would exceed max_bytes, and
+    dropped by a periodic sweep once past both.
+
+    Entries whose encoding reaches compress_min_bytes are held compressed
+    (zstd where the stdlib has it, zlib otherwise) and decoded again on each
+    hit, so those hits return a fresh copy. 0 disables compression.
+
+    With a backend (see cache_backends), writes go to both tiers and memory
+    misses are filled from the backend, so entries outlive a restart or are
+    shared with other processes, depending on the backend. The a-prefixed
+    methods (alookup(), aset(), ainvalidate()) do the same but run backend
+    I/O on a worker thread, for callers on the event loop. Memory serves an
+    entry for at most memory_ttl before reading the backend again, which
+    bounds how long writes and invalidations by other processes go unseen.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        default_ttl: float,
+        sweep_interval: float = 60.0,
+        backend: CacheBackend | None = None,
+        stale_window: float = 0.0,
+        compress_min_bytes: int = 0,
+        memory_ttl: float = 5.0,
+    ):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.sweep_interval = sweep_interval
+        self.backend = backend
+        self.stale_window = max(0.0, stale_window)
+        self.compress_min_bytes = compress_min_bytes
+        self.memory_ttl = max(0.0, memory_ttl)
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._sweeper: asyncio.Task | None = None
+        # tag -> keys, and key -> (tags, monotonic time it can no longer be served)
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._key_tags: Dict[str, Tuple[Tuple[str, ...], float]] = {}
+        self.bytes = 0
+        # Count, uncompressed and stored sizes of the compressed entries
+        self.packed_entries = 0
+        self.packed_raw_bytes = 0
+        self.packed_bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        # section -> [hits, stale hits, misses]
+        self._section_lookups: Dict[str, List[int]] = {}
+
+    @staticmethod
+    def _encode(value: Any) -> str:
+        return json.dumps(value, separators=(",", ":"), default=str)
+
+    @staticmethod
+    def _size(key: str, value: Any) -> int:
+        return sys.getsizeof(key) + object_size(value)
+
+    def _pack(self, key: str, value: Any, encoded: str) -> Tuple[Any, int]:
+        """The value to hold in memory and its size"""
+        if self.compress_min_bytes > 0 and len(encoded) >= self.compress_min_bytes:
+            packed = _compress(encoded)
+            return packed, self._size(key, packed.data)
+        return value, self._size(key, value)
+
+    def lookup(self, key: str) -> Optional[CacheHit]:
+        """Return the entry with its age, flagged stale once past its TTL"""
+        entry = self._memory_entry(key)
+        if entry is None and self.backend:
+            entry = self._from_backend(key, self.backend.get(key))
+        return self._hit(key, entry)
+
+    async def alookup(self, key: str) -> Optional[CacheHit]:
+        """lookup() with the backend read run off the event loop"""
+        entry = self._memory_entry(key)
+        if entry is None and self.backend:
+            stored = await asyncio.to_thread(self.backend.get, key)
+            entry = self._from_backend(key, stored)
+        return self._hit(key, entry)
+
+    def _memory_entry(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        now = time.monotonic()
+        if entry.stale_until <= now:
+            self._remove(key)
+            self.expirations += 1
+            return None
+        if entry.recheck_at <= now:
+            # Read it from the backend again, in case another process changed it
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _hit(self, key: str, entry: Optional[CacheEntry]) -> Optional[CacheHit]:
+        """Count the lookup and turn the entry into what callers see"""
+        counts = self._section_lookups.setdefault(key_section(key), [0, 0, 0])
+        if entry is None:
+            self.misses += 1
+            counts[2] += 1
+            return None
+        stale = entry.expires_at <= time.monotonic()
+        if stale:
+            self.stale_hits += 1
+            counts[1] += 1
+        else:
+            self.hits += 1
+            counts[0] += 1
+        value = entry.value
+        if isinstance(value, Packed):
+            value = _decompress(value)
+        return CacheHit(value, max(0.0, time.time() - entry.stored_at), stale)
+
+    def get(self, key: str) -> Any:
+        """Return the value only while it is fresh (None otherwise)"""
+        hit = self.lookup(key)
+        if hit is None or hit.stale:
+            return None
+        return hit.value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+    ):
+        """Store a value; tags (see resource_tags) allow targeted invalidation"""
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0:
+            self.delete(key)
+            return
+        record = self._set_memory(key, value, ttl, tuple(tags))
+        if self.backend:
+            self.backend.set(key, record, ttl + self.stale_window, tags)
+
+    async def aset(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+    ):
+        """set() with the backend write run off the event loop"""
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0:
+            await self.adelete(key)
+            return
+        record = self._set_memory(key, value, ttl, tuple(tags))
+        if self.backend:
+            await asyncio.to_thread(
+                self.backend.set, key, record, ttl + self.stale_window, tags
+            )
+
+    def _set_memory(
+        self, key: str, value: Any, ttl: float, tags: Tuple[str, ...]
+    ) -> str:
+        """Store the value in memory and return its backend record"""
+        stored_at = time.time()
+        encoded = self._encode(value)
+        self._store(key, *self._pack(key, value, encoded), stored_at, ttl, tags)
+        header = json.dumps([stored_at, ttl, tags])
+        return f"{header}\n{encoded}"
+
+    def _from_backend(
+        self, key: str, stored: Optional[Tuple[str, float]]
+    ) -> Optional[CacheEntry]:
+        if stored is None:
+            return None
+        try:
+            header, encoded = stored[0].split("\n", 1)
+            stored_at, ttl, tags = json.loads(header)
+            value = json.loads(encoded)
+        except ValueError:
+            return None
+        return self._store(
+            key, *self._pack(key, value, encoded), stored_at, ttl, tuple(tags)
+        )
+
+    def _store(
+        self,
+        key: str,
+        value: Any,
+        size: int,
+        stored_at: float,
+        ttl: float,
+        tags: Tuple[str, ...],
+    ) -> Optional[CacheEntry]:
+        if key in self._entries:
+            self._remove(key)
+        expires_at = time.monotonic() + ttl - (time.time() - stored_at)
+        stale_until = expires_at + self.stale_window
+        self._tag(key, tags, stale_until)
+        if size > self.max_bytes:
+            return None
+        self._ensure_sweeper()
+        recheck_at = (
+            time.monotonic() + self.memory_ttl if self.backend else float("inf")
+        )
+        entry = CacheEntry(value, stored_at, expires_at, stale_until, recheck_at, size)
+        self._entries[key] = entry
+        self.bytes += size
+        if isinstance(value, Packed):
+            self.packed_entries += 1
+            self.packed_raw_bytes += value.raw_size
+            self.packed_bytes += len(value.data)
+        while self.bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+        return entry
+
+    def delete(self, key: str):
+        self._forget(key)
+        if self.backend:
+            self.backend.delete(key)
+
+    async def adelete(self, key: str):
+        self._forget(key)
+        if self.backend:
+            await asyncio.to_thread(self.backend.delete, key)
+
+    def _forget(self, key: str):
+        if key in self._entries:
+            self._remove(key)
+        self._untag(key)
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        self.bytes -= entry.size
+        if isinstance(entry.value, Packed):
+            self.packed_entries -= 1
+            self.packed_raw_bytes -= entry.value.raw_size
+            self.packed_bytes -= len(entry.value.data)
+        if self.backend is None:
+            # Nothing else holds the entry, so it can never need invalidating
+            self._untag(key)
+
+    def _tag(self, key: str, tags: Tuple[str, ...], stale_until: float):
+        self._untag(key)
+        if not tags:
+            return
+        self._key_tags[key] = (tags, stale_until)
+        for tag in tags:
+            self._tag_index.setdefault(tag, set()).add(key)
+
+    def _untag(self, key: str):
+        tags, _ = self._key_tags.pop(key, ((), 0.0))
+        for tag in tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+
+    def invalidate(self, tags: Iterable[str]) -> int:
+        """Delete every entry stored with any of the tags; returns the count.
+
+        The backend is asked too, since it also holds entries written by
+        other processes or before a restart that this one never indexed.
+        """
+        tags = tuple(tags)
+        keys = self._forget_tagged(tags)
+        if self.backend and tags:
+            keys |= self._forget_all(self.backend.invalidate(tags))
+        self.invalidations += len(keys)
+        return len(keys)
+
+    async def ainvalidate(self, tags: Iterable[str]) -> int:
+        """invalidate() with the backend deletes run off the event loop"""
+        tags = tuple(tags)
+        keys = self._forget_tagged(tags)
+        if self.backend and tags:
+            removed = await asyncio.to_thread(self.backend.invalidate, tags)
+            keys |= self._forget_all(removed)
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def _forget_tagged(self, tags: Iterable[str]) -> Set[str]:
+        keys: Set[str] = set()
+        for tag in tags:
+            keys |= self._tag_index.get(tag, set())
+        return self._forget_all(keys)
+
+    def _forget_all(self, keys: Set[str]) -> Set[str]:
+        for key in keys:
+            self._forget(key)
+        return keys
+
+    def clear(self):
+        self._entries.clear()
+        self._tag_index.clear()
+        self._key_tags.clear()
+        self.bytes = 0
+        self.packed_entries = 0
+        self.packed_raw_bytes = 0
+        self.packed_bytes = 0
+        if self.backend:
+            self.backend.clear()
+
+    def sweep(self) -> int:
+        """Drop every expired entry and return how many were removed"""
+        removed = self._sweep_memory()
+        if self.backend:
+            self.backend.sweep()
+        return removed
+
+    def _sweep_memory(self) -> int:
+        now = time.monotonic()
+        expired = [k for k, e in self._entries.items() if e.stale_until <= now]
+        for key in expired:
+            self._remove(key)
+        self.expirations += len(expired)
+        for key in [k for k, (_, until) in self._key_tags.items() if until <= now]:
+            self._untag(key)
+        return len(expired)
+
+    def _ensure_sweeper(self):
+        if self.sweep_interval <= 0:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if (
+            self._sweeper is None
+            or self._sweeper.done()
+            or (self._sweeper.get_loop() is not loop)
+        ):
+            self._sweeper = loop.create_task(self._sweep_periodically())
+
+    async def _sweep_periodically(self):
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            removed = self._sweep_memory()
+            if self.backend:
+                await asyncio.to_thread(self.backend.sweep)
+            if removed:
+                logger.debug(f"Swept {removed} expired cache entries")
+
+    def close(self):
+        if self._sweeper is not None and not self._sweeper.done():
+            self._sweeper.cancel()
+        self._sweeper = None
+        if self.backend:
+            self.backend.close()
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "compression": {
+                "codec": COMPRESSION_CODEC if self.compress_min_bytes > 0 else None,
+                "min_bytes": self.compress_min_bytes,
+                "entries": self.packed_entries,
+                "raw_bytes": self.packed_raw_bytes,
+                "stored_bytes": self.packed_bytes,
+                "ratio": (
+                    round(self.packed_raw_bytes / self.packed_bytes, 2)
+                    if self.packed_bytes
+                    else 0.0
+                ),
+            },
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "indexed_keys": len(self._key_tags),
+            "by_section": {
+                section or "other": {
+                    "hits": hits,
+                    "stale_hits": stale_hits,
+                    "misses": misses,
+                    "hit_rate": round(hits / (hits + stale_hits + misses), 3),
+                }
+                for section, (hits, stale_hits, misses) in sorted(
+                    self._section_lookups.items()
+                )
+            },
+            "backend": self.backend.stats() if self.backend else None,
+        }
@@ -0,0 +1,82 @@
+import asyncio
+import itertools
+import time
+from typing import Dict, List
+
+from meraki_mcp.services.executor import BACKGROUND, BULK, INTERACTIVE
+
+# Lower runs first; keyed by the pool a call is made on
+PRIORITIES: Dict[str, int] = {INTERACTIVE: 0, BULK: 1, BACKGROUND: 2}
+_CLASS_NAMES = {priority: name for name, priority in PRIORITIES.items()}
+
+
+class PriorityGate:
+    """Mutual exclusion that hands over to the most urgent waiter, not the oldest.
+
+    A waiter's effective priority improves by one class for every
+    aging_seconds it has waited, so a steady stream of interactive calls
+    delays bulk and background work but can never starve it.
+    """
+
+    def __init__(self, aging_seconds: float = 5.0):
+        self.aging_seconds = aging_seconds
+        self._locked = False
+        self._waiters: List[list] = []
+        self._seq = itertools.count()
+        self.granted: Dict[int, int] = {}
+        self.aged_grants = 0
+
+    def _effective(self, entry: list, now: float) -> tuple:
+        priority, enqueued, seq, _ = entry
+        if self.aging_seconds > 0:
+            priority -= (now - enqueued) / self.aging_seconds
+        return priority, seq
+
+    async def acquire(self, priority: int = 0):
+        if not self._locked and not self._waiters:
+            self._locked = True
+            self._count(priority)
+            return
+        fut = asyncio.get_running_loop().create_future()
+        entry = [priority, time.monotonic(), next(self._seq), fut]
+        self._waiters.append(entry)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if entry in self._waiters:
+                self._waiters.remove(entry)
+            elif fut.done() and not fut.cancelled():
+                # Ownership was handed over just as we were cancelled
+                self.release()
+            raise
+
+    def release(self):
+        now = time.monotonic()
+        while self._waiters:
+            entry = min(self._waiters, key=lambda e: self._effective(e, now))
+            self._waiters.remove(entry)
+            fut = entry[3]
+            if fut.done():
+                continue
+            if any(e[0] < entry[0] for e in self._waiters):
+                self.aged_grants += 1
+            self._count(entry[0])
+            fut.set_result(None)
+            return
+        self._locked = False
+
+    def _count(self, priority: int):
+        self.granted[priority] = self.granted.get(priority, 0) + 1
+
+    def stats(self) -> Dict:
+        queued: Dict[str, int] = {}
+        for entry in self._waiters:
+            name = _CLASS_NAMES.get(entry[0], str(entry[0]))
+            queued[name] = queued.get(name, 0) + 1
+        return {
+            "queued_by_class": queued,
+            "granted_by_class": {
+                _CLASS_NAMES.get(p, str(p)): n for p, n in self.granted.items()
+            },
+            "aged_grants": self.aged_grants,
+        }
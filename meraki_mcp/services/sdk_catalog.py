@@ -0,0 +1,215 @@
+"""Persisted snapshot of the Meraki SDK surface (sections, methods, signatures).
+
+Introspecting the live SDK with dir()/getattr()/inspect.signature() across
+roughly a thousand endpoints is slow, so the result is written once per
+installed ``meraki`` version and loaded from disk afterwards. Generate it
+ahead of time (e.g. in a Docker build) with::
+
+    python -m meraki_mcp.services.sdk_catalog [directory]
+"""
+
+import inspect
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FORMAT = 1
+
+_catalogs: Dict[str, "SdkCatalog"] = {}
+_catalogs_lock = threading.Lock()
+
+
+def sdk_version() -> str:
+    """Installed meraki version, read from package metadata without importing it"""
+    try:
+        return metadata.version("meraki")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def catalog_path(directory: str, version: str) -> Path:
+    return Path(directory).expanduser() / f"meraki-sdk-{version}.json"
+
+
+def _json_safe(value):
+    try:
+        json.dumps(value)
+        return value
+    except (TypeError, ValueError):
+        return repr(value)
+
+
+def _summary(doc: Optional[str]) -> str:
+    for line in (doc or "").splitlines():
+        line = line.strip().strip("*").strip()
+        if line:
+            return line
+    return ""
+
+
+def _describe_method(method_obj) -> Dict:
+    params = []
+    for name, param in inspect.signature(method_obj).parameters.items():
+        if param.kind in (param.VAR_KEYWORD, param.VAR_POSITIONAL):
+            continue
+        info = {
+            "name": name,
+            "required": param.default is inspect.Parameter.empty,
+            "type": str(param.annotation)
+            if param.annotation is not inspect.Parameter.empty
+            else "unknown",
+        }
+        if param.default is not inspect.Parameter.empty:
+            info["default"] = _json_safe(param.default)
+        params.append(info)
+    return {"params": params, "summary": _summary(method_obj.__doc__)}
+
+
+def build_catalog_data(dashboard=None) -> Dict:
+    """Introspect a dashboard (a throwaway SDK instance by default)"""
+    if dashboard is None:
+        import meraki
+
+        # No request is made; the key only satisfies the constructor
+        dashboard = meraki.DashboardAPI(
+            api_key="catalog-builder", suppress_logging=True, output_log=False
+        )
+
+    sections: Dict[str, Dict] = {}
+    for attr in dir(dashboard):
+        if attr.startswith("_"):
+            continue
+        section_obj = getattr(dashboard, attr)
+        if "api" not in str(type(section_obj)).lower():
+            continue
+        methods = {}
+        for method in dir(section_obj):
+            if method.startswith("_"):
+                continue
+            method_obj = getattr(section_obj, method)
+            if not callable(method_obj):
+                continue
+            try:
+                methods[method] = _describe_method(method_obj)
+            except (TypeError, ValueError):
+                methods[method] = {"params": [], "summary": ""}
+        sections[attr] = methods
+
+    return {
+        "format": CATALOG_FORMAT,
+        "sdk_version": sdk_version(),
+        "sections": sections,
+    }
+
+
+class SdkCatalog:
+    """Read-only view over catalog data"""
+
+    def __init__(self, data: Dict):
+        self.sdk_version = data.get("sdk_version", "unknown")
+        self._sections: Dict[str, Dict[str, Dict]] = data.get("sections", {})
+
+    def structure(self) -> Dict[str, List[str]]:
+        return {section: list(methods) for section, methods in self._sections.items()}
+
+    def has(self, section: str, method: str) -> bool:
+        return method in self._sections.get(section, {})
+
+    def summary(self, section: str, method: str) -> str:
+        return self._sections.get(section, {}).get(method, {}).get("summary", "")
+
+    def parameters(self, section: str, method: str) -> Optional[Dict[str, Dict]]:
+        """Parameter documentation keyed by name, or None if the endpoint is unknown"""
+        entry = self._sections.get(section, {}).get(method)
+        if entry is None:
+            return None
+        return {
+            p["name"]: {k: v for k, v in p.items() if k != "name"}
+            for p in entry["params"]
+        }
+
+    def required_params(self, section: str, method: str) -> List[str]:
+        entry = self._sections.get(section, {}).get(method)
+        if entry is None:
+            return []
+        return [p["name"] for p in entry["params"] if p["required"]]
+
+
+def load_persisted_catalog(directory: str) -> Optional[SdkCatalog]:
+    """Load the catalog for the installed SDK version if one was written before"""
+    if not directory:
+        return None
+    version = sdk_version()
+    path = catalog_path(directory, version)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable SDK catalog {path}: {e}")
+        return None
+    if data.get("format") != CATALOG_FORMAT or data.get("sdk_version") != version:
+        return None
+    return SdkCatalog(data)
+
+
+def write_catalog(directory: str, data: Dict) -> Path:
+    path = catalog_path(directory, data["sdk_version"])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".catalog-", suffix=".json")
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        json.dump(data, fh, separators=(",", ":"))
+    os.replace(tmp, path)
+    return path
+
+
+def get_catalog(directory: str = "") -> SdkCatalog:
+    """Process-wide catalog: memory, then disk, then built from the SDK and persisted"""
+    catalog = _catalogs.get(directory)
+    if catalog is not None:
+        return catalog
+    with _catalogs_lock:
+        catalog = _catalogs.get(directory)
+        if catalog is None:
+            catalog = load_persisted_catalog(directory)
+        if catalog is None:
+            data = build_catalog_data()
+            catalog = SdkCatalog(data)
+            logger.info(f"Built Meraki SDK catalog for version {catalog.sdk_version}")
+            if directory:
+                try:
+                    path = write_catalog(directory, data)
+                    logger.info(f"Persisted Meraki SDK catalog to {path}")
+                except OSError as e:
+                    logger.warning(f"Unable to persist SDK catalog: {e}")
+        _catalogs[directory] = catalog
+    return catalog
+
+
+def preload_catalog(directory: str) -> bool:
+    """Load a previously persisted catalog into memory without touching the SDK"""
+    if directory in _catalogs:
+        return True
+    catalog = load_persisted_catalog(directory)
+    if catalog is None:
+        return False
+    with _catalogs_lock:
+        _catalogs.setdefault(directory, catalog)
+    return True
+
+
+if __name__ == "__main__":
+    from meraki_mcp.settings import ApiSettings
+
+    logging.basicConfig(level=logging.INFO)
+    target = sys.argv[1] if len(sys.argv) > 1 else ApiSettings().SDK_CATALOG_DIR
+    written = write_catalog(target, build_catalog_data())
+    logger.info(f"Wrote Meraki SDK catalog to {written}")
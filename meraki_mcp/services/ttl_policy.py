@@ -0,0 +1,81 @@
+import fnmatch
+from typing import Dict, Iterable, List, Tuple
+
+from meraki_mcp.settings import ApiSettings
+
+# Checked in order, first match wins. Patterns are globs over
+# "section.method"; a pattern without a dot matches the method in any section.
+DEFAULT_TTL_RULES: List[Tuple[str, float]] = [
+    # Live status and telemetry changes within seconds
+    ("*Statuses*", 30),
+    ("*Status", 30),
+    ("*Clients*", 30),
+    ("*LossAndLatency*", 30),
+    ("*LatencyStats*", 30),
+    ("*ConnectionStats*", 30),
+    ("*Usage*", 60),
+    ("*Traffic*", 60),
+    ("*Events*", 60),
+    ("*Alerts*", 60),
+    ("*Availabilities*", 60),
+    ("*Performance*", 60),
+    ("*History*", 120),
+    # Inventory and licensing change when hardware is claimed or moved
+    ("*Inventory*", 900),
+    ("getOrganizationDevices", 900),
+    ("getNetworkDevices", 900),
+    ("getDevice", 900),
+    ("*Licenses*", 1800),
+    # Configuration rarely changes, and local writes invalidate it anyway
+    ("getOrganizations", 3600),
+    ("getOrganization", 3600),
+    ("getOrganizationNetworks", 1800),
+    ("getNetwork", 1800),
+    ("*Ssids*", 1800),
+    ("*Vlans*", 1800),
+    ("*FirewallRules*", 1800),
+    ("*Policies*", 1800),
+    ("*Policy", 1800),
+    ("*Settings", 1800),
+    ("*Admins", 1800),
+    ("*Firmware*", 1800),
+]
+
+
+class TtlPolicy:
+    """Cache TTL per endpoint from glob rules, falling back to a default"""
+
+    def __init__(self, rules: Iterable[Tuple[str, float]], default_ttl: float):
+        self.rules = list(rules)
+        self.default_ttl = default_ttl
+        self._resolved: Dict[Tuple[str, str], float] = {}
+
+    @classmethod
+    def from_settings(cls, settings: ApiSettings) -> "TtlPolicy":
+        """CACHE_TTL_RULES take precedence over the built-in rules.
+
+        Built-in rules never cache longer than CACHE_TTL_SECONDS, so lowering
+        it still bounds how old a response can be; configured rules may.
+        """
+        rules = list(settings.CACHE_TTL_RULES.items())
+        if settings.CACHE_TTL_DEFAULT_RULES:
+            ceiling = settings.CACHE_TTL_SECONDS
+            rules += [(p, min(ttl, ceiling)) for p, ttl in DEFAULT_TTL_RULES]
+        return cls(rules, settings.CACHE_TTL_SECONDS)
+
+    @staticmethod
+    def _matches(pattern: str, section: str, method: str) -> bool:
+        if "." in pattern:
+            return fnmatch.fnmatchcase(f"{section}.{method}", pattern)
+        return fnmatch.fnmatchcase(method, pattern)
+
+    def ttl_for(self, section: str, method: str) -> float:
+        key = (section, method)
+        ttl = self._resolved.get(key)
+        if ttl is None:
+            ttl = next(
+                (t for p, t in self.rules if self._matches(p, section, method)),
+                self.default_ttl,
+            )
+            self._resolved[key] = ttl
+        return ttl
@@ -7,7 +7,79 @@ class ApiSettings(BaseSettings):
     # Selent integration removed
     CACHE_TTL_SECONDS: int = 300
     DISABLE_RESPONSE_CACHE: bool = False
+    # TTL overrides by glob over "section.method" (or just the method), e.g.
+    # {"*.getNetworkClients": 10, "wireless.*": 600}; checked before the
+    # built-in per-family rules, with CACHE_TTL_SECONDS for anything unmatched.
+    # The built-in rules only shorten TTLs: none exceeds CACHE_TTL_SECONDS
+    CACHE_TTL_RULES: dict[str, float] = {}
+    CACHE_TTL_DEFAULT_RULES: bool = True
+    # Serve expired reads for this long (marked stale) while they refresh; 0 disables
+    CACHE_STALE_SECONDS: int = 0
+    # Remember 400/403/404 read failures (wrong IDs, features a network
+    # lacks) for this long so retries do not go back to Meraki; 0 disables
+    CACHE_NEGATIVE_TTL_SECONDS: float = 60.0
+    # Memory ceiling for cached responses; expired entries are swept periodically
+    CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    CACHE_SWEEP_SECONDS: float = 60.0
+    # Hold responses at least this large (as compact JSON) compressed; 0 disables
+    CACHE_COMPRESS_MIN_BYTES: int = 32 * 1024
+    # Shared tier behind the memory cache: "" (none), "sqlite" (file that
+    # survives restarts), "shm" (SQLite on /dev/shm for workers on one host)
+    # or "redis" (replicas on any host); setting only CACHE_PERSIST_PATH
+    # selects "sqlite"
+    CACHE_BACKEND: str = ""
+    CACHE_PERSIST_PATH: str = ""
+    # With a CACHE_BACKEND, serve a response from memory for at most this long
+    # before reading it from the backend again, so writes and invalidations
+    # by other processes show up within it; 0 reads the backend every time
+    CACHE_MEMORY_TTL_SECONDS: float = 5.0
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_REDIS_TIMEOUT: float = 0.5
+    # Prefetched into the cache in the background at startup, at background
+    # priority: getOrganizations once, other endpoints once per org ID
+    CACHE_WARMUP_ORG_IDS: list[str] = []
+    CACHE_WARMUP_ENDPOINTS: list[str] = [
+        "organizations.getOrganizations",
+        "organizations.getOrganizationNetworks",
+        "organizations.getOrganizationDevices",
+    ]
     MCP_LOG_SECTIONS: bool = False
+    # Also log get_server_performance_stats as one JSON line this often; 0 disables
+    STATS_LOG_SECONDS: float = 0.0
+    # Use the SDK's asyncio dashboard (meraki.aio) instead of executor threads
+    USE_ASYNC_CLIENT: bool = False
+    ASYNC_MAX_CONCURRENT_REQUESTS: int = 8
+    # Client-side token bucket per organization (Meraki allows ~10 req/s per org)
+    RATE_LIMIT_PER_ORG: float = 10.0
+    RATE_LIMIT_BURST: int = 10
+    # Dedicated worker pools: interactive tools vs. complex/bulk sub-calls
+    # vs. background refresh
+    INTERACTIVE_POOL_SIZE: int = 8
+    BULK_POOL_SIZE: int = 4
+    BACKGROUND_POOL_SIZE: int = 2
+    # Queued calls are served interactive > bulk > background; each
+    # SCHEDULER_AGING_SECONDS spent waiting promotes a call by one class
+    SCHEDULER_AGING_SECONDS: float = 5.0
+    # Share one upstream request between concurrent identical get* calls
+    COALESCE_READS: bool = True
+    # Multi-tenant serving: one lazily built client per API key, LRU evicted.
+    # On HTTP transports every request must supply its key in this header.
+    MULTI_TENANT: bool = False
+    TENANT_API_KEY_HEADER: str = "x-meraki-api-key"
+    MAX_TENANT_CLIENTS: int = 32
+    TENANT_IDLE_SECONDS: int = 3600
+    # Overall time budget for each complex (multi-call) tool; 0 disables
+    COMPLEX_TOOL_DEADLINE_SECONDS: float = 50.0
+    # Circuit breakers per org and per section.method; threshold 0 disables
+    CIRCUIT_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_RESET_SECONDS: float = 30.0
+    # An org's breaker opens only once its failures span this many endpoints
+    CIRCUIT_ORG_MIN_ENDPOINTS: int = 2
+    # Per-SDK-version snapshot of sections/methods/signatures; empty = memory only
+    SDK_CATALOG_DIR: str = "~/.cache/meraki-mcp"
+    # How long a search waits for the startup index build before answering
+    # with plain name matches instead
+    SEARCH_INDEX_WAIT_SECONDS: float = 2.0
     # Mutation and surface controls
     ALLOW_MUTATIONS: bool = False
     REQUIRE_CONFIRM_FOR_MUTATIONS: bool = True
@@ -4,13 +4,11 @@ from typing import Optional
 
 from mcp.server.fastmcp import FastMCP
 
+from meraki_mcp.services.client_registry import MerakiClientRegistry
 from meraki_mcp.services.meraki_client import MerakiClient
-from meraki_mcp.settings import ApiSettings
 
 logger = logging.getLogger(__name__)
 
-env = ApiSettings()
-
 
 class CommonlyUsedMerakiApiTools:
     """
@@ -20,10 +18,14 @@ class CommonlyUsedMerakiApiTools:
     requiring the search and discovery process.
     """
 
-    def __init__(self, mcp: FastMCP, meraki_client: MerakiClient, enabled: bool):
+    def __init__(
+        self,
+        mcp: FastMCP,
+        meraki_client: MerakiClient | MerakiClientRegistry,
+        enabled: bool,
+    ):
         self.mcp = mcp
         self.meraki_client = meraki_client
-        self.dashboard = self.meraki_client.get_dashboard()
         self.enabled = enabled
         if self.enabled:
             self._register_tools()
@@ -34,7 +36,7 @@ class CommonlyUsedMerakiApiTools:
         """Register all regular API tools with the MCP server."""
 
         @self.mcp.tool()
-        def get_organizations() -> str:
+        async def get_organizations() -> str:
             """
             Get all organizations accessible by the API key.
 
@@ -46,7 +48,9 @@ class CommonlyUsedMerakiApiTools:
                 including organizationId, name, url, and other metadata.
             """
             try:
-                organizations = self.dashboard.organizations.getOrganizations()
+                organizations = await self.meraki_client.call(
+                    "organizations", "getOrganizations"
+                )
 
                 result = {
                     "method": "getOrganizations",
@@ -63,7 +67,7 @@ class CommonlyUsedMerakiApiTools:
                 )
 
         @self.mcp.tool()
-        def get_organization_devices(organization_id: str) -> str:
+        async def get_organization_devices(organization_id: str) -> str:
             """
             Get all devices in an organization.
 
@@ -78,8 +82,10 @@ class CommonlyUsedMerakiApiTools:
                 with details like serial, model, name, networkId, etc.
             """
             try:
-                devices = self.dashboard.organizations.getOrganizationDevices(
-                    organizationId=organization_id
+                devices = await self.meraki_client.call(
+                    "organizations",
+                    "getOrganizationDevices",
+                    organizationId=organization_id,
                 )
 
                 result = {
@@ -103,7 +109,7 @@ class CommonlyUsedMerakiApiTools:
                 )
 
         @self.mcp.tool()
-        def get_organization_networks(organization_id: str) -> str:
+        async def get_organization_networks(organization_id: str) -> str:
             """
             Get all networks in an organization.
 
@@ -118,8 +124,10 @@ class CommonlyUsedMerakiApiTools:
                 productTypes, timezone, and other network metadata.
             """
             try:
-                networks = self.dashboard.organizations.getOrganizationNetworks(
-                    organizationId=organization_id
+                networks = await self.meraki_client.call(
+                    "organizations",
+                    "getOrganizationNetworks",
+                    organizationId=organization_id,
                 )
 
                 result = {
@@ -143,7 +151,7 @@ class CommonlyUsedMerakiApiTools:
                 )
 
         @self.mcp.tool()
-        def get_device_status(serial: str) -> str:
+        async def get_device_status(serial: str) -> str:
             """
             Get device status and basic information.
 
@@ -158,7 +166,9 @@ class CommonlyUsedMerakiApiTools:
                 model, name, networkId, lan/wan IP addresses, and other details.
             """
             try:
-                device = self.dashboard.devices.getDevice(serial=serial)
+                device = await self.meraki_client.call(
+                    "devices", "getDevice", serial=serial
+                )
 
                 result = {"method": "getDevice", "serial": serial, "device": device}
 
@@ -172,7 +182,7 @@ class CommonlyUsedMerakiApiTools:
                 )
 
         @self.mcp.tool()
-        def get_network_clients(
+        async def get_network_clients(
             network_id: str, timespan: Optional[int] = 2592000
         ) -> str:
             """
@@ -190,8 +200,11 @@ class CommonlyUsedMerakiApiTools:
                 IP assignments, device types, usage statistics, etc.
             """
             try:
-                clients = self.dashboard.networks.getNetworkClients(
-                    networkId=network_id, timespan=timespan
+                clients = await self.meraki_client.call(
+                    "networks",
+                    "getNetworkClients",
+                    networkId=network_id,
+                    timespan=timespan,
                 )
 
                 result = {
@@ -216,7 +229,7 @@ class CommonlyUsedMerakiApiTools:
                 )
 
         @self.mcp.tool()
-        def get_switch_port_config(serial: str, port_id: str) -> str:
+        async def get_switch_port_config(serial: str, port_id: str) -> str:
             """
             Get switch port configuration.
 
@@ -232,8 +245,8 @@ class CommonlyUsedMerakiApiTools:
                 access policy, power settings, and other port-specific details.
             """
             try:
-                port_config = self.dashboard.switch.getDeviceSwitchPort(
-                    serial=serial, portId=port_id
+                port_config = await self.meraki_client.call(
+                    "switch", "getDeviceSwitchPort", serial=serial, portId=port_id
                 )
 
                 result = {
@@ -258,7 +271,7 @@ class CommonlyUsedMerakiApiTools:
                 )
 
         @self.mcp.tool()
-        def get_network_settings(network_id: str) -> str:
+        async def get_network_settings(network_id: str) -> str:
             """
             Get network configuration settings.
 
@@ -272,8 +285,8 @@ class CommonlyUsedMerakiApiTools:
                 JSON string containing network settings and configuration details.
             """
             try:
-                settings = self.dashboard.networks.getNetworkSettings(
-                    networkId=network_id
+                settings = await self.meraki_client.call(
+                    "networks", "getNetworkSettings", networkId=network_id
                 )
 
                 result = {
@@ -296,7 +309,7 @@ class CommonlyUsedMerakiApiTools:
                 )
 
         @self.mcp.tool()
-        def get_firewall_rules(network_id: str) -> str:
+        async def get_firewall_rules(network_id: str) -> str:
             """
             Get Layer 3 firewall rules for a network.
 
@@ -310,10 +323,10 @@ class CommonlyUsedMerakiApiTools:
                 source/destination addresses, and rule priorities.
             """
             try:
-                firewall_rules = (
-                    self.dashboard.appliance.getNetworkApplianceFirewallL3FirewallRules(
-                        networkId=network_id
-                    )
+                firewall_rules = await self.meraki_client.call(
+                    "appliance",
+                    "getNetworkApplianceFirewallL3FirewallRules",
+                    networkId=network_id,
                 )
 
                 result = {
@@ -336,7 +349,7 @@ class CommonlyUsedMerakiApiTools:
                 )
 
         @self.mcp.tool()
-        def get_organization_uplinks_statuses(organization_id: str) -> str:
+        async def get_organization_uplinks_statuses(organization_id: str) -> str:
             """
             Get uplink status for all devices in an organization.
 
@@ -351,8 +364,10 @@ class CommonlyUsedMerakiApiTools:
                 including interface information, IP addresses, and connectivity status.
             """
             try:
-                uplinks = self.dashboard.organizations.getOrganizationUplinksStatuses(
-                    organizationId=organization_id
+                uplinks = await self.meraki_client.call(
+                    "organizations",
+                    "getOrganizationUplinksStatuses",
+                    organizationId=organization_id,
                 )
 
                 result = {
@@ -376,7 +391,7 @@ class CommonlyUsedMerakiApiTools:
                 )
 
         @self.mcp.tool()
-        def get_network_topology(network_id: str) -> str:
+        async def get_network_topology(network_id: str) -> str:
             """
             Get network topology including device relationships and connections.
 
@@ -389,8 +404,8 @@ class CommonlyUsedMerakiApiTools:
                 JSON string containing network topology with device links and connections.
             """
             try:
-                topology = self.dashboard.networks.getNetworkTopologyLinkLayer(
-                    networkId=network_id
+                topology = await self.meraki_client.call(
+                    "networks", "getNetworkTopologyLinkLayer", networkId=network_id
                 )
 
                 result = {
@@ -415,48 +430,58 @@ class CommonlyUsedMerakiApiTools:
         # Administered identity and API keys wrappers (OAuth-compatible endpoints)
 
         @self.mcp.tool()
-        def administered_get_identity() -> str:
+        async def administered_get_identity() -> str:
             """
             Returns the identity of the current user.
 
             Calls: GET /administered/identities/me
             """
             try:
-                identity = self.dashboard.administered.getAdministeredIdentitiesMe()
+                identity = await self.meraki_client.call(
+                    "administered", "getAdministeredIdentitiesMe"
+                )
                 return json.dumps(
                     {"method": "getAdministeredIdentitiesMe", "identity": identity},
                     indent=2,
                 )
             except Exception as e:
                 logger.error(f"Failed to get administered identity: {e}")
-                return json.dumps({"error": "API call failed", "message": str(e)}, indent=2)
+                return json.dumps(
+                    {"error": "API call failed", "message": str(e)}, indent=2
+                )
 
         @self.mcp.tool()
-        def administered_list_api_keys() -> str:
+        async def administered_list_api_keys() -> str:
             """
             List non-sensitive metadata for API keys belonging to the current user.
 
             Calls: GET /administered/identities/me/api/keys
             """
             try:
-                keys = self.dashboard.administered.getAdministeredIdentitiesMeApiKeys()
+                keys = await self.meraki_client.call(
+                    "administered", "getAdministeredIdentitiesMeApiKeys"
+                )
                 return json.dumps(
                     {"method": "getAdministeredIdentitiesMeApiKeys", "keys": keys},
                     indent=2,
                 )
             except Exception as e:
                 logger.error(f"Failed to list administered API keys: {e}")
-                return json.dumps({"error": "API call failed", "message": str(e)}, indent=2)
+                return json.dumps(
+                    {"error": "API call failed", "message": str(e)}, indent=2
+                )
 
         @self.mcp.tool()
-        def administered_generate_api_key() -> str:
+        async def administered_generate_api_key() -> str:
             """
             Generate a new API key for the current user.
 
             Calls: POST /administered/identities/me/api/keys/generate
             """
             try:
-                response = self.dashboard.administered.generateAdministeredIdentitiesMeApiKeys()
+                response = await self.meraki_client.call(
+                    "administered", "generateAdministeredIdentitiesMeApiKeys"
+                )
                 return json.dumps(
                     {
                         "method": "generateAdministeredIdentitiesMeApiKeys",
@@ -466,10 +491,12 @@ class CommonlyUsedMerakiApiTools:
                 )
             except Exception as e:
                 logger.error(f"Failed to generate administered API key: {e}")
-                return json.dumps({"error": "API call failed", "message": str(e)}, indent=2)
+                return json.dumps(
+                    {"error": "API call failed", "message": str(e)}, indent=2
+                )
 
         @self.mcp.tool()
-        def administered_revoke_api_key(suffix: str) -> str:
+        async def administered_revoke_api_key(suffix: str) -> str:
             """
             Revoke an API key by its last four characters.
 
@@ -479,8 +506,10 @@ class CommonlyUsedMerakiApiTools:
             Calls: POST /administered/identities/me/api/keys/{suffix}/revoke
             """
             try:
-                response = self.dashboard.administered.revokeAdministeredIdentitiesMeApiKeys(
-                    suffix=suffix
+                response = await self.meraki_client.call(
+                    "administered",
+                    "revokeAdministeredIdentitiesMeApiKeys",
+                    suffix=suffix,
                 )
                 return json.dumps(
                     {
@@ -500,16 +529,15 @@ class CommonlyUsedMerakiApiTools:
         # Spaces and Sensor Gateway convenience wrappers
 
         @self.mcp.tool()
-        def get_spaces_integration_status(organization_id: str) -> str:
+        async def get_spaces_integration_status(organization_id: str) -> str:
             """
             Get the status of the Spaces integration in Meraki for an organization.
 
             Calls: GET /organizations/{organizationId}/spaces/integrate/status
             """
             try:
-                if not hasattr(
-                    self.dashboard.organizations,
-                    "getOrganizationSpacesIntegrateStatus",
+                if not self.meraki_client.has_method(
+                    "organizations", "getOrganizationSpacesIntegrateStatus"
                 ):
                     return json.dumps(
                         {
@@ -520,8 +548,10 @@ class CommonlyUsedMerakiApiTools:
                         },
                         indent=2,
                     )
-                status = self.dashboard.organizations.getOrganizationSpacesIntegrateStatus(
-                    organizationId=organization_id
+                status = await self.meraki_client.call(
+                    "organizations",
+                    "getOrganizationSpacesIntegrateStatus",
+                    organizationId=organization_id,
                 )
                 return json.dumps(
                     {
@@ -543,16 +573,15 @@ class CommonlyUsedMerakiApiTools:
                 )
 
         @self.mcp.tool()
-        def get_sensor_gateway_latest_connections(organization_id: str) -> str:
+        async def get_sensor_gateway_latest_connections(organization_id: str) -> str:
             """
             Returns latest sensor-gateway connectivity data for an organization.
 
             Calls: GET /organizations/{organizationId}/sensor/gateways/connections/latest
             """
             try:
-                if not hasattr(
-                    self.dashboard.sensor,
-                    "getOrganizationSensorGatewaysConnectionsLatest",
+                if not self.meraki_client.has_method(
+                    "sensor", "getOrganizationSensorGatewaysConnectionsLatest"
                 ):
                     return json.dumps(
                         {
@@ -563,10 +592,10 @@ class CommonlyUsedMerakiApiTools:
                         },
                         indent=2,
                     )
-                latest = (
-                    self.dashboard.sensor.getOrganizationSensorGatewaysConnectionsLatest(
-                        organizationId=organization_id
-                    )
+                latest = await self.meraki_client.call(
+                    "sensor",
+                    "getOrganizationSensorGatewaysConnectionsLatest",
+                    organizationId=organization_id,
                 )
                 return json.dumps(
                     {
@@ -577,9 +606,7 @@ class CommonlyUsedMerakiApiTools:
                     indent=2,
                 )
             except Exception as e:
-                logger.error(
-                    f"Failed to get sensor gateway latest connections: {e}"
-                )
+                logger.error(f"Failed to get sensor gateway latest connections: {e}")
                 return json.dumps(
                     {
                         "error": "API call failed",
@@ -592,7 +619,9 @@ class CommonlyUsedMerakiApiTools:
         # XDR enable/disable and Wireless scanning/L7 firewall wrappers
 
         @self.mcp.tool()
-        def enable_xdr_on_networks(organization_id: str, network_ids_json: str) -> str:
+        async def enable_xdr_on_networks(
+            organization_id: str, network_ids_json: str
+        ) -> str:
             """
             Enable XDR on specified networks in an organization.
 
@@ -602,8 +631,11 @@ class CommonlyUsedMerakiApiTools:
             """
             try:
                 network_ids = json.loads(network_ids_json) if network_ids_json else []
-                response = self.dashboard.organizations.enableOrganizationIntegrationsXdrNetworks(
-                    organizationId=organization_id, networkIds=network_ids
+                response = await self.meraki_client.call(
+                    "organizations",
+                    "enableOrganizationIntegrationsXdrNetworks",
+                    organizationId=organization_id,
+                    networkIds=network_ids,
                 )
                 return json.dumps(
                     {
@@ -626,14 +658,19 @@ class CommonlyUsedMerakiApiTools:
                 )
 
         @self.mcp.tool()
-        def disable_xdr_on_networks(organization_id: str, network_ids_json: str) -> str:
+        async def disable_xdr_on_networks(
+            organization_id: str, network_ids_json: str
+        ) -> str:
             """
             Disable XDR on specified networks in an organization.
             """
             try:
                 network_ids = json.loads(network_ids_json) if network_ids_json else []
-                response = self.dashboard.organizations.disableOrganizationIntegrationsXdrNetworks(
-                    organizationId=organization_id, networkIds=network_ids
+                response = await self.meraki_client.call(
+                    "organizations",
+                    "disableOrganizationIntegrationsXdrNetworks",
+                    organizationId=organization_id,
+                    networkIds=network_ids,
                 )
                 return json.dumps(
                     {
@@ -656,7 +693,9 @@ class CommonlyUsedMerakiApiTools:
                 )
 
         @self.mcp.tool()
-        def update_network_wireless_scanning_settings(network_id: str, settings_json: str) -> str:
+        async def update_network_wireless_scanning_settings(
+            network_id: str, settings_json: str
+        ) -> str:
             """
             Change scanning API settings for a network.
 
@@ -666,8 +705,11 @@ class CommonlyUsedMerakiApiTools:
             """
             try:
                 settings = json.loads(settings_json) if settings_json else {}
-                response = self.dashboard.wireless.updateNetworkWirelessLocationScanning(
-                    networkId=network_id, **settings
+                response = await self.meraki_client.call(
+                    "wireless",
+                    "updateNetworkWirelessLocationScanning",
+                    networkId=network_id,
+                    **settings,
                 )
                 return json.dumps(
                     {
@@ -681,12 +723,18 @@ class CommonlyUsedMerakiApiTools:
             except Exception as e:
                 logger.error(f"Failed to update wireless scanning settings: {e}")
                 return json.dumps(
-                    {"error": "API call failed", "message": str(e), "network_id": network_id},
+                    {
+                        "error": "API call failed",
+                        "message": str(e),
+                        "network_id": network_id,
+                    },
                     indent=2,
                 )
 
         @self.mcp.tool()
-        def update_ssid_l7_firewall_rules(network_id: str, number: int, rules_json: str) -> str:
+        async def update_ssid_l7_firewall_rules(
+            network_id: str, number: int, rules_json: str
+        ) -> str:
             """
             Update the L7 firewall rules of an SSID on an MR network.
 
@@ -697,9 +745,8 @@ class CommonlyUsedMerakiApiTools:
             """
             try:
                 rules = json.loads(rules_json) if rules_json else {}
-                if not hasattr(
-                    self.dashboard.wireless,
-                    "updateNetworkWirelessSsidFirewallL7FirewallRules",
+                if not self.meraki_client.has_method(
+                    "wireless", "updateNetworkWirelessSsidFirewallL7FirewallRules"
                 ):
                     return json.dumps(
                         {
@@ -711,8 +758,12 @@ class CommonlyUsedMerakiApiTools:
                         },
                         indent=2,
                     )
-                response = self.dashboard.wireless.updateNetworkWirelessSsidFirewallL7FirewallRules(
-                    networkId=network_id, number=number, **rules
+                response = await self.meraki_client.call(
+                    "wireless",
+                    "updateNetworkWirelessSsidFirewallL7FirewallRules",
+                    networkId=network_id,
+                    number=number,
+                    **rules,
                 )
                 return json.dumps(
                     {
@@ -727,6 +778,11 @@ class CommonlyUsedMerakiApiTools:
             except Exception as e:
                 logger.error(f"Failed to update SSID L7 firewall rules: {e}")
                 return json.dumps(
-                    {"error": "API call failed", "message": str(e), "network_id": network_id, "number": number},
+                    {
+                        "error": "API call failed",
+                        "message": str(e),
+                        "network_id": network_id,
+                        "number": number,
+                    },
                     indent=2,
                 )
@@ -1,31 +1,57 @@
 import asyncio
-import inspect
 import json
 import logging
 import re
+import threading
 import time
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 
 from mcp.server.fastmcp import FastMCP
 
+from meraki_mcp.services.client_registry import MerakiClientRegistry
+from meraki_mcp.services.endpoint_index import EndpointIndex
 from meraki_mcp.services.meraki_client import MerakiClient
+from meraki_mcp.services.performance_stats import (
+    collect_performance_stats,
+    log_performance_stats,
+)
 from meraki_mcp.settings import ApiSettings
 
 logger = logging.getLogger(__name__)
 
+# Confidence the top search result needs to be reported as the direct match
+SEARCH_DIRECT_MATCH_THRESHOLD = 0.3
+# Most error responses for unknown sections/methods kept at once
+MAX_UNKNOWN_ENDPOINTS = 256
+
 
 class MerakiApiTools:
     """Dynamic tool class that can discover and execute any Meraki API endpoint"""
 
-    def __init__(self, mcp: FastMCP, meraki_client: MerakiClient, enabled: bool, settings: ApiSettings | None = None):
+    def __init__(
+        self,
+        mcp: FastMCP,
+        meraki_client: MerakiClient | MerakiClientRegistry,
+        enabled: bool,
+        settings: ApiSettings | None = None,
+    ):
         self.mcp = mcp
         self.meraki_client = meraki_client
         self.settings = settings or ApiSettings()
         self._api_cache: Dict[str, List[str]] = {}
         self._device_cache: Dict[str, Dict] = {}
-        self._response_cache: Dict[str, Dict] = {}
-        self._cache_ttl = int(self.settings.CACHE_TTL_SECONDS)
-        self._search_patterns: List[Dict] = []
+        # Error responses for sections/methods the SDK does not have, with the
+        # monotonic time each expires; least recently used beyond the bound
+        self._unknown_endpoints: OrderedDict[Tuple[str, str], Tuple[float, str]] = (
+            OrderedDict()
+        )
+        self._search_index: Optional[EndpointIndex] = None
+        # One build at a time, whichever thread or caller starts it
+        self._index_lock = threading.Lock()
+        self._index_build: Optional[asyncio.Future] = None
+        # Resolved on demand for returned matches only
+        self._required_params: Dict[Tuple[str, str], List[str]] = {}
         self._patterns_initialized = False
         self.enabled = enabled
         if self.enabled:
@@ -187,22 +213,16 @@ class MerakiApiTools:
             return 0.3
 
     def _get_method_parameters(self, section: str, method: str) -> List[str]:
-        """Get required parameters for a method using inspection"""
-        try:
-            dashboard = self.meraki_client.get_dashboard()
-            section_obj = getattr(dashboard, section)
-            method_obj = getattr(section_obj, method)
-
-            sig = inspect.signature(method_obj)
-            required_params = []
-
-            for param_name, param in sig.parameters.items():
-                if param.default == inspect.Parameter.empty and param_name != "kwargs":
-                    required_params.append(param_name)
-
-            return required_params
-        except Exception:
-            return []
+        """Get required parameters for a method from the SDK catalog (memoized)"""
+        key = (section, method)
+        if key not in self._required_params:
+            try:
+                catalog = self.meraki_client.get_catalog()
+                params = catalog.required_params(section, method)
+            except Exception:
+                return []
+            self._required_params[key] = params
+        return self._required_params[key]
 
     def _generate_dynamic_patterns(self) -> List[Dict]:
         """Generate semantic patterns for ALL available API endpoints"""
@@ -213,7 +233,6 @@ class MerakiApiTools:
             for method in methods:
                 keywords = self._generate_keywords_from_method(section, method)
                 weight = self._calculate_method_weight(method)
-                required_params = self._get_method_parameters(section, method)
 
                 method_parts = re.findall(
                     r"[A-Z]?[a-z]+|[A-Z]+(?=[A-Z][a-z]|\b)", method
@@ -225,7 +244,6 @@ class MerakiApiTools:
                     "section": section,
                     "method": method,
                     "description": description,
-                    "required_params": required_params,
                     "weight": weight,
                 }
                 patterns.append(pattern)
@@ -236,56 +254,98 @@ class MerakiApiTools:
         """Initialize semantic search patterns by generating them dynamically from API structure"""
         return self._generate_dynamic_patterns()
 
-    def _calculate_semantic_score(self, query: str, pattern: Dict) -> float:
-        """Calculate semantic similarity score between query and pattern"""
-        query_words = set(re.findall(r"\b\w+\b", query.lower()))
-        pattern_keywords = set(pattern["keywords"])
-
-        intersection = len(query_words.intersection(pattern_keywords))
-        union = len(query_words.union(pattern_keywords))
-
-        if union == 0:
-            return 0.0
-
-        jaccard_score = intersection / union
-
-        weighted_score = jaccard_score * pattern["weight"]
-
-        exact_matches = sum(1 for word in query_words if word in pattern_keywords)
-        exact_bonus = min(exact_matches * 0.1, 0.3)
-
-        return min(weighted_score + exact_bonus, 1.0)
-
-    def _ensure_patterns_initialized(self):
-        """Ensure search patterns are initialized (lazy loading)"""
-        if not self._patterns_initialized:
+    def _ensure_patterns_initialized(self) -> EndpointIndex:
+        """Ensure search patterns are initialized (lazy loading, thread-safe)"""
+        index = self._search_index
+        if self._patterns_initialized and index is not None:
+            return index
+        with self._index_lock:
+            index = self._search_index
+            if self._patterns_initialized and index is not None:
+                return index
             logger.info(
                 "Initializing semantic search patterns for all API endpoints..."
             )
-            self._search_patterns = self._generate_dynamic_patterns()
-            self._patterns_initialized = True
-            logger.info(f"Initialized {len(self._search_patterns)} semantic patterns")
+            index = EndpointIndex(self._generate_dynamic_patterns())
+            self._search_index = index
+            # An empty index means discovery failed; build again next time
+            self._patterns_initialized = len(index) > 0
+            logger.info(f"Initialized {len(index)} semantic patterns")
+            return index
+
+    def start_index_build(self) -> asyncio.Future:
+        """Build the search index on a worker thread unless it is built or building.
+
+        Returns the build for callers to await. Called at server startup so
+        the first search normally finds the index ready.
+        """
+        build = self._index_build
+        failed = (
+            build is not None and build.done() and not self._patterns_initialized
+        )
+        if build is None or failed or (
+            not build.done() and build.get_loop() is not asyncio.get_running_loop()
+        ):
+            build = asyncio.ensure_future(
+                asyncio.to_thread(self._ensure_patterns_initialized)
+            )
+            build.add_done_callback(self._index_build_done)
+            self._index_build = build
+        return build
+
+    @staticmethod
+    def _index_build_done(build: asyncio.Future):
+        if not build.cancelled() and build.exception() is not None:
+            logger.error(
+                f"Failed to build the endpoint search index: {build.exception()}"
+            )
 
-    def _find_best_pattern_match(self, query: str) -> Optional[Dict]:
-        """Find the best matching pattern for the given query"""
-        self._ensure_patterns_initialized()
+    def _section_matches(self, api_structure: Dict[str, List[str]], query: str) -> Dict:
+        """Substring matches on section and method names, up to 8 per section"""
+        matches = {}
+        query_lower = query.lower()
+
+        for section, methods in api_structure.items():
+            section_matches = []
 
-        best_score = 0.0
-        best_pattern = None
+            # Section name matching
+            if any(word in section.lower() for word in query_lower.split()):
+                section_matches.extend(methods[:8])
 
-        for pattern in self._search_patterns:
-            score = self._calculate_semantic_score(query, pattern)
-            if score > best_score and score > 0.3:
-                best_score = score
-                best_pattern = pattern
+            # Method name matching
+            for method in methods:
+                if any(word in method.lower() for word in query_lower.split()):
+                    if method not in section_matches:
+                        section_matches.append(method)
 
-        return best_pattern
+            if section_matches:
+                matches[section] = section_matches[:8]
+
+        return matches
+
+    def _index_building_response(self, query: str) -> str:
+        """Answer from the names already known while the index is not ready"""
+        return json.dumps(
+            {
+                "query": query,
+                "index_status": "building",
+                "direct_match": None,
+                "results": [],
+                "matches": self._section_matches(self._api_cache, query),
+                "usage": (
+                    "The search index is still being built; "
+                    "retry shortly for ranked results"
+                ),
+            },
+            indent=2,
+        )
 
     def _register_tools(self):
         """Register the dynamic tools with the MCP server"""
         self.mcp.tool()(self.search_meraki_api_endpoints)
         self.mcp.tool()(self.execute_meraki_api_endpoint)
         self.mcp.tool()(self.get_meraki_endpoint_parameters)
+        self.mcp.tool()(self.get_server_performance_stats)
 
     def _discover_api_structure(self) -> Dict[str, List[str]]:
         """Discover all available API sections and their methods"""
@@ -293,28 +353,7 @@ class MerakiApiTools:
             return self._api_cache
 
         try:
-            dashboard = self.meraki_client.get_dashboard()
-            api_structure = {}
-
-            # Get all API sections
-            sections = [
-                attr
-                for attr in dir(dashboard)
-                if not attr.startswith("_")
-                and hasattr(getattr(dashboard, attr), "__class__")
-                and "api" in str(type(getattr(dashboard, attr))).lower()
-            ]
-
-            for section in sections:
-                section_obj = getattr(dashboard, section)
-                methods = [
-                    method
-                    for method in dir(section_obj)
-                    if not method.startswith("_")
-                    and callable(getattr(section_obj, method))
-                ]
-                api_structure[section] = methods
-
+            api_structure = self.meraki_client.get_catalog().structure()
             self._api_cache = api_structure
             return api_structure
 
@@ -322,21 +361,43 @@ class MerakiApiTools:
             logger.error(f"Failed to discover API structure: {e}")
             return {}
 
-    def _get_cache_key(self, section: str, method: str, **params) -> str:
-        """Generate a cache key for API responses"""
-        sorted_params = sorted(params.items())
-        return f"{section}.{method}:{hash(str(sorted_params))}"
-
-    def _is_cache_valid(self, cache_entry: Dict) -> bool:
-        """Check if cache entry is still valid"""
-        return time.time() - cache_entry.get("timestamp", 0) < self._cache_ttl
-
-    async def search_meraki_api_endpoints(self, query: str) -> str:
+    def _unknown_endpoint_error(self, section: str, method: str) -> Optional[str]:
+        """The remembered error for an unknown endpoint, until it expires"""
+        entry = self._unknown_endpoints.get((section, method))
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._unknown_endpoints[(section, method)]
+            return None
+        self._unknown_endpoints.move_to_end((section, method))
+        return entry[1]
+
+    def _remember_unknown_endpoint(self, section: str, method: str, response: str):
+        ttl = self.settings.CACHE_NEGATIVE_TTL_SECONDS
+        if ttl <= 0:
+            return
+        self._unknown_endpoints[(section, method)] = (time.monotonic() + ttl, response)
+        self._unknown_endpoints.move_to_end((section, method))
+        while len(self._unknown_endpoints) > MAX_UNKNOWN_ENDPOINTS:
+            self._unknown_endpoints.popitem(last=False)
+
+    @staticmethod
+    def _mark_stale(data, age: float) -> str:
+        """Wrap a stale cached response so callers can see it is not current"""
+        return json.dumps(
+            {"stale": True, "age_seconds": round(age), "data": data},
+            indent=2,
+            default=str,
+        )
+
+    async def search_meraki_api_endpoints(self, query: str, limit: int = 5) -> str:
         """
         Search and discover Meraki API endpoints using semantic similarity and natural language.
 
         This tool uses intelligent pattern matching and semantic scoring to find the most relevant
-        API endpoints. It analyzes query intent and matches against known patterns for instant results.
+        API endpoints. It analyzes query intent and matches against known patterns
+        for instant results, and ranks the best candidates (BM25 over endpoint names
+        and keywords) so you can usually pick the right endpoint from one search.
 
         SEMANTIC MATCHING:
         - Organizations: "get organizations", "list orgs", "show my organizations"
@@ -351,55 +412,72 @@ class MerakiApiTools:
                 - "device Q123 port 4 config" → switch.getDeviceSwitchPort
                 - "network clients" → networks.getNetworkClients
                 - "firewall rules" → appliance.getNetworkApplianceFirewallL3FirewallRules
+            limit (int): Number of ranked results to return (1-25, default 5)
 
         Returns:
             JSON string containing:
             - query: The search term used
-            - direct_match: Best semantic match with confidence score
-            - matches: Fallback section matches if no direct match
+            - direct_match: The top ranked result with its confidence score, when
+              it matches the query closely enough
+            - results: Up to `limit` endpoints with their required parameters,
+              ranked by relevance score, best first
+            - matches: Fallback section matches if nothing was ranked
             - usage: Instructions for next steps
         """
-        # Try semantic pattern matching first
-        best_pattern = self._find_best_pattern_match(query)
+        if not self._patterns_initialized:
+            try:
+                await asyncio.wait_for(
+                    asyncio.shield(self.start_index_build()),
+                    self.settings.SEARCH_INDEX_WAIT_SECONDS,
+                )
+            except Exception:
+                # Still building (or failed): answer from the names already known
+                # instead of holding the caller
+                return self._index_building_response(query)
+        index = self._search_index
+        if not self._patterns_initialized or index is None:
+            # The build found no endpoints; retry it off the loop, never inline
+            self.start_index_build()
+            return self._index_building_response(query)
+
+        ranked = index.top(query, max(1, min(limit, 25)))
+        results = [
+            {
+                "section": index.sections[i],
+                "method": index.methods[i],
+                "description": index.descriptions[i],
+                "required_params": self._get_method_parameters(
+                    index.sections[i], index.methods[i]
+                ),
+                "score": round(score, 3),
+            }
+            for i, score in ranked
+        ]
 
+        # The direct match is the top ranked result, so the two always agree;
+        # it is only offered when the query names that endpoint closely
         direct_match = None
-        if best_pattern:
-            direct_match = {
-                "section": best_pattern["section"],
-                "method": best_pattern["method"],
-                "description": best_pattern["description"],
-                "required_params": best_pattern["required_params"],
-                "confidence": self._calculate_semantic_score(query, best_pattern),
-            }
+        if ranked:
+            confidence = index.confidence(ranked[0][0], query)
+            if confidence > SEARCH_DIRECT_MATCH_THRESHOLD:
+                direct_match = {**results[0], "confidence": confidence}
+                del direct_match["score"]
 
         matches = {}
 
-        # Fallback to traditional search if no semantic match found
-        if not direct_match:
-            api_structure = self._discover_api_structure()
-            query_lower = query.lower()
-
-            for section, methods in api_structure.items():
-                section_matches = []
-
-                # Section name matching
-                if any(word in section.lower() for word in query_lower.split()):
-                    section_matches.extend(methods[:8])
-
-                # Method name matching
-                for method in methods:
-                    if any(word in method.lower() for word in query_lower.split()):
-                        if method not in section_matches:
-                            section_matches.append(method)
-
-                if section_matches:
-                    matches[section] = section_matches[:8]
+        # Fallback to traditional search if nothing matched a keyword
+        if not direct_match and not results:
+            matches = self._section_matches(self._api_cache, query)
 
         result = {
             "query": query,
             "direct_match": direct_match,
+            "results": results,
             "matches": matches,
-            "usage": "Use execute_api_endpoint with section='<section>' and method='<method>' to call an endpoint",
+            "usage": (
+                "Use execute_api_endpoint with section='<section>' and "
+                "method='<method>' to call an endpoint"
+            ),
         }
 
         return json.dumps(result, indent=2)
@@ -472,28 +550,15 @@ class MerakiApiTools:
         3. execute_api_endpoint(section, method, param1=value1, ...) → make the call
         """
         try:
-            dashboard = self.meraki_client.get_dashboard()
-            section_obj = getattr(dashboard, section)
-            method_obj = getattr(section_obj, method)
-
-            sig = inspect.signature(method_obj)
-            parameters = {}
-
-            for param_name, param in sig.parameters.items():
-                param_info = {
-                    "required": param.default == inspect.Parameter.empty,
-                    "type": str(param.annotation)
-                    if param.annotation != inspect.Parameter.empty
-                    else "unknown",
-                }
-                if param.default != inspect.Parameter.empty:
-                    param_info["default"] = param.default
-
-                parameters[param_name] = param_info
+            catalog = self.meraki_client.get_catalog()
+            parameters = catalog.parameters(section, method)
+            if parameters is None:
+                raise AttributeError(f"{section}.{method}")
 
             result = {
                 "section": section,
                 "method": method,
+                "summary": catalog.summary(section, method),
                 "parameters": parameters,
                 "usage_example": f"execute_api_endpoint(section='{section}', method='{method}', ...)",
             }
@@ -554,21 +619,6 @@ class MerakiApiTools:
             JSON string containing API response or error details
         """
         try:
-            cache_key = self._get_cache_key(
-                section,
-                method,
-                serial=serial,
-                portId=portId,
-                networkId=networkId,
-                organizationId=organizationId,
-                kwargs=kwargs,
-            )
-
-            if (not self.settings.DISABLE_RESPONSE_CACHE) and method.startswith("get") and cache_key in self._response_cache:
-                cache_entry = self._response_cache[cache_key]
-                if self._is_cache_valid(cache_entry):
-                    logger.info(f"Cache hit for {section}.{method}")
-                    return cache_entry["response"]
             # Policy checks (allow/deny + mutation guards)
             ok, reason = self._is_allowed(section, method)
             if not ok:
@@ -579,10 +629,12 @@ class MerakiApiTools:
                     "method": method,
                 }, indent=2)
 
-            def _call_api():
-                dashboard = self.meraki_client.get_dashboard()
-                section_obj = getattr(dashboard, section)
-                method_obj = getattr(section_obj, method)
+            def _prepare_call() -> Dict:
+                # Validated against the SDK catalog, so no SDK client is built
+                # (or introspected) on the event loop
+                catalog = self.meraki_client.get_catalog()
+                if not catalog.has(section, method):
+                    raise AttributeError(f"Unknown Meraki endpoint {section}.{method}")
 
                 all_params = {
                     "serial": serial,
@@ -611,35 +663,31 @@ class MerakiApiTools:
                 # Guard parameter sizes
                 filtered_params = self._apply_rate_guards(filtered_params)
 
-                sig = inspect.signature(method_obj)
-                missing_params = []
-
-                for param_name, param in sig.parameters.items():
-                    if (
-                        param.default == inspect.Parameter.empty
-                        and param_name != "kwargs"
-                    ):
-                        if param_name not in filtered_params:
-                            missing_params.append(param_name)
+                missing_params = [
+                    name
+                    for name in catalog.required_params(section, method)
+                    if name not in filtered_params
+                ]
 
                 if missing_params:
                     raise ValueError(
                         f"Missing required parameters: {', '.join(missing_params)}"
                     )
 
-                return method_obj(**filtered_params)
+                return filtered_params
 
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, _call_api)
-            safe_result = self._redact(result)
-            response_json = json.dumps(safe_result, indent=2, default=str)
-            if (not self.settings.DISABLE_RESPONSE_CACHE) and method.startswith("get"):
-                self._response_cache[cache_key] = {
-                    "response": response_json,
-                    "timestamp": time.time(),
-                }
+            unknown = self._unknown_endpoint_error(section, method)
+            if unknown is not None:
+                return unknown
 
-            return response_json
+            call_params = _prepare_call()
+            # Reads are served from the client's shared cache when possible
+            result = await self.meraki_client.fetch(section, method, **call_params)
+            data = self._redact(result.value)
+            if result.stale:
+                logger.info(f"Serving stale {section}.{method} while it refreshes")
+                return self._mark_stale(data, result.age)
+            return json.dumps(data, indent=2, default=str)
 
         except ValueError as ve:
             error_result = {
@@ -679,7 +727,12 @@ class MerakiApiTools:
                     "suggestion": "Use search_meraki_api_endpoints to find the correct method",
                 }
 
-            return json.dumps(error_result, indent=2)
+            response_json = json.dumps(error_result, indent=2)
+            # Remembered like other failed reads, so repeated mistakes skip the
+            # lookup; AttributeErrors from endpoints that do exist are not
+            if api_structure and method not in api_structure.get(section, []):
+                self._remember_unknown_endpoint(section, method, response_json)
+            return response_json
 
         except Exception as e:
             logger.error(f"API call failed: {e}")
@@ -702,3 +755,26 @@ class MerakiApiTools:
             if kwargs:
                 error_result["additional_params"] = kwargs
             return json.dumps(error_result, indent=2)
+
+    async def get_server_performance_stats(self) -> str:
+        """
+        Report how this server's caches, rate limiters and worker pools are performing.
+
+        Use it to tune cache TTLs and concurrency settings from real traffic.
+        The same data is logged as one "server_performance_stats" JSON line on
+        every call (and every STATS_LOG_SECONDS when that is set).
+
+        Returns:
+            JSON string containing:
+            - cache: entries, bytes, evictions, overall and per-section hit
+              rates, and compression
+            - rate_limiter: per-org queue depth and wait times, alongside
+              coalesced reads and open circuit breakers (for the calling
+              tenant only, by hashed API key, under "tenants" on a
+              multi-tenant server)
+            - pools: per worker pool (interactive, bulk, background) active
+              calls, queue depth and saturation
+        """
+        stats = collect_performance_stats(self.meraki_client, tenant_only=True)
+        log_performance_stats(stats)
+        return json.dumps(stats, indent=2, default=str)
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import json
 import logging
 from collections import defaultdict
@@ -7,6 +8,9 @@ from typing import Dict, List, Optional, Tuple
 
 from mcp.server.fastmcp import FastMCP
 
+from meraki_mcp.services.client_registry import MerakiClientRegistry
+from meraki_mcp.services.deadline import Deadline, current_deadline
+from meraki_mcp.services.executor import BULK
 from meraki_mcp.services.meraki_client import MerakiClient
 
 logger = logging.getLogger(__name__)
@@ -15,7 +19,12 @@ logger = logging.getLogger(__name__)
 class MerakiComplexApiTools:
     """Complex tool class that combines multiple Meraki API calls to provide advanced analysis and insights"""
 
-    def __init__(self, mcp: FastMCP, meraki_client: MerakiClient, enabled: bool):
+    def __init__(
+        self,
+        mcp: FastMCP,
+        meraki_client: MerakiClient | MerakiClientRegistry,
+        enabled: bool,
+    ):
         self.mcp = mcp
         self.meraki_client = meraki_client
         self.enabled = enabled
@@ -26,14 +35,51 @@ class MerakiComplexApiTools:
 
     def _register_tools(self):
         """Register the complex tools with the MCP server"""
-        self.mcp.tool()(self.analyze_network_topology)
-        self.mcp.tool()(self.analyze_device_health)
-        self.mcp.tool()(self.audit_network_security)
-        self.mcp.tool()(self.analyze_network_performance)
-        self.mcp.tool()(self.analyze_configuration_drift)
-        self.mcp.tool()(self.troubleshoot_connectivity)
-        self.mcp.tool()(self.analyze_client_experience)
-        self.mcp.tool()(self.generate_network_inventory_report)
+        for tool in (
+            self.analyze_network_topology,
+            self.analyze_device_health,
+            self.audit_network_security,
+            self.analyze_network_performance,
+            self.analyze_configuration_drift,
+            self.troubleshoot_connectivity,
+            self.analyze_client_experience,
+            self.generate_network_inventory_report,
+        ):
+            self.mcp.tool()(self._with_deadline(tool))
+
+    def _with_deadline(self, tool):
+        """Run a tool under COMPLEX_TOOL_DEADLINE_SECONDS and flag partial reports"""
+
+        @functools.wraps(tool)
+        async def wrapper(*args, **kwargs):
+            seconds = self.meraki_client.settings.COMPLEX_TOOL_DEADLINE_SECONDS
+            if seconds <= 0:
+                return await tool(*args, **kwargs)
+            deadline = Deadline(seconds)
+            token = current_deadline.set(deadline)
+            try:
+                result = await tool(*args, **kwargs)
+            finally:
+                current_deadline.reset(token)
+            return self._mark_partial(result, deadline)
+
+        return wrapper
+
+    def _mark_partial(self, result: str, deadline: Deadline) -> str:
+        """Annotate a JSON report with the sub-calls skipped at the deadline"""
+        if not deadline.skipped:
+            return result
+        try:
+            report = json.loads(result)
+        except ValueError:
+            return result
+        if not isinstance(report, dict):
+            return result
+        report["partial"] = True
+        report["deadline_seconds"] = deadline.seconds
+        report["skipped_count"] = len(deadline.skipped)
+        report["skipped"] = deadline.skipped[:50]
+        return json.dumps(report, indent=2, default=str)
 
     async def analyze_network_topology(
         self, network_id: str, include_clients: bool = False
@@ -61,13 +107,11 @@ class MerakiComplexApiTools:
             - Client distribution (if requested)
         """
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             devices = await self._async_call(
-                dashboard.networks.getNetworkDevices, networkId=network_id
+                "networks", "getNetworkDevices", networkId=network_id
             )
             network_info = await self._async_call(
-                dashboard.networks.getNetwork, networkId=network_id
+                "networks", "getNetwork", networkId=network_id
             )
 
             topology = {
@@ -110,7 +154,7 @@ class MerakiComplexApiTools:
 
             try:
                 vlans = await self._async_call(
-                    dashboard.appliance.getNetworkApplianceVlans, networkId=network_id
+                    "appliance", "getNetworkApplianceVlans", networkId=network_id
                 )
                 if isinstance(vlans, list):
                     for vlan in vlans:
@@ -176,10 +220,8 @@ class MerakiComplexApiTools:
             - Firmware update status
         """
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             # Get basic device information using the working API call we tested
-            device = await self._async_call(dashboard.devices.getDevice, serial=serial)
+            device = await self._async_call("devices", "getDevice", serial=serial)
 
             # Build basic health report
             health_report = {
@@ -300,8 +342,6 @@ class MerakiComplexApiTools:
             - Recommendations (if requested)
         """
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             audit_report = {
                 "network_id": network_id,
                 "security_score": 100,
@@ -318,7 +358,7 @@ class MerakiComplexApiTools:
 
             # Get network information
             network = await self._async_call(
-                dashboard.networks.getNetwork, networkId=network_id
+                "networks", "getNetwork", networkId=network_id
             )
             audit_report["network_name"] = network.get("name", "Unknown")
 
@@ -380,8 +420,6 @@ class MerakiComplexApiTools:
             - Optimization recommendations
         """
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             performance_report = {
                 "network_id": network_id,
                 "time_span": time_span,
@@ -401,10 +439,10 @@ class MerakiComplexApiTools:
 
             # Get network and device information
             network = await self._async_call(
-                dashboard.networks.getNetwork, networkId=network_id
+                "networks", "getNetwork", networkId=network_id
             )
             devices = await self._async_call(
-                dashboard.networks.getNetworkDevices, networkId=network_id
+                "networks", "getNetworkDevices", networkId=network_id
             )
 
             performance_report["network_name"] = network.get("name", "Unknown")
@@ -418,7 +456,8 @@ class MerakiComplexApiTools:
             # Get network clients and traffic analytics
             try:
                 clients = await self._async_call(
-                    dashboard.networks.getNetworkClients,
+                    "networks",
+                    "getNetworkClients",
                     networkId=network_id,
                     timespan=time_span,
                     perPage=100,
@@ -475,8 +514,6 @@ class MerakiComplexApiTools:
             - Recommended templates
         """
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             drift_report = {
                 "organization_id": organization_id,
                 "analysis_time": datetime.utcnow().isoformat(),
@@ -492,12 +529,13 @@ class MerakiComplexApiTools:
                 networks = []
                 for network_id in network_ids:
                     network = await self._async_call(
-                        dashboard.networks.getNetwork, networkId=network_id
+                        "networks", "getNetwork", networkId=network_id
                     )
                     networks.append(network)
             else:
                 networks = await self._async_call(
-                    dashboard.organizations.getOrganizationNetworks,
+                    "organizations",
+                    "getOrganizationNetworks",
                     organizationId=organization_id,
                 )
 
@@ -557,8 +595,6 @@ class MerakiComplexApiTools:
             - Remediation steps
         """
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             troubleshoot_report = {
                 "test_parameters": {
                     "source_ip": source_ip,
@@ -574,12 +610,12 @@ class MerakiComplexApiTools:
 
             # Get network information
             network = await self._async_call(
-                dashboard.networks.getNetwork, networkId=network_id
+                "networks", "getNetwork", networkId=network_id
             )
 
             # Find source and destination in network
             clients = await self._async_call(
-                dashboard.networks.getNetworkClients, networkId=network_id, perPage=1000
+                "networks", "getNetworkClients", networkId=network_id, perPage=1000
             )
 
             source_client = None
@@ -648,8 +684,6 @@ class MerakiComplexApiTools:
             - Improvement recommendations
         """
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             experience_report = {
                 "network_id": network_id,
                 "time_span": time_span,
@@ -668,13 +702,14 @@ class MerakiComplexApiTools:
 
             # Get network information
             network = await self._async_call(
-                dashboard.networks.getNetwork, networkId=network_id
+                "networks", "getNetwork", networkId=network_id
             )
             experience_report["network_name"] = network.get("name", "Unknown")
 
             # Get client information
             clients = await self._async_call(
-                dashboard.networks.getNetworkClients,
+                "networks",
+                "getNetworkClients",
                 networkId=network_id,
                 timespan=time_span,
                 perPage=1000,
@@ -735,8 +770,6 @@ class MerakiComplexApiTools:
             - Cost optimization opportunities
         """
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             inventory_report = {
                 "organization_id": organization_id,
                 "report_time": datetime.utcnow().isoformat(),
@@ -758,14 +791,16 @@ class MerakiComplexApiTools:
 
             # Get organization information
             org = await self._async_call(
-                dashboard.organizations.getOrganization,
+                "organizations",
+                "getOrganization",
                 organizationId=organization_id,
             )
             inventory_report["organization_name"] = org.get("name", "Unknown")
 
             # Get all devices
             devices = await self._async_call(
-                dashboard.organizations.getOrganizationDevices,
+                "organizations",
+                "getOrganizationDevices",
                 organizationId=organization_id,
             )
 
@@ -774,7 +809,8 @@ class MerakiComplexApiTools:
             # Get licensing information
             try:
                 licenses = await self._async_call(
-                    dashboard.organizations.getOrganizationLicenses,
+                    "organizations",
+                    "getOrganizationLicenses",
                     organizationId=organization_id,
                 )
                 self._analyze_license_utilization(licenses, inventory_report)
@@ -819,10 +855,27 @@ class MerakiComplexApiTools:
             )
 
     # Helper methods
-    async def _async_call(self, func, **kwargs):
-        """Execute synchronous function asynchronously"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: func(**kwargs))
+    async def _async_call(self, section: str, method: str, **kwargs):
+        """Execute a Meraki API call on the client's bulk pool.
+
+        Under a tool deadline the call is skipped once the budget is spent, and
+        cancelled if it is still pending when the budget runs out; both raise
+        DeadlineExceeded and are listed in the partial report.
+        """
+        call = self.meraki_client.call(section, method, pool=BULK, **kwargs)
+        deadline = current_deadline.get()
+        if deadline is None:
+            return await call
+
+        args = ", ".join(f"{k}={v}" for k, v in kwargs.items())
+        label = f"{section}.{method}({args})"
+        if deadline.expired:
+            call.close()
+            raise deadline.skip(label)
+        try:
+            return await asyncio.wait_for(call, deadline.remaining())
+        except asyncio.TimeoutError:
+            raise deadline.skip(label) from None
 
     def _get_device_type(self, model: str) -> str:
         """Determine device type from model"""
@@ -844,11 +897,9 @@ class MerakiComplexApiTools:
     ):
         """Analyze switch-specific topology information"""
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             # Get switch ports
             ports = await self._async_call(
-                dashboard.switch.getDeviceSwitchPorts, serial=device["serial"]
+                "switch", "getDeviceSwitchPorts", serial=device["serial"]
             )
 
             for port in ports:
@@ -864,7 +915,8 @@ class MerakiComplexApiTools:
                 # Get port status
                 try:
                     statuses = await self._async_call(
-                        dashboard.switch.getDeviceSwitchPortsStatuses,
+                        "switch",
+                        "getDeviceSwitchPortsStatuses",
                         serial=device["serial"],
                     )
                     for status in statuses:
@@ -894,11 +946,10 @@ class MerakiComplexApiTools:
     ):
         """Analyze appliance-specific topology information"""
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             # Get uplink status
             uplinks = await self._async_call(
-                dashboard.appliance.getDeviceApplianceUplinksSettings,
+                "appliance",
+                "getDeviceApplianceUplinksSettings",
                 serial=device["serial"],
             )
 
@@ -915,7 +966,7 @@ class MerakiComplexApiTools:
             # Get DHCP subnets
             try:
                 vlans = await self._async_call(
-                    dashboard.appliance.getNetworkApplianceVlans, networkId=network_id
+                    "appliance", "getNetworkApplianceVlans", networkId=network_id
                 )
                 device_detail["dhcp_subnets"] = (
                     len(vlans) if isinstance(vlans, list) else 0
@@ -931,11 +982,9 @@ class MerakiComplexApiTools:
     ):
         """Analyze wireless-specific topology information"""
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             # Get wireless status
             status = await self._async_call(
-                dashboard.wireless.getDeviceWirelessStatus, serial=device["serial"]
+                "wireless", "getDeviceWirelessStatus", serial=device["serial"]
             )
 
             device_detail["wireless_info"] = {
@@ -949,10 +998,9 @@ class MerakiComplexApiTools:
     async def _analyze_client_distribution(self, topology: Dict, network_id: str):
         """Analyze how clients are distributed across the network"""
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             clients = await self._async_call(
-                dashboard.networks.getNetworkClients,
+                "networks",
+                "getNetworkClients",
                 networkId=network_id,
                 perPage=1000,
             )
@@ -1014,11 +1062,9 @@ class MerakiComplexApiTools:
     ):
         """Analyze switch-specific health metrics"""
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             # Check port statuses
             port_statuses = await self._async_call(
-                dashboard.switch.getDeviceSwitchPortsStatuses, serial=serial
+                "switch", "getDeviceSwitchPortsStatuses", serial=serial
             )
 
             port_health = {
@@ -1053,7 +1099,8 @@ class MerakiComplexApiTools:
             if "PoE" in device.get("model", ""):
                 try:
                     port_statuses = await self._async_call(
-                        dashboard.switch.getDeviceSwitchPortsStatuses,
+                        "switch",
+                        "getDeviceSwitchPortsStatuses",
                         serial=serial,
                     )
                     # Analyze power consumption
@@ -1077,11 +1124,9 @@ class MerakiComplexApiTools:
     ):
         """Analyze appliance-specific health metrics"""
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             # Check uplink status
             performance = await self._async_call(
-                dashboard.appliance.getDeviceAppliancePerformance, serial=serial
+                "appliance", "getDeviceAppliancePerformance", serial=serial
             )
 
             health_report["components"]["performance"] = {
@@ -1101,7 +1146,8 @@ class MerakiComplexApiTools:
             # Check uplinks
             try:
                 uplinks = await self._async_call(
-                    dashboard.appliance.getOrganizationApplianceUplinkStatuses,
+                    "appliance",
+                    "getOrganizationApplianceUplinkStatuses",
                     organizationId=organization_id,
                     serials=[serial],
                 )
@@ -1140,11 +1186,10 @@ class MerakiComplexApiTools:
     ):
         """Analyze wireless-specific health metrics"""
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             # Get connection stats
             connection_stats = await self._async_call(
-                dashboard.wireless.getDeviceWirelessConnectionStats,
+                "wireless",
+                "getDeviceWirelessConnectionStats",
                 serial=serial,
                 timespan=time_span,
             )
@@ -1201,11 +1246,10 @@ class MerakiComplexApiTools:
     ):
         """Check if device firmware is up to date"""
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             # Get available firmware versions
             firmware_upgrades = await self._async_call(
-                dashboard.organizations.getOrganizationFirmwareUpgrades,
+                "organizations",
+                "getOrganizationFirmwareUpgrades",
                 organizationId=organization_id,
             )
 
@@ -1257,11 +1301,10 @@ class MerakiComplexApiTools:
     async def _audit_firewall_security(self, network_id: str, audit_report: Dict):
         """Audit firewall security configuration"""
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             # Get L3 firewall rules
             l3_rules = await self._async_call(
-                dashboard.appliance.getNetworkApplianceFirewallL3FirewallRules,
+                "appliance",
+                "getNetworkApplianceFirewallL3FirewallRules",
                 networkId=network_id,
             )
 
@@ -1308,7 +1351,8 @@ class MerakiComplexApiTools:
             # Check L7 firewall rules
             try:
                 l7_rules = await self._async_call(
-                    dashboard.appliance.getNetworkApplianceFirewallL7FirewallRules,
+                    "appliance",
+                    "getNetworkApplianceFirewallL7FirewallRules",
                     networkId=network_id,
                 )
                 firewall_audit["l7_rules"] = len(l7_rules.get("rules", []))
@@ -1321,11 +1365,9 @@ class MerakiComplexApiTools:
     async def _audit_wireless_security(self, network_id: str, audit_report: Dict):
         """Audit wireless security configuration"""
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             # Get SSIDs
             ssids = await self._async_call(
-                dashboard.wireless.getNetworkWirelessSsids, networkId=network_id
+                "wireless", "getNetworkWirelessSsids", networkId=network_id
             )
 
             wireless_audit = {"total_ssids": 0, "enabled_ssids": 0, "findings": []}
@@ -1392,17 +1434,16 @@ class MerakiComplexApiTools:
     async def _audit_network_settings(self, network_id: str, audit_report: Dict):
         """Audit network-wide security settings"""
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             # Check Intrusion Detection settings if available
             network = await self._async_call(
-                dashboard.networks.getNetwork, networkId=network_id
+                "networks", "getNetwork", networkId=network_id
             )
 
             if "appliance" in network.get("productTypes", []):
                 try:
                     ids_settings = await self._async_call(
-                        dashboard.appliance.getNetworkApplianceSecurityIntrusion,
+                        "appliance",
+                        "getNetworkApplianceSecurityIntrusion",
                         networkId=network_id,
                     )
 
@@ -1433,7 +1474,8 @@ class MerakiComplexApiTools:
                 # Check content filtering
                 try:
                     content_filtering = await self._async_call(
-                        dashboard.appliance.getNetworkApplianceContentFiltering,
+                        "appliance",
+                        "getNetworkApplianceContentFiltering",
                         networkId=network_id,
                     )
 
@@ -1454,11 +1496,10 @@ class MerakiComplexApiTools:
     async def _audit_admin_access(self, network: Dict, audit_report: Dict):
         """Audit administrator access and permissions"""
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             # Get organization admins
             admins = await self._async_call(
-                dashboard.organizations.getOrganizationAdmins,
+                "organizations",
+                "getOrganizationAdmins",
                 organizationId=network["organizationId"],
             )
 
@@ -1569,7 +1610,6 @@ class MerakiComplexApiTools:
     ):
         """Analyze individual device performance metrics"""
         try:
-            dashboard = self.meraki_client.get_dashboard()
             device_type = self._get_device_type(device["model"])
 
             device_metrics = {
@@ -1583,7 +1623,8 @@ class MerakiComplexApiTools:
                 # Get switch port utilization
                 try:
                     port_statuses = await self._async_call(
-                        dashboard.switch.getDeviceSwitchPortsStatuses,
+                        "switch",
+                        "getDeviceSwitchPortsStatuses",
                         serial=device["serial"],
                     )
 
@@ -1606,7 +1647,8 @@ class MerakiComplexApiTools:
                 # Get appliance performance score
                 try:
                     perf = await self._async_call(
-                        dashboard.appliance.getDeviceAppliancePerformance,
+                        "appliance",
+                        "getDeviceAppliancePerformance",
                         serial=device["serial"],
                     )
                     device_metrics["performance"]["score"] = perf.get("perfScore", 0)
@@ -1709,11 +1751,9 @@ class MerakiComplexApiTools:
     ):
         """Analyze traffic patterns and application usage"""
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             # Get traffic analytics if available
             traffic_analysis = await self._async_call(
-                dashboard.networks.getNetworkTrafficAnalysis, networkId=network_id
+                "networks", "getNetworkTrafficAnalysis", networkId=network_id
             )
 
             # Get top applications
@@ -1795,8 +1835,6 @@ class MerakiComplexApiTools:
     ):
         """Analyze configuration consistency within a group of similar networks"""
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             group_key = " + ".join(product_types)
             group_analysis = {
                 "network_count": len(networks),
@@ -1814,7 +1852,8 @@ class MerakiComplexApiTools:
                 if "wireless" in product_types:
                     try:
                         ssids = await self._async_call(
-                            dashboard.wireless.getNetworkWirelessSsids,
+                            "wireless",
+                            "getNetworkWirelessSsids",
                             networkId=network["id"],
                         )
                         config["ssids"] = [
@@ -1826,7 +1865,8 @@ class MerakiComplexApiTools:
                 if "appliance" in product_types:
                     try:
                         vlans = await self._async_call(
-                            dashboard.appliance.getNetworkApplianceVlans,
+                            "appliance",
+                            "getNetworkApplianceVlans",
                             networkId=network["id"],
                         )
                         config["vlan_count"] = len(vlans)
@@ -1931,11 +1971,10 @@ class MerakiComplexApiTools:
     ):
         """Troubleshoot connectivity through appliance"""
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             # Check firewall rules
             l3_rules = await self._async_call(
-                dashboard.appliance.getNetworkApplianceFirewallL3FirewallRules,
+                "appliance",
+                "getNetworkApplianceFirewallL3FirewallRules",
                 networkId=network_id,
             )
 
@@ -1980,8 +2019,6 @@ class MerakiComplexApiTools:
     ):
         """Troubleshoot connectivity through switches"""
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             # Check if clients are on same VLAN
             if source_client and dest_client:
                 source_vlan = source_client.get("vlan")
@@ -2088,11 +2125,10 @@ class MerakiComplexApiTools:
     ):
         """Analyze wireless-specific client experience metrics"""
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             # Get wireless health stats
             connection_stats = await self._async_call(
-                dashboard.wireless.getNetworkWirelessConnectionStats,
+                "wireless",
+                "getNetworkWirelessConnectionStats",
                 networkId=network_id,
                 timespan=time_span,
             )
@@ -2122,7 +2158,8 @@ class MerakiComplexApiTools:
 
             # Get failed connection attempts
             failed_connections = await self._async_call(
-                dashboard.wireless.getNetworkWirelessFailedConnections,
+                "wireless",
+                "getNetworkWirelessFailedConnections",
                 networkId=network_id,
                 timespan=time_span,
             )
@@ -2227,31 +2264,35 @@ class MerakiComplexApiTools:
     async def _get_client_inventory(self, organization_id: str, inventory_report: Dict):
         """Get inventory of client devices"""
         try:
-            dashboard = self.meraki_client.get_dashboard()
-
             # Get all networks
             networks = await self._async_call(
-                dashboard.organizations.getOrganizationNetworks,
+                "organizations",
+                "getOrganizationNetworks",
                 organizationId=organization_id,
             )
 
             total_clients = 0
             unique_clients = set()
 
-            for network in networks[:10]:  # Limit to prevent timeout
-                try:
-                    clients = await self._async_call(
-                        dashboard.networks.getNetworkClients,
+            # Fetched concurrently; the tool deadline bounds the total time
+            results = await asyncio.gather(
+                *(
+                    self._async_call(
+                        "networks",
+                        "getNetworkClients",
                         networkId=network["id"],
                         perPage=100,
                     )
-
-                    for client in clients:
-                        unique_clients.add(client.get("mac"))
-                        total_clients += 1
-
-                except Exception:
-                    pass
+                    for network in networks
+                ),
+                return_exceptions=True,
+            )
+            for clients in results:
+                if isinstance(clients, BaseException):
+                    continue
+                for client in clients:
+                    unique_clients.add(client.get("mac"))
+                    total_clients += 1
 
             inventory_report["summary"]["client_devices"] = {
                 "total_seen": total_clients,
@@ -0,0 +1,283 @@
+import asyncio
+import fnmatch
+import os
+import socketserver
+import sqlite3
+import stat
+import threading
+import time
+
+import pytest
+
+from meraki_mcp.services import cache_backends
+from meraki_mcp.services.cache_backends import (
+    RedisCacheBackend,
+    RespConnection,
+    SharedMemoryCacheBackend,
+    SqliteCacheBackend,
+    open_cache_backend,
+)
+from meraki_mcp.services.response_cache import ResponseCache
+from meraki_mcp.settings import ApiSettings
+
+
+class StandInRedis(socketserver.ThreadingTCPServer):
+    """Just enough of a Redis server to exercise the RESP client"""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), RespHandler)
+        self.data = {}
+        self.expiry = {}
+        self.zsets = {}
+        self.lock = threading.Lock()
+        self.commands = []
+
+    def alive(self, key):
+        if key in self.expiry and self.expiry[key] <= time.monotonic():
+            self.data.pop(key, None)
+            self.expiry.pop(key, None)
+        return key in self.data
+
+
+class RespHandler(socketserver.StreamRequestHandler):
+    def read_command(self):
+        header = self.rfile.readline()
+        if not header:
+            return None
+        args = []
+        for _ in range(int(header[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def handle(self):
+        while (args := self.read_command()) is not None:
+            self.wfile.write(self.dispatch(args[0].decode().upper(), args[1:]))
+
+    def dispatch(self, cmd, args):
+        server = self.server
+        server.commands.append(cmd)
+        with server.lock:
+            if cmd in ("PING", "AUTH", "SELECT"):
+                return b"+OK\r\n"
+            if cmd == "SET":
+                server.data[args[0]] = args[1]
+                server.expiry[args[0]] = time.monotonic() + int(args[3]) / 1000
+                return b"+OK\r\n"
+            if cmd == "GET":
+                if not server.alive(args[0]):
+                    return b"$-1\r\n"
+                value = server.data[args[0]]
+                return b"$%d\r\n%s\r\n" % (len(value), value)
+            if cmd == "PTTL":
+                if not server.alive(args[0]):
+                    return b":-2\r\n"
+                return b":%d\r\n" % int(
+                    (server.expiry[args[0]] - time.monotonic()) * 1000
+                )
+            if cmd == "DEL":
+                removed = sum(
+                    (server.data.pop(k, None) or server.zsets.pop(k, None)) is not None
+                    for k in args
+                )
+                return b":%d\r\n" % removed
+            if cmd == "ZADD":
+                server.zsets.setdefault(args[0], {})[args[2]] = float(args[1])
+                return b":1\r\n"
+            if cmd in ("ZREMRANGEBYSCORE", "ZRANGEBYSCORE"):
+                low, high = float(args[1]), float(args[2])
+                zset = server.zsets.get(args[0], {})
+                members = [m for m, score in zset.items() if low <= score <= high]
+                if cmd == "ZREMRANGEBYSCORE":
+                    for member in members:
+                        del zset[member]
+                    return b":%d\r\n" % len(members)
+                body = b"".join(b"$%d\r\n%s\r\n" % (len(m), m) for m in members)
+                return b"*%d\r\n%s" % (len(members), body)
+            if cmd == "SCAN":
+                pattern = args[2].decode()
+                keys = [
+                    k
+                    for k in [*server.data, *server.zsets]
+                    if fnmatch.fnmatch(k.decode(), pattern)
+                ]
+                body = b"".join(b"$%d\r\n%s\r\n" % (len(k), k) for k in keys)
+                return b"*2\r\n$1\r\n0\r\n*%d\r\n%s" % (len(keys), body)
+            return b"-ERR unknown command\r\n"
+
+
+@pytest.fixture
+def redis_server():
+    server = StandInRedis()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server):
+    host, port = server.server_address
+    return f"redis://{host}:{port}/0"
+
+
+def test_resp_connection_round_trip(redis_server):
+    conn = RespConnection(*redis_server.server_address, timeout=1)
+    assert conn.execute("SET", "k", "v", "PX", 1000) == "OK"
+    assert conn.pipeline(("GET", "k"), ("GET", "missing")) == [b"v", None]
+    conn.close()
+
+
+def test_replicas_share_responses_through_redis(redis_server):
+    replica_a = ResponseCache(
+        1 << 20, 60, backend=RedisCacheBackend(_url(redis_server))
+    )
+    replica_b = ResponseCache(
+        1 << 20, 60, backend=RedisCacheBackend(_url(redis_server))
+    )
+
+    replica_a.set("ns:networks.getNetwork:abc", '{"id": "N_1"}')
+    assert replica_b.get("ns:networks.getNetwork:abc") == '{"id": "N_1"}'
+    assert replica_b.backend.stats()["hits"] == 1
+
+    replica_b.clear()
+    assert replica_a.backend.get("ns:networks.getNetwork:abc") is None
+    replica_a.close()
+    replica_b.close()
+
+
+@pytest.mark.parametrize("kind", ["sqlite", "redis"])
+def test_write_in_one_process_invalidates_shared_entries(kind, tmp_path, redis_server):
+    def open_backend():
+        if kind == "sqlite":
+            return SqliteCacheBackend(str(tmp_path / "shared.sqlite3"))
+        return RedisCacheBackend(_url(redis_server))
+
+    reader = ResponseCache(1 << 20, 60, backend=open_backend())
+    writer = ResponseCache(1 << 20, 60, backend=open_backend())
+    reader.set("ns:networks.getNetwork:a", {"id": "N_1"}, tags=["net:N_1"])
+    reader.set("ns:networks.getNetwork:b", {"id": "N_2"}, tags=["net:N_2"])
+
+    # The writer never saw the read, but the backend's tag index has it
+    assert writer.invalidate(["net:N_1"]) == 1
+    restarted = ResponseCache(1 << 20, 60, backend=open_backend())
+    assert restarted.get("ns:networks.getNetwork:a") is None
+    assert restarted.get("ns:networks.getNetwork:b") == {"id": "N_2"}
+    for cache in (reader, writer, restarted):
+        cache.close()
+
+
+def test_redis_entries_expire_with_their_ttl(redis_server):
+    backend = RedisCacheBackend(_url(redis_server))
+    backend.set("k", "v", ttl=0.01)
+    time.sleep(0.02)
+    assert backend.get("k") is None
+    backend.close()
+
+
+def test_unreachable_redis_degrades_to_misses(redis_server):
+    host, port = redis_server.server_address
+    redis_server.shutdown()
+    redis_server.server_close()
+    backend = RedisCacheBackend(f"redis://{host}:{port}", timeout=0.1)
+
+    assert backend.get("k") is None
+    backend.set("k", "v", ttl=60)
+    # Only the first failure pays for a connection attempt
+    assert backend.stats()["errors"] == 1
+
+
+def test_shared_memory_backend_is_visible_to_other_workers(tmp_path):
+    path = str(tmp_path / "shm-cache.sqlite3")
+    worker_a = SharedMemoryCacheBackend(path)
+    worker_b = SharedMemoryCacheBackend(path)
+    worker_a.set("k", "v", ttl=60)
+    value, remaining = worker_b.get("k")
+    assert value == "v" and 0 < remaining <= 60
+    worker_a.close()
+    worker_b.close()
+
+
+def test_shared_memory_cache_is_private_to_its_user(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_backends, "SHM_DIR", str(tmp_path))
+    backend = SharedMemoryCacheBackend()
+    backend.set("k", "secret", ttl=60)
+    assert backend.path.parent.name == f"meraki-mcp-{os.getuid()}"
+    assert stat.S_IMODE(backend.path.parent.stat().st_mode) == 0o700
+    assert stat.S_IMODE(backend.path.stat().st_mode) == 0o600
+    backend.close()
+
+    # A file planted by someone else is refused, which disables the tier
+    monkeypatch.setattr(os, "getuid", lambda: backend.path.stat().st_uid + 1)
+    with pytest.raises(PermissionError):
+        SqliteCacheBackend(str(backend.path))
+    settings = ApiSettings()
+    settings.CACHE_BACKEND = "sqlite"
+    settings.CACHE_PERSIST_PATH = str(backend.path)
+    assert open_cache_backend(settings) is None
+
+
+def test_sqlite_errors_degrade_to_misses(tmp_path):
+    path = tmp_path / "responses.sqlite3"
+    backend = SqliteCacheBackend(str(path))
+    backend._conn.execute("PRAGMA busy_timeout = 10")
+    cache = ResponseCache(1 << 20, default_ttl=60, backend=backend)
+    other = sqlite3.connect(str(path), isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+
+    # "database is locked" on write: the entry is still served from memory
+    cache.set("k", {"id": 1})
+    assert cache.get("k") == {"id": 1}
+    other.execute("DROP TABLE responses")
+    other.execute("COMMIT")
+    # "no such table" on read is a miss, not an exception
+    assert backend.get("k") is None
+    cache.delete("k")
+    stats = backend.stats()
+    assert stats["entries"] is None and stats["errors"] == 4
+    other.close()
+    cache.close()
+
+
+class ThreadRecordingBackend(SqliteCacheBackend):
+    def __init__(self, path):
+        super().__init__(path)
+        self.threads = []
+
+    def get(self, key):
+        self.threads.append(threading.current_thread())
+        return super().get(key)
+
+    def set(self, key, value, ttl, tags=()):
+        self.threads.append(threading.current_thread())
+        super().set(key, value, ttl, tags)
+
+
+def test_async_cache_calls_keep_backend_io_off_the_loop(tmp_path):
+    backend = ThreadRecordingBackend(str(tmp_path / "responses.sqlite3"))
+    cache = ResponseCache(1 << 20, default_ttl=60, backend=backend)
+
+    async def run():
+        await cache.aset("k", {"id": 1})
+        cache._entries.clear()
+        return await cache.alookup("k")
+
+    assert asyncio.run(run()).value == {"id": 1}
+    assert len(backend.threads) == 2
+    assert threading.main_thread() not in backend.threads
+    cache.close()
+
+
+def test_open_cache_backend_selects_from_settings(tmp_path, redis_server):
+    settings = ApiSettings()
+    assert open_cache_backend(settings) is None
+
+    settings.CACHE_PERSIST_PATH = str(tmp_path / "responses.sqlite3")
+    assert open_cache_backend(settings).name == "sqlite"
+
+    settings.CACHE_BACKEND = "redis"
+    settings.CACHE_REDIS_URL = _url(redis_server)
+    assert open_cache_backend(settings).name == "redis"
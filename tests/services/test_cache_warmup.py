@@ -0,0 +1,92 @@
+import asyncio
+
+from meraki_mcp.services import cache_warmup
+from meraki_mcp.services.cache_warmup import (
+    start_cache_warmup,
+    warm_cache,
+    warmup_calls,
+)
+from meraki_mcp.services.meraki_client import MerakiClient
+from meraki_mcp.settings import ApiSettings
+
+
+class OrganizationsAPI:
+    def __init__(self):
+        self.calls = []
+
+    def getOrganizations(self):  # noqa: N802
+        self.calls.append(("getOrganizations", None))
+        return [{"id": "O_1"}, {"id": "O_2"}]
+
+    def getOrganizationNetworks(self, organizationId):  # noqa: N802
+        self.calls.append(("getOrganizationNetworks", organizationId))
+        if organizationId == "O_bad":
+            raise RuntimeError("boom")
+        return [{"id": "N_1", "organizationId": organizationId, "productTypes": []}]
+
+
+class Dashboard:
+    def __init__(self):
+        self.organizations = OrganizationsAPI()
+
+
+class StubClient(MerakiClient):
+    def __init__(self, settings=None):
+        super().__init__(api_key="test", settings=settings)
+        self.dashboard = Dashboard()
+
+    def get_dashboard(self):
+        return self.dashboard
+
+
+def test_warmup_calls_expand_org_endpoints_per_org():
+    calls = warmup_calls(
+        ["O_1", "O_2"],
+        [
+            "organizations.getOrganizations",
+            "organizations.getOrganizationNetworks",
+            "bogus",
+        ],
+    )
+    assert calls == [
+        ("organizations", "getOrganizations", {}),
+        ("organizations", "getOrganizationNetworks", {"organizationId": "O_1"}),
+        ("organizations", "getOrganizationNetworks", {"organizationId": "O_2"}),
+    ]
+
+
+def test_warmed_entries_serve_later_reads():
+    client = StubClient()
+    endpoints = [
+        "organizations.getOrganizations",
+        "organizations.getOrganizationNetworks",
+    ]
+
+    async def run():
+        summary = await warm_cache(client, ["O_1", "O_bad"], endpoints)
+        await client.call("organizations", "getOrganizations")
+        await client.call(
+            "organizations", "getOrganizationNetworks", organizationId="O_1"
+        )
+        return summary
+
+    summary = asyncio.run(run())
+    assert summary["calls"] == 3 and summary["failed"] == 1
+    assert len(client.dashboard.organizations.calls) == 3
+    assert client.stats()["pools"]["background"]["completed"] == 3
+
+
+def test_warmup_starts_only_when_configured_and_once(monkeypatch):
+    monkeypatch.setattr(cache_warmup, "_warmup_task", None)
+    settings = ApiSettings()
+    settings.CACHE_WARMUP_ORG_IDS = []
+    client = StubClient(settings)
+
+    async def run():
+        assert start_cache_warmup(client, settings) is None
+        settings.CACHE_WARMUP_ORG_IDS = ["O_1"]
+        task = start_cache_warmup(client, settings)
+        assert start_cache_warmup(client, settings) is task
+        return await task
+
+    assert asyncio.run(run())["calls"] == 3
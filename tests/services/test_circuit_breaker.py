@@ -0,0 +1,128 @@
+import asyncio
+import time
+
+import pytest
+
+from meraki_mcp.services.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+)
+from meraki_mcp.services.meraki_client import MerakiClient
+from meraki_mcp.settings import ApiSettings
+
+
+class StatusError(Exception):
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+
+
+def test_opens_after_threshold_and_fails_fast():
+    breakers = CircuitBreakerRegistry(failure_threshold=2, reset_timeout=60)
+    for _ in range(2):
+        admitted = breakers.check(["wireless.getX"])
+        breakers.record(admitted, StatusError(503))
+
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breakers.check(["wireless.getX"])
+    assert excinfo.value.key == "wireless.getX"
+    assert breakers.stats()["wireless.getX"]["state"] == OPEN
+
+
+def test_client_errors_do_not_trip_breaker():
+    breakers = CircuitBreakerRegistry(failure_threshold=1, reset_timeout=60)
+    for status in (400, 404, 429):
+        breakers.record(breakers.check(["org:1"]), StatusError(status))
+    breakers.record(breakers.check(["org:1"]), ValueError("bad params"))
+    assert breakers.check(["org:1"]) == ["org:1"]
+
+
+def test_half_open_admits_one_probe_then_closes():
+    breakers = CircuitBreakerRegistry(failure_threshold=1, reset_timeout=0.01)
+    breakers.record(breakers.check(["org:1"]), TimeoutError())
+    time.sleep(0.02)
+
+    probe = breakers.check(["org:1"])
+    assert breakers._breakers["org:1"].state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breakers.check(["org:1"])
+
+    breakers.record(probe)
+    assert breakers._breakers["org:1"].state == CLOSED
+
+
+def test_failed_probe_reopens():
+    breakers = CircuitBreakerRegistry(failure_threshold=1, reset_timeout=0.01)
+    breakers.record(breakers.check(["org:1"]), ConnectionError())
+    time.sleep(0.02)
+    breakers.record(breakers.check(["org:1"]), ConnectionError())
+    assert breakers.stats()["org:1"]["state"] == OPEN
+    assert breakers.stats()["org:1"]["times_opened"] == 2
+
+
+def test_rejected_key_releases_probes_already_taken():
+    breakers = CircuitBreakerRegistry(failure_threshold=1, reset_timeout=0.01)
+    breakers.record(breakers.check(["a.get"]), TimeoutError())
+    time.sleep(0.02)
+    breakers.reset_timeout = 60
+    breakers.record(breakers.check(["org:1"]), TimeoutError())
+
+    with pytest.raises(CircuitOpenError):
+        breakers.check(["a.get", "org:1"])
+    # The half-open probe slot for a.get was given back
+    assert breakers.check(["a.get"]) == ["a.get"]
+
+
+def test_org_breaker_needs_failures_across_endpoints():
+    breakers = CircuitBreakerRegistry(
+        failure_threshold=2, reset_timeout=60, org_min_endpoints=2
+    )
+    for _ in range(2):
+        breakers.record(breakers.check(["devices.getDevice", "org:1"]), TimeoutError())
+    # One dead endpoint opens its own breaker but leaves the org usable
+    with pytest.raises(CircuitOpenError):
+        breakers.check(["devices.getDevice", "org:1"])
+    assert breakers.check(["networks.getNetwork", "org:1"])
+
+    breakers.record(["networks.getNetwork", "org:1"], TimeoutError())
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breakers.check(["switch.getSwitch", "org:1"])
+    assert excinfo.value.key == "org:1"
+
+
+class FlakyDevicesAPI:
+    def __init__(self):
+        self.calls = 0
+
+    def getDevice(self, serial):  # noqa: N802, ARG002
+        self.calls += 1
+        raise StatusError(502)
+
+
+class FlakyDashboard:
+    def __init__(self):
+        self.devices = FlakyDevicesAPI()
+
+
+def test_client_fails_fast_once_endpoint_circuit_opens():
+    settings = ApiSettings()
+    settings.CIRCUIT_FAILURE_THRESHOLD = 2
+    settings.COALESCE_READS = False
+    client = MerakiClient(api_key="test", settings=settings)
+    dashboard = FlakyDashboard()
+    client.get_dashboard = lambda: dashboard
+
+    async def run():
+        for _ in range(2):
+            with pytest.raises(StatusError):
+                await client.call("devices", "getDevice", serial="Q2XX")
+        with pytest.raises(CircuitOpenError):
+            await client.call("devices", "getDevice", serial="Q2XX")
+
+    asyncio.run(run())
+    client.close()
+    assert dashboard.devices.calls == 2
+    assert client.stats()["circuit_breakers"]["devices.getDevice"]["state"] == OPEN
@@ -0,0 +1,132 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from mcp.server.lowlevel.server import request_ctx
+
+from meraki_mcp.services.client_registry import MerakiClientRegistry, use_api_key
+from meraki_mcp.settings import ApiSettings
+
+
+def make_registry(default_api_key="default", **overrides):
+    settings = ApiSettings()
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    return MerakiClientRegistry(default_api_key=default_api_key, settings=settings)
+
+
+def test_tenants_get_isolated_lazy_clients():
+    registry = make_registry()
+    default_client = registry.current()
+    with use_api_key("tenant-b"):
+        tenant_client = registry.current()
+        assert registry.cache_namespace == tenant_client.cache_namespace
+
+    assert tenant_client is not default_client
+    assert tenant_client.rate_limiter is not default_client.rate_limiter
+    assert tenant_client.cache_namespace != default_client.cache_namespace
+    # Dashboards are only built on the first real call
+    assert tenant_client._dashboard is None
+    # Worker pools are shared across tenants
+    assert tenant_client.pools is default_client.pools
+
+
+def test_least_recently_used_tenant_is_evicted():
+    registry = make_registry(MAX_TENANT_CLIENTS=2)
+    first = registry.get("a")
+    registry.get("b")
+    registry.get("a")
+    registry.get("c")
+    assert set(registry._clients) == {"a", "c"}
+    assert registry.get("a") is first
+    assert registry.stats()["tenant_evictions"] == 1
+
+
+def test_idle_tenants_are_evicted():
+    registry = make_registry(TENANT_IDLE_SECONDS=1)
+    registry.get("a")
+    registry._last_used["a"] -= 5
+    registry.get("b")
+    assert list(registry._clients) == ["b"]
+
+
+def test_missing_api_key_is_reported():
+    registry = make_registry(default_api_key="")
+    with pytest.raises(LookupError):
+        asyncio.run(registry.call("organizations", "getOrganizations"))
+
+
+def test_catalog_does_not_need_an_api_key():
+    registry = make_registry(default_api_key="", SDK_CATALOG_DIR="")
+    assert registry.get_catalog().has("devices", "getDevice")
+    assert registry._clients == {}
+
+
+def test_request_header_is_only_trusted_in_multi_tenant_mode():
+    request = SimpleNamespace(headers={"x-meraki-api-key": "from-header"})
+    token = request_ctx.set(SimpleNamespace(request=request))
+    try:
+        assert make_registry().resolve_api_key() == "default"
+        assert make_registry(MULTI_TENANT=True).resolve_api_key() == "from-header"
+    finally:
+        request_ctx.reset(token)
+
+
+def test_multi_tenant_http_request_without_header_is_rejected():
+    registry = make_registry(MULTI_TENANT=True)
+    # Startup and warm-up run outside any request and use the default key
+    assert registry.resolve_api_key() == "default"
+
+    token = request_ctx.set(SimpleNamespace(request=SimpleNamespace(headers={})))
+    try:
+        with pytest.raises(LookupError):
+            registry.resolve_api_key()
+        # An explicit use_api_key() still wins
+        with use_api_key("tenant-b"):
+            assert registry.resolve_api_key() == "tenant-b"
+    finally:
+        request_ctx.reset(token)
+
+
+def test_evicted_client_closes_after_its_in_flight_calls():
+    registry = make_registry(MAX_TENANT_CLIENTS=1)
+    client = registry.get("a")
+    closed = []
+    release = asyncio.Event()
+
+    async def slow_call(section, method, **kwargs):
+        await release.wait()
+        return "done"
+
+    async def aclose():
+        closed.append(client)
+
+    client.call = slow_call
+    client.aclose = aclose
+
+    async def run():
+        with use_api_key("a"):
+            pending = asyncio.ensure_future(registry.call("networks", "getNetwork"))
+        await asyncio.sleep(0)
+        registry.get("b")
+        await asyncio.sleep(0)
+        assert "a" not in registry._clients and closed == []
+        release.set()
+        result = await pending
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(run()) == "done"
+    assert closed == [client]
+    assert registry._in_flight == {} and registry._retired == set()
+
+
+def test_tenant_only_stats_hide_other_tenants():
+    registry = make_registry()
+    other = registry.get("tenant-b")
+    caller = registry.current()
+
+    scoped = registry.stats(tenant_only=True)
+    assert list(scoped["tenants"]) == [caller.cache_namespace]
+    assert {"pools", "cache"} <= set(scoped)
+    assert other.cache_namespace in registry.stats()["tenants"]
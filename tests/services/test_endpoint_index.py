@@ -0,0 +1,120 @@
+import re
+import time
+
+import pytest
+
+from meraki_mcp.services.endpoint_index import EndpointIndex
+from meraki_mcp.services.sdk_catalog import build_catalog_data
+from meraki_mcp.settings import ApiSettings
+from meraki_mcp.tools.meraki_api_tools import MerakiApiTools
+
+QUERIES = [
+    "get my organizations",
+    "device Q123 port 4 config",
+    "network clients",
+    "firewall rules",
+    "wireless ssids",
+    "mx l3 firewall",
+    "switch port configuration",
+    "camera video settings",
+    "list license subscriptions",
+    "site to site vpn",
+    "zzz nothing matches this",
+]
+
+
+class FakeMCP:
+    def tool(self):
+        return lambda fn: fn
+
+
+def sdk_patterns(copies: int = 1):
+    tools = MerakiApiTools(FakeMCP(), None, enabled=False, settings=ApiSettings())
+    structure = {
+        section: list(methods)
+        for section, methods in build_catalog_data()["sections"].items()
+    }
+    # Stand-in for a larger SDK: the same sections again under new names
+    tools._api_cache = {
+        f"{section}{'' if n == 0 else n}": methods
+        for n in range(copies)
+        for section, methods in structure.items()
+    }
+    return tools._generate_dynamic_patterns()
+
+
+def linear_best(patterns, query):
+    """The per-pattern Jaccard scan the index replaces"""
+    best, best_score = None, 0.0
+    for i, pattern in enumerate(patterns):
+        query_words = set(re.findall(r"\b\w+\b", query.lower()))
+        keywords = set(pattern["keywords"])
+        union = len(query_words | keywords)
+        overlap = len(query_words & keywords)
+        score = 0.0
+        if union:
+            jaccard = overlap / union * pattern["weight"]
+            score = min(jaccard + min(overlap * 0.1, 0.3), 1.0)
+        if score > best_score and score > 0.3:
+            best, best_score = (i, score), score
+    return best
+
+
+@pytest.fixture(scope="module")
+def patterns():
+    return sdk_patterns()
+
+
+def test_index_matches_linear_scan(patterns):
+    index = EndpointIndex(patterns)
+    assert len(index) == len(patterns)
+    for query in QUERIES:
+        assert index.best_match(query) == linear_best(patterns, query), query
+    assert index.best_match("zzz nothing matches this") is None
+
+
+def test_confidence_is_the_best_match_score(patterns):
+    index = EndpointIndex(patterns)
+    for query in QUERIES:
+        best = index.best_match(query)
+        if best is not None:
+            assert index.confidence(best[0], query) == best[1], query
+
+
+@pytest.mark.benchmark
+def test_index_search_beats_linear_scan(patterns):
+    """Microbenchmark: every query, against the SDK and an SDK four times larger"""
+    for copies in (1, 4):
+        grown = patterns if copies == 1 else sdk_patterns(copies)
+        index = EndpointIndex(grown)
+
+        start = time.perf_counter()
+        for query in QUERIES:
+            linear_best(grown, query)
+        linear = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for query in QUERIES:
+            index.best_match(query)
+        indexed = time.perf_counter() - start
+
+        # Measured at 15-20x; the margin absorbs noisy machines
+        assert indexed * 3 < linear, (len(grown), linear, indexed)
+
+
+def test_top_ranks_the_expected_endpoint_first(patterns):
+    index = EndpointIndex(patterns)
+    expected = {
+        "network clients": "networks.getNetworkClients",
+        "device port config": "switch.getDeviceSwitchPort",
+        "get my organizations": "organizations.getOrganizations",
+        "site to site vpn": "appliance.getNetworkApplianceVpnSiteToSiteVpn",
+        "camera video settings": "camera.getDeviceCameraVideoSettings",
+    }
+    for query, endpoint in expected.items():
+        ranked = index.top(query, k=3)
+        assert len(ranked) == 3
+        first = ranked[0][0]
+        assert f"{index.sections[first]}.{index.methods[first]}" == endpoint
+        assert ranked[0][1] >= ranked[1][1] >= ranked[2][1]
+    assert index.top("zzz nothing matches this") == []
@@ -0,0 +1,52 @@
+import asyncio
+import threading
+
+from meraki_mcp.services.executor import CallPool
+
+
+def test_pool_bounds_concurrency_and_reports_queue():
+    pool = CallPool("bulk", max_workers=1)
+    release = threading.Event()
+    snapshots = []
+
+    async def job(value):
+        async with pool.slot():
+            return await pool.run_blocking(lambda: release.wait(2) and value)
+
+    async def run():
+        tasks = [asyncio.create_task(job(i)) for i in range(3)]
+        await asyncio.sleep(0.05)
+        snapshots.append(pool.stats())
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(run()) == [0, 1, 2]
+    assert snapshots[0]["active"] == 1
+    assert snapshots[0]["queued"] == 2
+    assert snapshots[0]["saturation"] == 1.0
+    stats = pool.stats()
+    assert stats["completed"] == 3 and stats["queued"] == 0
+    pool.shutdown()
+
+
+def test_saturated_pool_does_not_block_another_pool():
+    bulk = CallPool("bulk", max_workers=1)
+    interactive = CallPool("interactive", max_workers=1)
+    release = threading.Event()
+
+    async def run():
+        async def bulk_job():
+            async with bulk.slot():
+                await bulk.run_blocking(lambda: release.wait(2))
+
+        blockers = [asyncio.create_task(bulk_job()) for _ in range(3)]
+        await asyncio.sleep(0.02)
+        async with interactive.slot():
+            answer = await interactive.run_blocking(lambda: "fast")
+        release.set()
+        await asyncio.gather(*blockers)
+        return answer
+
+    assert asyncio.run(run()) == "fast"
+    bulk.shutdown()
+    interactive.shutdown()
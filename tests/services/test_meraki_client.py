@@ -0,0 +1,178 @@
+import asyncio
+import threading
+import time
+
+from meraki_mcp.services.meraki_client import CachedAPIError, MerakiClient
+from meraki_mcp.settings import ApiSettings
+
+
+class SyncNetworksAPI:
+    def __init__(self):
+        self.threads = []
+
+    def getNetwork(self, networkId):  # noqa: N802
+        self.threads.append(threading.current_thread().name)
+        time.sleep(0.02)
+        return {"id": networkId, "name": "HQ"}
+
+
+class AsyncNetworksAPI:
+    async def getNetwork(self, networkId):  # noqa: N802
+        return {"id": networkId, "name": "HQ (async)"}
+
+
+class SyncDashboard:
+    def __init__(self):
+        self.networks = SyncNetworksAPI()
+
+
+class AsyncDashboard:
+    def __init__(self):
+        self.networks = AsyncNetworksAPI()
+
+
+class StubClient(MerakiClient):
+    def __init__(self, use_async=False):
+        settings = ApiSettings()
+        settings.USE_ASYNC_CLIENT = use_async
+        super().__init__(api_key="test", settings=settings)
+        self.sync_dashboard = SyncDashboard()
+        self.async_dashboard = AsyncDashboard()
+
+    def get_dashboard(self):
+        return self.sync_dashboard
+
+    def get_async_dashboard(self):
+        return self.async_dashboard
+
+
+def test_sync_mode_runs_sdk_call_off_the_event_loop():
+    client = StubClient()
+    result = asyncio.run(client.call("networks", "getNetwork", networkId="N_1"))
+    assert result == {"id": "N_1", "name": "HQ"}
+    assert client.sync_dashboard.networks.threads
+    assert client.sync_dashboard.networks.threads[0] != threading.main_thread().name
+
+
+def test_async_mode_awaits_the_asyncio_dashboard():
+    client = StubClient(use_async=True)
+    result = asyncio.run(client.call("networks", "getNetwork", networkId="N_1"))
+    assert result["name"] == "HQ (async)"
+    assert client.sync_dashboard.networks.threads == []
+
+
+def test_has_method_reflects_sdk_surface():
+    client = StubClient()
+    assert client.has_method("networks", "getNetwork")
+    assert not client.has_method("networks", "getNothing")
+    assert not client.has_method("missing", "getNetwork")
+
+
+def test_network_calls_use_learned_org_bucket():
+    client = StubClient()
+    client._learn_org_ids(
+        [{"id": "N_1", "organizationId": "O_1", "productTypes": ["switch"]}], {}
+    )
+    client._learn_org_ids({"serial": "Q2XX", "networkId": "N_1"}, {})
+    # Devices listed for an org place their networks in it
+    client._learn_org_ids(
+        [{"serial": "Q2YY", "networkId": "N_2"}], {"organizationId": "O_2"}
+    )
+    assert client.resolve_org_id({"networkId": "N_1"}) == "O_1"
+    assert client.resolve_org_id({"serial": "Q2XX"}) == "O_1"
+    assert client.resolve_org_id({"serial": "Q2YY"}) == "O_2"
+    assert client.resolve_org_id({"networkId": "N_unknown"}) is None
+
+    asyncio.run(client.call("networks", "getNetwork", networkId="N_1"))
+    assert client.stats()["rate_limiter"]["O_1"]["acquired"] == 1
+
+
+def test_concurrent_identical_reads_share_one_request():
+    client = StubClient()
+
+    async def run():
+        return await asyncio.gather(
+            *(client.call("networks", "getNetwork", networkId="N_1") for _ in range(5)),
+            client.call("networks", "getNetwork", networkId="N_2"),
+        )
+
+    results = asyncio.run(run())
+    assert [r["id"] for r in results] == ["N_1"] * 5 + ["N_2"]
+    assert len(client.sync_dashboard.networks.threads) == 2
+    assert client.stats()["singleflight"]["coalesced"] == 4
+
+
+class NotFound(Exception):
+    status = 404
+    reason = "Not Found"
+
+
+class ApplianceAPI:
+    def __init__(self):
+        self.calls = 0
+
+    def getNetworkApplianceVlans(self, networkId):  # noqa: N802
+        self.calls += 1
+        raise NotFound(
+            f"appliance, getNetworkApplianceVlans - 404 Not Found, {networkId}"
+        )
+
+
+def test_not_found_reads_are_replayed_from_the_negative_cache():
+    client = StubClient()
+    client.sync_dashboard.appliance = ApplianceAPI()
+
+    async def attempt():
+        try:
+            await client.call("appliance", "getNetworkApplianceVlans", networkId="N_1")
+        except Exception as e:
+            return e
+
+    async def run():
+        errors = [await attempt() for _ in range(3)]
+        client.sync_dashboard.networks.updateNetwork = lambda **_kwargs: {}
+        await client.call("networks", "updateNetwork", networkId="N_1", name="HQ")
+        return errors, await attempt()
+
+    errors, after_write = asyncio.run(run())
+    assert isinstance(errors[0], NotFound)
+    assert all(isinstance(e, CachedAPIError) and e.status == 404 for e in errors[1:])
+    assert str(errors[1]) == str(errors[0])
+    assert client.stats()["negative_cache_hits"] == 2
+    # A write to the network may have enabled the feature, so it is asked again
+    assert isinstance(after_write, NotFound)
+    assert client.sync_dashboard.appliance.calls == 2
+
+
+class InventoryAPI:
+    def __init__(self):
+        self.calls = 0
+
+    def getOrganizationDevices(self, organizationId):  # noqa: N802, ARG002
+        self.calls += 1
+        return [{"serial": "Q2XX", "networkId": "N_1", "name": f"v{self.calls}"}]
+
+
+class DevicesAPI:
+    def updateDevice(self, serial, name):  # noqa: N802
+        return {"serial": serial, "name": name}
+
+
+def test_device_write_invalidates_the_org_device_list():
+    client = StubClient()
+    client.sync_dashboard.organizations = InventoryAPI()
+    client.sync_dashboard.devices = DevicesAPI()
+
+    def list_devices():
+        return client.call(
+            "organizations", "getOrganizationDevices", organizationId="O_1"
+        )
+
+    async def run():
+        first = await list_devices()
+        await client.call("devices", "updateDevice", serial="Q2XX", name="new")
+        return first, await list_devices()
+
+    first, after = asyncio.run(run())
+    assert first[0]["name"] == "v1" and after[0]["name"] == "v2"
+    client.close()
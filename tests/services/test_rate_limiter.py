@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+from meraki_mcp.services.rate_limiter import SHARED_BUCKET, OrgRateLimiter
+
+
+def test_bucket_paces_calls_beyond_burst():
+    limiter = OrgRateLimiter(rate_per_second=50.0, burst=2)
+
+    async def run():
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire("org1") for _ in range(7)))
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(run())
+    # two calls ride the burst, the remaining five wait ~20ms each
+    assert elapsed >= 0.09
+    stats = limiter.stats()["org1"]
+    assert stats["acquired"] == 7
+    assert stats["queue_depth"] == 0
+    assert stats["max_wait_ms"] > 0
+
+
+def test_orgs_have_independent_budgets():
+    limiter = OrgRateLimiter(rate_per_second=1.0, burst=1)
+
+    async def run():
+        start = time.monotonic()
+        await asyncio.gather(
+            limiter.acquire("a"), limiter.acquire("b"), limiter.acquire(None)
+        )
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) < 0.5
+    assert set(limiter.stats()) == {"a", "b", SHARED_BUCKET}
+
+
+def test_disabled_limiter_never_waits():
+    limiter = OrgRateLimiter(rate_per_second=0)
+    assert asyncio.run(limiter.acquire("org1")) == 0.0
+    assert limiter.stats() == {}
+
+
+def test_interactive_calls_jump_queued_bulk_calls():
+    limiter = OrgRateLimiter(rate_per_second=50.0, burst=1, aging_seconds=60)
+    order = []
+
+    async def call(name, priority):
+        await limiter.acquire("org1", priority)
+        order.append(name)
+
+    async def run():
+        bulk = [asyncio.create_task(call(f"bulk{i}", 1)) for i in range(5)]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(call("interactive", 0))
+        await asyncio.gather(*bulk, interactive)
+
+    asyncio.run(run())
+    # bulk0 takes the burst token and bulk1 already holds the bucket waiting
+    # for the next one; the interactive call overtakes the rest
+    assert order.index("interactive") == 2
+    assert limiter.stats()["org1"]["granted_by_class"] == {"interactive": 1, "bulk": 5}
+
+
+def test_aging_prevents_starvation_of_background_calls():
+    limiter = OrgRateLimiter(rate_per_second=20.0, burst=1, aging_seconds=0.01)
+    order = []
+
+    async def call(name, priority):
+        await limiter.acquire("org1", priority)
+        order.append(name)
+
+    async def run():
+        await limiter.acquire("org1", 0)
+        holder = asyncio.create_task(call("holder", 0))
+        await asyncio.sleep(0)
+        background = asyncio.create_task(call("background", 2))
+        await asyncio.sleep(0.03)
+        interactive = [asyncio.create_task(call(f"i{i}", 0)) for i in range(3)]
+        await asyncio.gather(holder, background, *interactive)
+
+    asyncio.run(run())
+    # Waiting ~50ms aged the background call past the fresher interactive ones
+    assert order[:2] == ["holder", "background"]
+    assert limiter.stats()["org1"]["aged_grants"] == 1
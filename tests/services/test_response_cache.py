@@ -0,0 +1,222 @@
+import asyncio
+import time
+
+from meraki_mcp.services.cache_backends import SqliteCacheBackend
+from meraki_mcp.services.response_cache import (
+    ResponseCache,
+    invalidation_tags,
+    make_cache_key,
+    resource_tags,
+)
+
+
+def test_hits_misses_and_expiry():
+    cache = ResponseCache(max_bytes=1 << 20, default_ttl=0.02)
+    cache.set("a", "one")
+    assert cache.get("a") == "one"
+    assert cache.get("b") is None
+    time.sleep(0.03)
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["expirations"]) == (1, 2, 1)
+    assert stats["entries"] == 0 and stats["bytes"] == 0
+
+
+def test_byte_budget_evicts_least_recently_used():
+    value = "x" * 1000
+    entry_size = ResponseCache._size("k0", value)
+    cache = ResponseCache(max_bytes=entry_size * 3, default_ttl=60)
+    for i in range(3):
+        cache.set(f"k{i}", value)
+    cache.get("k0")
+    cache.set("k3", value)
+
+    assert cache.get("k1") is None
+    assert cache.get("k0") == value
+    assert cache.stats()["evictions"] == 1
+    assert cache.bytes <= cache.max_bytes
+
+
+def test_entry_size_counts_parsed_objects():
+    clients = [
+        {"mac": f"00:11:22:33:{i:02x}", "usage": {"sent": i}} for i in range(100)
+    ]
+    cache = ResponseCache(max_bytes=1 << 20, default_ttl=60)
+    cache.set("clients", clients)
+    # Dicts, strings and ints take several times their JSON length in memory
+    assert cache.bytes > 3 * len(ResponseCache._encode(clients))
+
+
+def test_oversized_values_are_not_cached():
+    cache = ResponseCache(max_bytes=100, default_ttl=60)
+    cache.set("big", "x" * 1000)
+    assert cache.get("big") is None
+    assert cache.bytes == 0
+
+
+def test_background_sweep_drops_expired_entries():
+    cache = ResponseCache(max_bytes=1 << 20, default_ttl=0.01, sweep_interval=0.02)
+
+    async def run():
+        for i in range(5):
+            cache.set(f"k{i}", "v")
+        await asyncio.sleep(0.05)
+        cache.close()
+
+    asyncio.run(run())
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["expirations"] == 5
+
+
+def test_cache_keys_are_canonical_and_stable():
+    a = make_cache_key("ns", "networks", "getNetworkClients", {"b": 1, "a": "x"})
+    b = make_cache_key("ns", "networks", "getNetworkClients", {"a": "x", "b": 1})
+    assert a == b
+    assert a.startswith("ns:networks.getNetworkClients:")
+    assert a != make_cache_key(
+        "ns", "networks", "getNetworkClients", {"a": "y", "b": 1}
+    )
+
+
+def test_persistent_tier_survives_a_restart(tmp_path):
+    path = str(tmp_path / "responses.sqlite3")
+    first = ResponseCache(1 << 20, default_ttl=60, backend=SqliteCacheBackend(path))
+    first.set("k", {"id": "N_1"})
+    first.set("short", "v", ttl=0.01)
+    first.close()
+
+    time.sleep(0.02)
+    second = ResponseCache(1 << 20, default_ttl=60, backend=SqliteCacheBackend(path))
+    assert second.get("k") == {"id": "N_1"}
+    assert second.get("short") is None
+    assert second.stats()["backend"]["hits"] == 1
+    # Promoted into memory, so the next read does not touch disk
+    assert second.get("k") == {"id": "N_1"}
+    assert second.stats()["backend"]["hits"] == 1
+    assert second.backend.sweep() == 1
+    second.close()
+
+
+def test_lookup_serves_stale_entries_within_window(tmp_path):
+    cache = ResponseCache(1 << 20, default_ttl=0.01, stale_window=60)
+    cache.set("k", "v")
+    time.sleep(0.02)
+    hit = cache.lookup("k")
+    assert hit.value == "v" and hit.stale and hit.age >= 0.01
+    assert cache.get("k") is None
+    assert cache.stats()["stale_hits"] == 2
+
+    # A backend keeps the original age and freshness
+    backend = SqliteCacheBackend(str(tmp_path / "swr.sqlite3"))
+    writer = ResponseCache(1 << 20, default_ttl=0.01, stale_window=60, backend=backend)
+    writer.set("k", "v")
+    time.sleep(0.02)
+    reader = ResponseCache(1 << 20, default_ttl=0.01, stale_window=60, backend=backend)
+    assert reader.lookup("k").stale
+
+
+def test_writes_invalidate_only_dependent_reads():
+    cache = ResponseCache(1 << 20, default_ttl=60)
+    reads = {
+        "ssids": {"networkId": "N_1"},
+        "ssid3": {"networkId": "N_1", "number": 3},
+        "ssid5": {"networkId": "N_1", "number": 5},
+        "device": {"serial": "Q2AA"},
+        "org_networks": {"organizationId": "O_1"},
+        "other_network": {"networkId": "N_2"},
+    }
+    for key, params in reads.items():
+        cache.set(key, "v", tags=resource_tags(params))
+
+    # Updating SSID 3 drops that SSID and the network's list reads
+    removed = cache.invalidate(
+        invalidation_tags({"networkId": "N_1", "number": 3}, org_id="O_1")
+    )
+    assert removed == 3
+    assert [k for k in reads if cache.get(k)] == ["ssid5", "device", "other_network"]
+
+    # A device write reaches its network's list reads via the learned network
+    cache.set("ssids", "v", tags=resource_tags(reads["ssids"]))
+    cache.invalidate(invalidation_tags({"serial": "Q2AA"}, network_id="N_1"))
+    assert cache.get("device") is None and cache.get("ssids") is None
+    assert cache.get("ssid5") == "v"
+    assert cache.stats()["invalidations"] == 5
+
+
+def test_writes_without_ids_and_device_writes_reach_their_reads():
+    cache = ResponseCache(max_bytes=1 << 20, default_ttl=60)
+    cache.set("api_keys", "v", tags=resource_tags({}, "administered"))
+    cache.set("org_devices", "v", tags=resource_tags({"organizationId": "O_1"}))
+
+    # e.g. revokeAdministeredIdentitiesMeApiKeys(suffix=...)
+    cache.invalidate(invalidation_tags({"suffix": "abcd"}, section="administered"))
+    assert cache.get("api_keys") is None
+
+    # e.g. updateDevice(serial=...): the org's device list is stale too
+    device_write = invalidation_tags({"serial": "Q2AA"}, org_id="O_1", network_id="N_1")
+    assert "org:O_1/*" in device_write
+    cache.invalidate(device_write)
+    assert cache.get("org_devices") is None
+
+
+def test_multi_network_writes_reach_each_network():
+    cache = ResponseCache(max_bytes=1 << 20, default_ttl=60)
+    for net_id in ("N_1", "N_2", "N_3"):
+        cache.set(net_id, "v", tags=resource_tags({"networkId": net_id}))
+
+    # e.g. enableOrganizationIntegrationsXdrNetworks(networkIds=[...])
+    write = {"organizationId": "O_1", "networkIds": ["N_1", "N_2"]}
+    cache.invalidate(invalidation_tags(write, section="organizations"))
+    assert [k for k in ("N_1", "N_2", "N_3") if cache.get(k)] == ["N_3"]
+
+
+def test_other_processes_invalidations_show_up_after_memory_ttl(tmp_path):
+    path = str(tmp_path / "shared.sqlite3")
+    writer = ResponseCache(1 << 20, default_ttl=60, backend=SqliteCacheBackend(path))
+    reader = ResponseCache(
+        1 << 20, default_ttl=60, backend=SqliteCacheBackend(path), memory_ttl=0.05
+    )
+    writer.set("k", "v1", tags=resource_tags({"networkId": "N_1"}))
+    assert reader.get("k") == "v1"
+
+    writer.invalidate(["net:N_1"])
+    writer.set("k2", "v2")
+    assert reader.get("k") == "v1"
+    time.sleep(0.06)
+    assert reader.get("k") is None
+    assert reader.get("k2") == "v2"
+
+
+def test_invalidation_removes_the_backend_copy(tmp_path):
+    backend = SqliteCacheBackend(str(tmp_path / "tags.sqlite3"))
+    writer = ResponseCache(1 << 20, default_ttl=60, backend=backend)
+    writer.set("k", "v", tags=resource_tags({"networkId": "N_1"}))
+    writer.invalidate(["net:N_1"])
+    restarted = ResponseCache(1 << 20, default_ttl=60, backend=backend)
+    assert restarted.get("k") is None
+
+
+def test_large_entries_are_held_compressed():
+    clients = [
+        {
+            "mac": f"00:11:22:33:44:{i % 256:02x}",
+            "status": "Online",
+            "usage": {"sent": i},
+        }
+        for i in range(500)
+    ]
+    cache = ResponseCache(1 << 20, default_ttl=60, compress_min_bytes=1024)
+    cache.set("clients", clients)
+    cache.set("small", {"id": "N_1"})
+
+    assert cache.get("clients") == clients
+    assert cache.get("small") == {"id": "N_1"}
+    stats = cache.stats()["compression"]
+    assert stats["entries"] == 1
+    assert stats["raw_bytes"] == len(ResponseCache._encode(clients))
+    assert stats["ratio"] > 3
+    assert cache.bytes < stats["raw_bytes"]
+
+    cache.delete("clients")
+    assert cache.stats()["compression"]["stored_bytes"] == 0
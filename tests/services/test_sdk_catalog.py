@@ -0,0 +1,65 @@
+import json
+
+from meraki_mcp.services import sdk_catalog
+from meraki_mcp.services.sdk_catalog import (
+    SdkCatalog,
+    build_catalog_data,
+    load_persisted_catalog,
+    write_catalog,
+)
+
+
+class DummyDevicesAPI:
+    def getDevice(self, serial: str, **kwargs):  # noqa: N802
+        """**Return a single device**
+        https://developer.cisco.com/meraki/api-v1/#!get-device
+        """
+
+
+class DummyDashboard:
+    def __init__(self):
+        self.devices = DummyDevicesAPI()
+
+
+def test_catalog_captures_signatures_and_summaries():
+    catalog = SdkCatalog(build_catalog_data(DummyDashboard()))
+    assert catalog.structure() == {"devices": ["getDevice"]}
+    assert catalog.required_params("devices", "getDevice") == ["serial"]
+    assert catalog.parameters("devices", "getDevice") == {
+        "serial": {"required": True, "type": "<class 'str'>"}
+    }
+    assert catalog.summary("devices", "getDevice") == "Return a single device"
+    assert catalog.parameters("devices", "getNothing") is None
+
+
+def test_catalog_round_trips_per_sdk_version(tmp_path, monkeypatch):
+    data = build_catalog_data(DummyDashboard())
+    path = write_catalog(str(tmp_path), data)
+    assert path.name == f"meraki-sdk-{data['sdk_version']}.json"
+    assert load_persisted_catalog(str(tmp_path)).has("devices", "getDevice")
+
+    # A catalog written for another SDK version is ignored
+    monkeypatch.setattr(sdk_catalog, "sdk_version", lambda: "0.0.0-other")
+    assert load_persisted_catalog(str(tmp_path)) is None
+
+
+def test_get_catalog_builds_once_then_reads_from_disk(tmp_path, monkeypatch):
+    builds = []
+
+    def fake_build(dashboard=None):
+        builds.append(1)
+        return build_catalog_data(DummyDashboard())
+
+    monkeypatch.setattr(sdk_catalog, "build_catalog_data", fake_build)
+    monkeypatch.setattr(sdk_catalog, "_catalogs", {})
+    first = sdk_catalog.get_catalog(str(tmp_path))
+    assert sdk_catalog.get_catalog(str(tmp_path)) is first
+    assert len(builds) == 1
+
+    # A fresh process (empty memory cache) loads the persisted file instead
+    monkeypatch.setattr(sdk_catalog, "_catalogs", {})
+    assert sdk_catalog.preload_catalog(str(tmp_path))
+    assert sdk_catalog.get_catalog(str(tmp_path)).has("devices", "getDevice")
+    assert len(builds) == 1
+    stored = json.loads(next(tmp_path.glob("meraki-sdk-*.json")).read_text())
+    assert stored["format"] == sdk_catalog.CATALOG_FORMAT
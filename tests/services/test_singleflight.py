@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from meraki_mcp.services.singleflight import SingleFlight
+
+
+def test_errors_reach_every_waiter_and_key_is_released():
+    flight = SingleFlight()
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def run():
+        results = await asyncio.gather(
+            flight.do("k", failing), flight.do("k", failing), return_exceptions=True
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flight.stats()["inflight"] == 0
+        with pytest.raises(ValueError):
+            await flight.do("k", failing)
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_cancelled_waiter_does_not_cancel_shared_work():
+    flight = SingleFlight()
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def run():
+        first = asyncio.create_task(flight.do("k", slow))
+        second = asyncio.create_task(flight.do("k", slow))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == "done"
+
+
+def test_work_is_cancelled_when_last_waiter_leaves():
+    flight = SingleFlight()
+    finished = []
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        finished.append(1)
+
+    async def run():
+        waiter = asyncio.create_task(flight.do("k", slow))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await asyncio.sleep(0.06)
+        assert flight.stats()["inflight"] == 0
+
+    asyncio.run(run())
+    assert finished == []
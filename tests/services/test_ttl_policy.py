@@ -0,0 +1,39 @@
+from meraki_mcp.services.ttl_policy import TtlPolicy
+from meraki_mcp.settings import ApiSettings
+
+
+def test_builtin_rules_separate_live_status_from_config():
+    settings = ApiSettings()
+    settings.CACHE_TTL_SECONDS = 3600
+    policy = TtlPolicy.from_settings(settings)
+    assert policy.ttl_for("networks", "getNetworkClients") == 30
+    assert policy.ttl_for("organizations", "getOrganizationDevicesStatuses") == 30
+    assert policy.ttl_for("organizations", "getOrganizationNetworks") == 1800
+    assert policy.ttl_for("wireless", "getNetworkWirelessSsids") == 1800
+    # Unmatched endpoints fall back to CACHE_TTL_SECONDS
+    assert policy.ttl_for("camera", "getDeviceCameraSense") == 3600
+
+
+def test_builtin_rules_never_exceed_the_default_ttl():
+    policy = TtlPolicy.from_settings(ApiSettings())
+    assert policy.ttl_for("networks", "getNetworkClients") == 30
+    assert policy.ttl_for("organizations", "getOrganizations") == 300
+    assert policy.ttl_for("networks", "getNetwork") == 300
+
+
+def test_configured_rules_win_and_can_target_a_section():
+    settings = ApiSettings()
+    settings.CACHE_TTL_SECONDS = 3600
+    settings.CACHE_TTL_RULES = {"*.getNetworkClients": 0, "wireless.*": 600}
+    policy = TtlPolicy.from_settings(settings)
+    assert policy.ttl_for("networks", "getNetworkClients") == 0
+    assert policy.ttl_for("wireless", "getNetworkWirelessSsids") == 600
+    assert policy.ttl_for("appliance", "getNetworkApplianceVlans") == 1800
+
+
+def test_builtin_rules_can_be_disabled():
+    settings = ApiSettings()
+    settings.CACHE_TTL_DEFAULT_RULES = False
+    settings.CACHE_TTL_SECONDS = 120
+    policy = TtlPolicy.from_settings(settings)
+    assert policy.ttl_for("networks", "getNetworkClients") == 120
@@ -0,0 +1,39 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Time allowed for importing meraki_mcp.main (tool registration included) once
+# the MCP framework itself is loaded. Measured at ~0.1s; CI machines get headroom.
+IMPORT_BUDGET_SECONDS = 0.75
+
+PROBE = """
+import json, sys, time
+import mcp.server.fastmcp, pydantic_settings
+start = time.perf_counter()
+import meraki_mcp.main as main
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "meraki_imported": "meraki" in sys.modules,
+    "clients_built": len(main.meraki_client._clients),
+}))
+"""
+
+
+def test_server_import_is_fast_and_defers_sdk():
+    repo_root = Path(__file__).resolve().parents[1]
+    env = dict(os.environ, MERAKI_API_KEY="startup-probe-key")
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=repo_root,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    assert result["meraki_imported"] is False
+    assert result["clients_built"] == 0
+    assert result["elapsed"] < IMPORT_BUDGET_SECONDS
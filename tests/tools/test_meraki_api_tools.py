@@ -1,12 +1,24 @@
 import asyncio
 import json
+import threading
+import time
 
 import pytest
 
+from meraki_mcp.services.meraki_client import MerakiClient
+from meraki_mcp.services.sdk_catalog import SdkCatalog, build_catalog_data
+from meraki_mcp.tools import meraki_api_tools
 from meraki_mcp.tools.meraki_api_tools import MerakiApiTools
 from meraki_mcp.settings import ApiSettings
 
 
+def make_settings():
+    settings = ApiSettings()
+    # Keep the SDK catalog in memory instead of writing ~/.cache
+    settings.SDK_CATALOG_DIR = ""
+    return settings
+
+
 class DummyDevicesAPI:
     # Class name contains 'API' to satisfy discovery heuristic
     def getDevice(self, serial):  # noqa: N802 (Meraki-style naming)
@@ -21,10 +33,17 @@ class DummyDashboard:
         self.devices = DummyDevicesAPI()
 
 
-class FakeMerakiClient:
+class FakeMerakiClient(MerakiClient):
+    def __init__(self):
+        super().__init__(api_key="test", settings=make_settings())
+        self.catalog = SdkCatalog(build_catalog_data(DummyDashboard()))
+
     def get_dashboard(self):
         return DummyDashboard()
 
+    def get_catalog(self):
+        return self.catalog
+
 
 class FakeMCP:
     def tool(self):
@@ -35,7 +54,9 @@ class FakeMCP:
 
 
 def test_get_parameters_discovers_required_signature():
-    tools = MerakiApiTools(FakeMCP(), FakeMerakiClient(), enabled=True, settings=ApiSettings())
+    tools = MerakiApiTools(
+        FakeMCP(), FakeMerakiClient(), enabled=True, settings=make_settings()
+    )
     # getDevice requires serial
     text = asyncio.run(tools.get_meraki_endpoint_parameters("devices", "getDevice"))
     data = json.loads(text)
@@ -43,7 +64,7 @@ def test_get_parameters_discovers_required_signature():
 
 
 def test_execute_redacts_and_denies_mutations_by_default():
-    s = ApiSettings()
+    s = make_settings()
     s.ALLOW_MUTATIONS = False
     tools = MerakiApiTools(FakeMCP(), FakeMerakiClient(), enabled=True, settings=s)
 
@@ -66,7 +87,7 @@ def test_execute_redacts_and_denies_mutations_by_default():
 
 
 def test_execute_allows_with_confirm_and_policy():
-    s = ApiSettings()
+    s = make_settings()
     s.ALLOW_MUTATIONS = True
     s.REQUIRE_CONFIRM_FOR_MUTATIONS = True
     tools = MerakiApiTools(FakeMCP(), FakeMerakiClient(), enabled=True, settings=s)
@@ -83,11 +104,354 @@ def test_execute_allows_with_confirm_and_policy():
     assert data["updated"] is True
 
 
+class AsyncDevicesAPI:
+    async def getDevice(self, serial):  # noqa: N802
+        return {"serial": serial}
+
+
+class AsyncDashboard:
+    def __init__(self):
+        self.devices = AsyncDevicesAPI()
+
+
+def test_async_execute_does_not_build_the_sync_sdk():
+    client = FakeMerakiClient()
+    client.use_async = True
+    client.get_async_dashboard = AsyncDashboard
+
+    def no_sync_sdk():
+        raise AssertionError("sync SDK built on the async path")
+
+    client.get_dashboard = no_sync_sdk
+    tools = MerakiApiTools(FakeMCP(), client, enabled=True, settings=make_settings())
+
+    ok = tools.execute_meraki_api_endpoint("devices", "getDevice", serial="Q2XX")
+    assert json.loads(asyncio.run(ok)) == {"serial": "Q2XX"}
+    missing = tools.execute_meraki_api_endpoint("devices", "getDevice")
+    error = json.loads(asyncio.run(missing))["error"]
+    assert error == "Missing required parameters: serial"
+
+
 def test_deny_lists_block_execution():
-    s = ApiSettings()
+    s = make_settings()
     s.DENY_SECTIONS = ["devices"]
     tools = MerakiApiTools(FakeMCP(), FakeMerakiClient(), enabled=True, settings=s)
     res = asyncio.run(tools.execute_meraki_api_endpoint("devices", "getDevice", serial="Q2XX"))
     data = json.loads(res)
     assert data.get("error") == "execution blocked"
 
+
+
+class CountingNetworksAPI:
+    def __init__(self):
+        self.calls = 0
+
+    def getNetwork(self, networkId):  # noqa: N802
+        self.calls += 1
+        return {"id": networkId, "version": self.calls}
+
+
+class CountingDashboard:
+    def __init__(self):
+        self.networks = CountingNetworksAPI()
+
+
+class CountingMerakiClient(MerakiClient):
+    def __init__(self, settings=None):
+        super().__init__(api_key="test", settings=settings or make_settings())
+        self.dashboard = CountingDashboard()
+
+    def get_dashboard(self):
+        return self.dashboard
+
+
+def test_reordered_kwargs_hit_the_same_cache_entry():
+    client = CountingMerakiClient()
+    tools = MerakiApiTools(FakeMCP(), client, enabled=True, settings=make_settings())
+
+    async def run():
+        execute = tools.execute_meraki_api_endpoint
+        await execute("networks", "getNetwork", networkId="N_1")
+        await execute("networks", "getNetwork", kwargs='{"networkId": "N_1"}')
+        await execute("networks", "getNetwork", networkId="N_1", serial="")
+
+    asyncio.run(run())
+    assert client.dashboard.networks.calls == 1
+
+
+def test_cached_read_is_shared_with_direct_client_calls():
+    client = CountingMerakiClient()
+    tools = MerakiApiTools(FakeMCP(), client, enabled=True, settings=make_settings())
+
+    async def run():
+        text = await tools.execute_meraki_api_endpoint(
+            "networks", "getNetwork", networkId="N_1"
+        )
+        direct = await client.call("networks", "getNetwork", networkId="N_1")
+        return json.loads(text), direct
+
+    via_tool, via_client = asyncio.run(run())
+    assert via_tool == via_client == {"id": "N_1", "version": 1}
+    assert client.dashboard.networks.calls == 1
+    assert client.stats()["cache"]["hits"] == 1
+
+
+def test_stale_while_revalidate_serves_stale_and_refreshes_once():
+    s = make_settings()
+    s.CACHE_TTL_RULES = {"getNetwork": 0.05}
+    s.CACHE_STALE_SECONDS = 60
+    client = CountingMerakiClient(settings=s)
+    tools = MerakiApiTools(FakeMCP(), client, enabled=True, settings=s)
+
+    def get_network():
+        return tools.execute_meraki_api_endpoint(
+            "networks", "getNetwork", networkId="N_1"
+        )
+
+    async def run():
+        first = json.loads(await get_network())
+        await asyncio.sleep(0.06)
+        stale = await asyncio.gather(*(get_network() for _ in range(3)))
+        await asyncio.gather(*client._refreshing.values())
+        fresh = json.loads(await get_network())
+        return first, [json.loads(r) for r in stale], fresh
+
+    first, stale, fresh = asyncio.run(run())
+    assert first["version"] == 1
+    assert all(r["stale"] is True and r["data"]["version"] == 1 for r in stale)
+    assert stale[0]["age_seconds"] >= 0
+    assert fresh == {"id": "N_1", "version": 2}
+    assert client.dashboard.networks.calls == 2
+
+
+def test_plain_calls_wait_for_fresh_data_instead_of_stale():
+    s = make_settings()
+    s.CACHE_TTL_RULES = {"getNetwork": 0.05}
+    s.CACHE_STALE_SECONDS = 60
+    client = CountingMerakiClient(settings=s)
+
+    async def run():
+        await client.call("networks", "getNetwork", networkId="N_1")
+        await asyncio.sleep(0.06)
+        return await client.call("networks", "getNetwork", networkId="N_1")
+
+    assert asyncio.run(run()) == {"id": "N_1", "version": 2}
+    assert client._refreshing == {}
+
+
+def test_successful_write_invalidates_cached_reads():
+    s = make_settings()
+    s.ALLOW_MUTATIONS = True
+    s.REQUIRE_CONFIRM_FOR_MUTATIONS = False
+    client = CountingMerakiClient()
+    client.dashboard.networks.updateNetwork = lambda networkId, name: {
+        "id": networkId,
+        "name": name,
+    }
+    tools = MerakiApiTools(FakeMCP(), client, enabled=True, settings=s)
+
+    async def run():
+        execute = tools.execute_meraki_api_endpoint
+        for _ in range(2):
+            await execute("networks", "getNetwork", networkId="N_1")
+        await execute(
+            "networks", "updateNetwork", networkId="N_1", kwargs='{"name": "HQ"}'
+        )
+        return json.loads(await execute("networks", "getNetwork", networkId="N_1"))
+
+    assert asyncio.run(run())["version"] == 2
+    assert client.dashboard.networks.calls == 2
+
+
+def make_unknown_method_tools(settings):
+    tools = MerakiApiTools(
+        FakeMCP(), FakeMerakiClient(), enabled=True, settings=settings
+    )
+    lookups = []
+
+    def discover():
+        lookups.append(1)
+        return {"devices": ["getDevice"]}
+
+    tools._discover_api_structure = discover
+    return tools, lookups
+
+
+def execute_unknown_method(tools, method="getDevices"):
+    call = tools.execute_meraki_api_endpoint("devices", method, serial="Q2XX")
+    return asyncio.run(call)
+
+
+def test_unknown_method_error_is_remembered():
+    tools, lookups = make_unknown_method_tools(make_settings())
+
+    first = execute_unknown_method(tools)
+    second = execute_unknown_method(tools)
+    error = json.loads(first)["error"]
+    assert error == "Method 'getDevices' not found in section 'devices'"
+    assert second == first
+    assert len(lookups) == 1
+
+
+def test_unknown_method_errors_expire_and_are_bounded(monkeypatch):
+    s = make_settings()
+    s.CACHE_NEGATIVE_TTL_SECONDS = 0.05
+    tools, lookups = make_unknown_method_tools(s)
+
+    execute_unknown_method(tools)
+    time.sleep(0.06)
+    execute_unknown_method(tools)
+    assert len(lookups) == 2
+
+    monkeypatch.setattr(meraki_api_tools, "MAX_UNKNOWN_ENDPOINTS", 2)
+    for method in ("getA", "getB", "getC"):
+        execute_unknown_method(tools, method)
+    assert list(tools._unknown_endpoints) == [("devices", "getB"), ("devices", "getC")]
+
+
+def test_performance_stats_report_cache_by_section(caplog):
+    client = CountingMerakiClient()
+    tools = MerakiApiTools(FakeMCP(), client, enabled=True, settings=make_settings())
+
+    async def run():
+        for _ in range(3):
+            await tools.execute_meraki_api_endpoint(
+                "networks", "getNetwork", networkId="N_1"
+            )
+        with caplog.at_level("INFO"):
+            return json.loads(await tools.get_server_performance_stats())
+
+    stats = asyncio.run(run())
+    assert stats["cache"]["by_section"]["networks"] == {
+        "hits": 2,
+        "stale_hits": 0,
+        "misses": 1,
+        "hit_rate": 0.667,
+    }
+    assert stats["cache"]["entries"] == 1
+    assert "_shared" in stats["rate_limiter"]
+    assert stats["pools"]["interactive"]["queued"] == 0
+    messages = [r.getMessage() for r in caplog.records]
+    assert any(m.startswith("server_performance_stats {") for m in messages)
+
+
+def test_search_returns_ranked_results():
+    tools = MerakiApiTools(
+        FakeMCP(), FakeMerakiClient(), enabled=True, settings=make_settings()
+    )
+    search = tools.search_meraki_api_endpoints("get device", limit=1)
+    data = json.loads(asyncio.run(search))
+    assert data["direct_match"]["method"] == "getDevice"
+    ranked = [(r["section"], r["method"]) for r in data["results"]]
+    assert ranked == [("devices", "getDevice")]
+    assert data["matches"] == {}
+
+
+def test_direct_match_is_the_top_ranked_result():
+    tools = MerakiApiTools(
+        FakeMCP(), FakeMerakiClient(), enabled=True, settings=make_settings()
+    )
+    for query in ("get device", "device", "get network clients"):
+        data = json.loads(asyncio.run(tools.search_meraki_api_endpoints(query)))
+        if data["direct_match"] is not None:
+            top = data["results"][0]
+            assert data["direct_match"]["method"] == top["method"], query
+            assert 0 < data["direct_match"]["confidence"] <= 1
+
+
+def test_required_params_resolved_only_for_returned_matches(monkeypatch):
+    client = FakeMerakiClient()
+    catalog = client.get_catalog()
+    lookups = []
+    real_required_params = catalog.required_params
+
+    def counting_required_params(section, method):
+        lookups.append((section, method))
+        return real_required_params(section, method)
+
+    monkeypatch.setattr(catalog, "required_params", counting_required_params)
+    tools = MerakiApiTools(FakeMCP(), client, enabled=True, settings=make_settings())
+
+    for _ in range(2):
+        search = tools.search_meraki_api_endpoints("get device", limit=1)
+        data = json.loads(asyncio.run(search))
+        assert data["direct_match"]["required_params"] == ["serial"]
+        assert data["results"][0]["required_params"] == ["serial"]
+    assert lookups == [("devices", "getDevice")]
+
+
+def test_index_builds_once_off_the_loop_with_fallback_for_early_searches():
+    s = make_settings()
+    s.SEARCH_INDEX_WAIT_SECONDS = 0.05
+    tools = MerakiApiTools(FakeMCP(), FakeMerakiClient(), enabled=True, settings=s)
+    tools._discover_api_structure()
+    release = threading.Event()
+    builds = []
+    generate = tools._generate_dynamic_patterns
+
+    def slow_generate():
+        builds.append(threading.current_thread().name)
+        release.wait(5)
+        return generate()
+
+    tools._generate_dynamic_patterns = slow_generate
+
+    async def run():
+        tools.start_index_build()
+        early = await asyncio.gather(
+            *(tools.search_meraki_api_endpoints("get device") for _ in range(3))
+        )
+        release.set()
+        await tools.start_index_build()
+        ready = await tools.search_meraki_api_endpoints("get device")
+        return [json.loads(r) for r in early], json.loads(ready)
+
+    early, ready = asyncio.run(run())
+    assert all(r["index_status"] == "building" for r in early)
+    assert all("devices" in r["matches"] for r in early)
+    assert ready["direct_match"]["method"] == "getDevice"
+    assert len(builds) == 1 and builds[0] != threading.main_thread().name
+
+
+def test_index_is_rebuilt_after_failed_discovery(monkeypatch):
+    client = FakeMerakiClient()
+    tools = MerakiApiTools(FakeMCP(), client, enabled=True, settings=make_settings())
+    get_catalog = client.get_catalog
+
+    def unavailable():
+        raise LookupError("No Meraki API key available for this request")
+
+    monkeypatch.setattr(client, "get_catalog", unavailable)
+    assert len(tools._ensure_patterns_initialized()) == 0
+    assert not tools._patterns_initialized
+
+    monkeypatch.setattr(client, "get_catalog", get_catalog)
+    data = json.loads(asyncio.run(tools.search_meraki_api_endpoints("get device")))
+    assert data["direct_match"]["method"] == "getDevice"
+    assert tools._patterns_initialized
+
+
+def test_search_after_empty_build_rebuilds_in_the_background():
+    tools = MerakiApiTools(
+        FakeMCP(), FakeMerakiClient(), enabled=True, settings=make_settings()
+    )
+    builds = []
+    generate = tools._generate_dynamic_patterns
+
+    def generate_once_empty():
+        builds.append(threading.current_thread().name)
+        return generate() if len(builds) > 1 else []
+
+    tools._generate_dynamic_patterns = generate_once_empty
+
+    async def run():
+        first = await tools.search_meraki_api_endpoints("get device")
+        await tools.start_index_build()
+        second = await tools.search_meraki_api_endpoints("get device")
+        return json.loads(first), json.loads(second)
+
+    first, second = asyncio.run(run())
+    assert first["index_status"] == "building"
+    assert second["direct_match"]["method"] == "getDevice"
+    assert len(builds) == 2
+    assert threading.main_thread().name not in builds
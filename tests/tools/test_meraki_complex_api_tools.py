@@ -0,0 +1,86 @@
+import asyncio
+import json
+
+from meraki_mcp.services.meraki_client import MerakiClient
+from meraki_mcp.settings import ApiSettings
+from meraki_mcp.tools.meraki_complex_api_tools import MerakiComplexApiTools
+
+
+class InventoryOrganizationsAPI:
+    async def getOrganization(self, organizationId):  # noqa: N802
+        return {"id": organizationId, "name": "Acme"}
+
+    async def getOrganizationDevices(self, **_kwargs):  # noqa: N802
+        return [{"serial": "Q2AA", "model": "MR46", "networkId": "N_1"}]
+
+    async def getOrganizationLicenses(self, **_kwargs):  # noqa: N802
+        return []
+
+    async def getOrganizationNetworks(self, **_kwargs):  # noqa: N802
+        return [{"id": f"N_{i}"} for i in range(15)]
+
+
+class InventoryNetworksAPI:
+    def __init__(self, slow_network):
+        self.slow_network = slow_network
+
+    async def getNetworkClients(self, networkId, **_kwargs):  # noqa: N802
+        if networkId == self.slow_network:
+            await asyncio.sleep(5)
+        return [{"mac": f"aa:{networkId}"}]
+
+
+class InventoryDashboard:
+    def __init__(self, slow_network):
+        self.organizations = InventoryOrganizationsAPI()
+        self.networks = InventoryNetworksAPI(slow_network)
+
+
+class InventoryClient(MerakiClient):
+    def __init__(self, deadline, slow_network=None):
+        settings = ApiSettings()
+        settings.USE_ASYNC_CLIENT = True
+        settings.RATE_LIMIT_PER_ORG = 0
+        settings.COMPLEX_TOOL_DEADLINE_SECONDS = deadline
+        super().__init__(api_key="test", settings=settings)
+        self.dashboard = InventoryDashboard(slow_network)
+
+    def get_async_dashboard(self):
+        return self.dashboard
+
+
+class FakeMCP:
+    def __init__(self):
+        self.tools = {}
+
+    def tool(self):
+        def decorator(fn):
+            self.tools[fn.__name__] = fn
+            return fn
+
+        return decorator
+
+
+def _inventory(deadline, slow_network=None):
+    client = InventoryClient(deadline, slow_network)
+    mcp = FakeMCP()
+    MerakiComplexApiTools(mcp, client, enabled=True)
+    tool = mcp.tools["generate_network_inventory_report"]
+    report = asyncio.run(tool(organization_id="O_1", include_clients=True))
+    client.close()
+    return json.loads(report)
+
+
+def test_inventory_covers_every_network_within_deadline():
+    report = _inventory(deadline=5)
+    assert report["summary"]["client_devices"]["unique_devices"] == 15
+    assert "partial" not in report
+
+
+def test_deadline_returns_partial_report_with_skipped_calls():
+    report = _inventory(deadline=0.2, slow_network="N_14")
+    assert report["partial"] is True
+    assert report["skipped"] == [
+        "networks.getNetworkClients(networkId=N_14, perPage=100)"
+    ]
+    assert report["summary"]["client_devices"]["unique_devices"] == 14